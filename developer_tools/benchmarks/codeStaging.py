@@ -0,0 +1,119 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the staging of the input files of a Code model.
+  It measures the time spent by Code.createNewInput to create the run
+  directories of a GenericCode model with a small perturbed input and a
+  large read-only file (e.g. a mesh), for each of the <staging> options
+  ("copy", "hardlink" and "symlink"), and the disk space used by the runs.
+
+  Usage:
+    python codeStaging.py [--samples 200] [--sizeMB 50]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import xml.etree.ElementTree as ET
+
+ravenDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(ravenDir)
+
+from ravenframework import MessageHandler
+from ravenframework import Files
+from ravenframework.Models.Code import Code
+
+def makeInputs(directory, sizeMB):
+  """
+    Creates the original input files
+    @ In, directory, str, the directory hosting the inputs
+    @ In, sizeMB, int, size of the read-only file in MB
+    @ Out, inputs, list(Files.File), the input files
+  """
+  with open(os.path.join(directory, 'model.inp'), 'w') as inp:
+    inp.write('x = $RAVEN-x$\n')
+  with open(os.path.join(directory, 'mesh.e'), 'wb') as mesh:
+    mesh.write(os.urandom(sizeMB * 1024**2))
+  inputs = []
+  for filename in ('model.inp', 'mesh.e'):
+    inputFile = Files.factory.returnInstance('Input')
+    node = ET.Element('Input', {'name': filename, 'type': ''})
+    node.text = os.path.join(directory, filename)
+    inputFile._readMoreXML(node)
+    inputs.append(inputFile)
+  return inputs
+
+def diskUsage(directory):
+  """
+    Computes the disk space used by a directory, counting each hard-linked file once
+    @ In, directory, str, the directory
+    @ Out, size, float, used space in MB
+  """
+  seen = set()
+  size = 0
+  for root, _, filenames in os.walk(directory):
+    for filename in filenames:
+      stat = os.lstat(os.path.join(root, filename))
+      if stat.st_ino not in seen:
+        seen.add(stat.st_ino)
+        size += stat.st_blocks * 512
+  return size / 1024**2
+
+def runBenchmark(staging, inputs, nSamples, directory):
+  """
+    Stages nSamples runs, as done by a MultiRun
+    @ In, staging, str, the staging option of the Code model
+    @ In, inputs, list(Files.File), the original input files
+    @ In, nSamples, int, number of runs
+    @ In, directory, str, the RAVEN working directory
+    @ Out, results, tuple, (runs/sec, used space in MB)
+  """
+  xml = ET.Element('Code', {'name': 'staged', 'subType': 'GenericCode'})
+  ET.SubElement(xml, 'executable').text = ''
+  ET.SubElement(xml, 'staging').text = staging
+  ET.SubElement(xml, 'clargs', {'type': 'input', 'arg': '-i', 'extension': '.inp'})
+  model = Code()
+  model._readMoreXML(xml)
+  runInfo = {'WorkingDir': directory, 'stepName': staging}
+  # the step directory is created by the Step
+  os.mkdir(os.path.join(directory, staging))
+  model.applyRunInfo(runInfo)
+  model.initialize(runInfo, inputs)
+  start = time.time()
+  for s in range(nSamples):
+    model.createNewInput(model.oriInputFiles, 'MonteCarlo', prefix=str(s + 1), SampledVars={'x': float(s)},
+                         additionalEdits={})
+  rate = nSamples / (time.time() - start)
+  return rate, diskUsage(model.workingDir)
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Code model input staging benchmark')
+  parser.add_argument('--samples', type=int, default=200, help='number of runs')
+  parser.add_argument('--sizeMB', type=int, default=50, help='size of the read-only input file in MB')
+  args = parser.parse_args()
+  MessageHandler.getHandler().initialize({'verbosity': 'quiet'})
+  workDir = tempfile.mkdtemp()
+  try:
+    originals = os.path.join(workDir, 'inputs')
+    os.mkdir(originals)
+    inputFiles = makeInputs(originals, args.sizeMB)
+    print(f'samples: {args.samples}, read-only file: {args.sizeMB} MB')
+    print(f'  {"staging":10s} {"runs/sec":>10s} {"disk MB":>10s}')
+    for option in ('copy', 'hardlink', 'symlink'):
+      r, mb = runBenchmark(option, inputFiles, args.samples, workDir)
+      print(f'  {option:10s} {r:10.1f} {mb:10.1f}')
+  finally:
+    shutil.rmtree(workDir)
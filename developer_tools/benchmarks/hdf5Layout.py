@@ -0,0 +1,108 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the HDF5 database layouts.
+  It compares the write throughput (realizations/sec, one realization at a time
+  as in a MultiRun and in batches as in an IOStep), the read throughput
+  (loading all the realizations back) and the file size of the "group" layout
+  (a group per realization) and of the "columnar" layout (a chunked and
+  compressed dataset per variable).
+
+  Usage:
+    python hdf5Layout.py [--samples 10000] [--scalars 10] [--historyLength 0] [--batch 1000]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import numpy as np
+
+ravenDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(ravenDir)
+
+from ravenframework import MessageHandler
+from ravenframework.h5py_interface_creator import createDatabase
+
+def makeRealizations(nSamples, nScalars, historyLength, seed=42):
+  """
+    Creates Monte Carlo like realizations
+    @ In, nSamples, int, number of realizations
+    @ In, nScalars, int, number of scalar variables
+    @ In, historyLength, int, length of the history variable (0 for none)
+    @ In, seed, int, optional, random seed
+    @ Out, rlzs, list(dict), the realizations
+  """
+  rng = np.random.default_rng(seed)
+  rlzs = []
+  for s in range(nSamples):
+    rlz = dict((f'var{v}', np.atleast_1d(rng.random())) for v in range(nScalars))
+    rlz['prefix'] = np.array([str(s + 1)])
+    rlz['ProbabilityWeight'] = np.array([1.0])
+    if historyLength:
+      rlz['time'] = np.linspace(0.0, 1.0, historyLength)
+      rlz['hist'] = rng.random(historyLength)
+    rlzs.append(rlz)
+  return rlzs
+
+def runBenchmark(layout, rlzs, batch, directory):
+  """
+    Writes and reads the realizations with the given layout
+    @ In, layout, str, the database layout
+    @ In, rlzs, list(dict), the realizations
+    @ In, batch, int, number of realizations added at once (1 for one at a time)
+    @ In, directory, str, the directory hosting the database
+    @ Out, results, tuple, (write rlz/sec, read rlz/sec, file size in MB)
+  """
+  filename = f'{layout}_{batch}.h5'
+  database = createDatabase('benchmark', directory, filename, False, layout=layout, compression='gzip')
+  database.addGroupInit('benchmark')
+  start = time.time()
+  if batch == 1:
+    for rlz in rlzs:
+      database.addGroup(rlz)
+  else:
+    for first in range(0, len(rlzs), batch):
+      database.addGroups(rlzs[first:first + batch])
+  write = len(rlzs) / (time.time() - start)
+  database.closeDatabaseW()
+  database = createDatabase('benchmark', directory, filename, True)
+  start = time.time()
+  names = sorted(database.retrieveAllHistoryNames())
+  loaded = database.retrieveRealizations(names)
+  read = len(loaded) / (time.time() - start)
+  database.closeDatabaseW()
+  size = os.path.getsize(os.path.join(directory, filename)) / 1024**2
+  return write, read, size
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='HDF5 database layouts benchmark')
+  parser.add_argument('--samples', type=int, default=10000, help='number of realizations')
+  parser.add_argument('--scalars', type=int, default=10, help='number of scalar variables')
+  parser.add_argument('--historyLength', type=int, default=0, help='length of the history variables (0 for none)')
+  parser.add_argument('--batch', type=int, default=1000, help='number of realizations added at once in batch mode')
+  args = parser.parse_args()
+  MessageHandler.getHandler().initialize({'verbosity': 'quiet'})
+  realizations = makeRealizations(args.samples, args.scalars, args.historyLength)
+  workDir = tempfile.mkdtemp()
+  try:
+    print(f'samples: {args.samples}, scalars: {args.scalars}, historyLength: {args.historyLength}')
+    print(f'  {"layout":10s} {"batch":>6s} {"write rlz/sec":>14s} {"read rlz/sec":>14s} {"size MB":>9s}')
+    for batchSize in (1, args.batch):
+      for lay in ('group', 'columnar'):
+        w, r, mb = runBenchmark(lay, realizations, batchSize, workDir)
+        print(f'  {lay:10s} {batchSize:6d} {w:14.1f} {r:14.1f} {mb:9.2f}')
+  finally:
+    shutil.rmtree(workDir)
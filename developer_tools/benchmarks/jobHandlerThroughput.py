@@ -0,0 +1,103 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the JobHandler throughput (jobs/sec) for zero-cost internal jobs.
+  It compares the legacy sleep-polling scheduling (JobHandler loop sleeping
+  "sleepTime" between passes and the Step sleeping its own "sleepTime" between
+  collections) against the event-driven scheduling (JobHandler.startLoop and
+  JobHandler.waitForJobEvents).
+
+  Usage:
+    python jobHandlerThroughput.py [--jobs 20000] [--batchSize 8]
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+
+ravenDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+sys.path.append(ravenDir)
+
+from ravenframework import MessageHandler
+from ravenframework.JobHandler import JobHandler
+from ravenframework.Decorators.Parallelization import Parallel
+
+@Parallel()
+def zeroCostModel(value):
+  """
+    Model evaluation that costs nothing
+    @ In, value, int, the sampled value
+    @ Out, value, int, the same value
+  """
+  return value
+
+def legacyLoop(handler, sleepTime):
+  """
+    The scheduling loop of the JobHandler before the event-driven implementation
+    @ In, handler, JobHandler, the job handler
+    @ In, sleepTime, float, sleep time between passes
+    @ Out, None
+  """
+  while not handler.completed:
+    handler.fillJobQueue()
+    handler.cleanJobQueue()
+    time.sleep(sleepTime)
+
+def runBenchmark(nJobs, batchSize, eventDriven, stepSleepTime=0.005):
+  """
+    Submits and collects nJobs jobs, mimicking what Steps.MultiRun does
+    @ In, nJobs, int, number of jobs to run
+    @ In, batchSize, int, number of parallel slots
+    @ In, eventDriven, bool, True to use the event-driven scheduling, False for sleep-polling
+    @ In, stepSleepTime, float, optional, the Step sleepTime
+    @ Out, jobsPerSecond, float, the measured throughput
+  """
+  handler = JobHandler()
+  handler.applyRunInfo({'batchSize': batchSize, 'maxQueueSize': None, 'parallelMethod': None,
+                        'internalParallel': False, 'Nodes': [], 'WorkingDir': os.getcwd()})
+  handler.initialize()
+  target = handler.startLoop if eventDriven else lambda: legacyLoop(handler, handler.sleepTime)
+  loop = threading.Thread(target=target)
+  loop.daemon = True
+  loop.start()
+
+  submitted = 0
+  collected = 0
+  start = time.time()
+  while collected < nJobs:
+    collected += len(handler.getFinished())
+    for _ in range(min(handler.availability(), nJobs - submitted)):
+      handler.addJob((submitted,), zeroCostModel, f'job_{submitted}')
+      submitted += 1
+    if eventDriven:
+      handler.waitForJobEvents(stepSleepTime)
+    else:
+      time.sleep(stepSleepTime)
+  elapsed = time.time() - start
+  handler.shutdown()
+  loop.join()
+  return nJobs / elapsed
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='JobHandler throughput benchmark')
+  parser.add_argument('--jobs', type=int, default=20000, help='number of zero-cost jobs to run')
+  parser.add_argument('--batchSize', type=int, default=8, help='number of parallel slots')
+  args = parser.parse_args()
+  MessageHandler.getHandler().initialize({'verbosity': 'quiet'})
+  before = runBenchmark(args.jobs, args.batchSize, eventDriven=False)
+  after = runBenchmark(args.jobs, args.batchSize, eventDriven=True)
+  print(f'jobs: {args.jobs}, batchSize: {args.batchSize}')
+  print(f'  sleep-polling : {before:12.1f} jobs/sec')
+  print(f'  event-driven  : {after:12.1f} jobs/sec ({after/before:.1f}x)')
@@ -232,6 +232,17 @@ class CodeInterfaceBase(BaseInterface):
     """
     self.addInputExtension(['i','inp','in'])
 
+  def getReadOnlyInputFiles(self, oriInputFiles):
+    """
+      This method returns the input files that are never modified by createNewInput (nor by the code
+      while running), e.g. meshes, cross-section libraries or restart files.
+      The Code model can link these files into the run directories instead of copying them (see the
+      <staging> node). By default no file is declared read-only, so all the files are copied.
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, readOnly, list, list of the input files (among oriInputFiles) that are never modified
+    """
+    return []
+
   def initialize(self, runInfo, oriInputFiles):
     """
       Method to initialize the run of a new step
@@ -250,7 +261,8 @@ class CodeInterfaceBase(BaseInterface):
       @ In, output, string, the Output name root
       @ In, workingDir, string, current working dir
       @ Out, output, string or dict, optional, if present and string:
-                                                 in case the root of the output file gets changed in this method (and a CSV is produced);
+                                                 in case the root of the output file gets changed in this method (and a CSV is produced),
+                                                 or the name of a binary output file (".npz" or ".parquet") to load instead of a CSV;
                                                if present and dict:
                                                  in case the output of the code is directly stored in a dictionary and can be directly used
                                                  without the need that RAVEN reads an additional CSV
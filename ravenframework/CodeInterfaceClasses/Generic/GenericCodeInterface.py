@@ -155,6 +155,15 @@ class GenericCode(CodeInterfaceBase):
     print('Execution Command: '+str(returnCommand[0]))
     return returnCommand
 
+  def getReadOnlyInputFiles(self, oriInputFiles):
+    """
+      This method returns the input files that are never modified by createNewInput, namely the files
+      whose extension is not among the input extensions (these are not parsed for wild-cards).
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, readOnly, list, list of the input files (among oriInputFiles) that are never modified
+    """
+    return [inputFile for inputFile in oriInputFiles if inputFile.getExt() not in self.getInputExtension()]
+
   def createNewInput(self,currentInputFiles,origInputFiles,samplerType,**Kwargs):
     """
       This method is used to generate an input based on the information passed in.
@@ -70,6 +70,15 @@ class MAAP5(GenericCode):
     if (len(self.boolOutputVariables)==0) and (len(self.contOutputVariables)==0):
       raise IOError('At least one of two nodes <boolMaapOutputVariables> or <contMaapOutputVariables> has to be specified')
 
+  def getReadOnlyInputFiles(self, oriInputFiles):
+    """
+      This method returns the input files that are never modified by createNewInput.
+      For the dynamic event tree, the include and restart files are edited as well, so all the files are copied.
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, readOnly, list, list of the input files (among oriInputFiles) that are never modified
+    """
+    return []
+
   def createNewInput(self,currentInputFiles,oriInputFiles,samplerType,**Kwargs):
     """
       This method is used to generate an input based on the information passed in.
@@ -39,7 +39,7 @@ class CsvLoader(MessageUser):
     self.allOutParam = False              # all output parameters?
     self.allFieldNames = []               # "header" of the CSV file
 
-  def loadCsvFile(self, myFile, nullOK=None, utility='pandas'):
+  def loadCsvFile(self, myFile, nullOK=None, utility='pandas', usecols=None):
     """
       Function to load a csv file into realization format
       It also retrieves the headers
@@ -47,27 +47,33 @@ class CsvLoader(MessageUser):
       @ In, myFile, string, Input file name (absolute path)
       @ In, nullOK, bool, indicates if null values are acceptable
       @ In, utility, str, indicates which utility should be used to load the csv
+      @ In, usecols, iterable(str), optional, the columns to load (all if None); the
+        columns not present in the file are ignored
       @ Out, loadCsvFile, pandas.DataFrame or numpy.ndarray, the loaded data
     """
     if utility == 'pandas':
-      return self._loadCsvPandas(myFile, nullOK=nullOK)
+      return self._loadCsvPandas(myFile, nullOK=nullOK, usecols=usecols)
     elif utility == 'numpy':
-      return self._loadCsvNumpy(myFile, nullOK=nullOK)
+      return self._loadCsvNumpy(myFile, nullOK=nullOK, usecols=usecols)
     else:
       self.raiseAnError(RuntimeError, f'Unrecognized CSV loading utility: "{utility}"')
 
-  def _loadCsvPandas(self, myFile, nullOK=None):
+  def _loadCsvPandas(self, myFile, nullOK=None, usecols=None):
     """
       Function to load a csv file into realization format
       It also retrieves the headers
       The format of the csv must be comma-separated (pandas readable)
       @ In, myFile, string, Input file name (absolute path)
       @ In, nullOK, bool, indicates if null values are acceptable
+      @ In, usecols, iterable(str), optional, the columns to load (all if None)
       @ Out, df, pandas.DataFrame, the loaded data
     """
+    if usecols is not None:
+      # the columns not requested are skipped by the parser
+      usecols = set(usecols).__contains__
     # first try reading the file
     try:
-      df = pd.read_csv(myFile)
+      df = pd.read_csv(myFile, usecols=usecols)
     except pd.errors.EmptyDataError:
       # no data in file
       self.raiseAWarning(f'Tried to read data from "{myFile}", but the file is empty!')
@@ -81,21 +87,50 @@ class CsvLoader(MessageUser):
     self.allFieldNames = list(df.columns)
     return df
 
-  def _loadCsvNumpy(self, myFile, nullOK=None):
+  def _loadCsvNumpy(self, myFile, nullOK=None, usecols=None):
     """
       Function to load a csv file into realization format
       It also retrieves the headers
       The format of the csv must be comma-separated with all floats after header row
       @ In, myFile, string, Input file name (absolute path)
       @ In, nullOK, bool, indicates if null values are acceptable
+      @ In, usecols, iterable(str), optional, the columns to load (all if None)
       @ Out, data, np.ndarray, the loaded data
     """
     with open(myFile, 'rb') as f:
       head = f.readline().decode()
     self.allFieldNames = list(x.strip() for x in head.split(','))
-    data = np.loadtxt(myFile, dtype=float, delimiter=',', ndmin=2, skiprows=1)
+    columns = None
+    if usecols is not None:
+      usecols = set(usecols)
+      columns = [c for c, name in enumerate(self.allFieldNames) if name in usecols]
+      self.allFieldNames = [self.allFieldNames[c] for c in columns]
+    data = np.loadtxt(myFile, dtype=float, delimiter=',', ndmin=2, skiprows=1, usecols=columns)
     return data
 
+  def loadBinaryFile(self, myFile, usecols=None):
+    """
+      Function to load the output of a code stored in a binary file, either a numpy
+      archive (.npz, one array per variable) or a parquet file (.parquet, one column per variable)
+      @ In, myFile, string, Input file name (absolute path)
+      @ In, usecols, iterable(str), optional, the variables to load (all if None)
+      @ Out, rlz, dict, realization {variable: np.ndarray}
+    """
+    if myFile.endswith('.npz'):
+      with np.load(myFile, allow_pickle=False) as archive:
+        names = archive.files if usecols is None else [name for name in archive.files if name in set(usecols)]
+        rlz = dict((name, archive[name]) for name in names)
+    elif myFile.endswith('.parquet'):
+      # requires pyarrow or fastparquet (pandas raises an informative error otherwise)
+      df = pd.read_parquet(myFile)
+      names = df.columns if usecols is None else [name for name in df.columns if name in set(usecols)]
+      rlz = dict((name, df[name].to_numpy()) for name in names)
+    else:
+      self.raiseAnError(IOError, f'Unrecognized binary output file format: "{myFile}"! Expected ".npz" or ".parquet".')
+    self.raiseADebug(f'Reading data from "{myFile}"')
+    self.allFieldNames = list(rlz.keys())
+    return rlz
+
   def toRealization(self, data):
     """
       Converts data from the "loadCsvFile" format to a realization-style format (dictionary
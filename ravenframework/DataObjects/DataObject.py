@@ -17,6 +17,8 @@
 import abc
 import copy
 
+import numpy as np
+
 from ..BaseClasses import BaseEntity
 from ..utils import utils, InputData, InputTypes
 
@@ -94,6 +96,7 @@ class DataObject(utils.metaclass_insert(abc.ABCMeta, BaseEntity)):
     self._data            = None   # underlying data structure
     self._collector       = None   # object used to collect samples
     self._inputKDTree     = None   # for finding outputs given inputs (pointset only?)
+    self._valueIndexes    = {}     # indexes of the scalar values, to find realizations by value {var:ValueIndex}
     self._scaleFactors    = None   # scaling factors inputs as {var:(mean,scale)}
     self.hierarchical     = False  # this flag controls the printing/plotting of the dataobject
                                    # in case it is an hierarchical one.
@@ -261,6 +264,7 @@ class DataObject(utils.metaclass_insert(abc.ABCMeta, BaseEntity)):
     self._meta = {}
     self._collector = None
     self._scaleFactors = {}
+    self._valueIndexes = {}
 
   ######################
   # DATA CONTAINER API #
@@ -319,6 +323,17 @@ class DataObject(utils.metaclass_insert(abc.ABCMeta, BaseEntity)):
     """
     pass
 
+  def addRealizations(self, batch):
+    """
+      Adds many "rows" (or "samples") to this data object at once.
+      By default, the realizations are added one at a time through addRealization.
+      @ In, batch, list(dict) or dict, either a list of realizations (see addRealization) or
+        {var:vals} where "vals" is a np.ndarray with one entry per realization along the first axis
+      @ Out, None
+    """
+    for rlz in self._batchToRealizations(batch):
+      self.addRealization(rlz)
+
   @abc.abstractmethod
   def addVariable(self, varName, values, classify='meta'):
     """
@@ -458,3 +473,27 @@ class DataObject(utils.metaclass_insert(abc.ABCMeta, BaseEntity)):
       @ Out, None
     """
     pass
+
+  ######################
+  #   INTERNAL USE     #
+  ######################
+  @staticmethod
+  def _batchToRealizations(batch):
+    """
+      Splits a batch of realizations (see addRealizations) into single realizations.
+      @ In, batch, list(dict) or dict, either a list of realizations or {var:vals} with one entry per
+        realization along the first axis of "vals" (the "_indexMap", if any, is shared by all the realizations)
+      @ Out, realizations, list(dict), realizations as {var:np.ndarray}
+    """
+    if not isinstance(batch, dict):
+      return list(batch)
+    indexMap = batch.get('_indexMap', None)
+    variables = list(var for var in batch if var != '_indexMap')
+    size = len(batch[variables[0]]) if variables else 0
+    realizations = []
+    for r in range(size):
+      rlz = dict((var, np.atleast_1d(batch[var][r])) for var in variables)
+      if indexMap is not None:
+        rlz['_indexMap'] = indexMap
+      realizations.append(rlz)
+    return realizations
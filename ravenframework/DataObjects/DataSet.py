@@ -33,7 +33,7 @@ except ValueError:
   from DataObject import DataObject
 
 from .. import CsvLoader
-from ..utils import utils, cached_ndarray, xmlUtils, mathUtils, InputData, InputTypes
+from ..utils import utils, cached_ndarray, xmlUtils, mathUtils, InputData, InputTypes, valueIndex
 
 class DataSet(DataObject):
   """
@@ -59,7 +59,6 @@ class DataSet(DataObject):
     self.type             = 'DataSet'
     self.types            = None             # list of type objects, for each realization entry
     self.printTag         = self.name
-    self.defaultDtype     = object
     self._scaleFactors    = {}               # mean, sigma for data for matching purposes
     self._alignedIndexes  = {}               # dict {index:values} of indexes with aligned coordinates (so they are not in the collector, but here instead)
     self._neededForReload = [self.sampleTag] # metavariables required to reload this data object.
@@ -225,7 +224,8 @@ class DataSet(DataObject):
     #  Yours truly, talbpw, May 2019
     #########
     # protect against back-changing realization
-    rlz = copy.deepcopy(rlz)
+    # NOTE only the dictionary is copied here; the values are copied when stored in the collector
+    rlz = dict(rlz)
     # if index map was included, remove that now before checking variables
     indexMap = rlz.pop('_indexMap', None)
     if indexMap is not None:
@@ -256,32 +256,48 @@ class DataSet(DataObject):
 
     # check alignment of indexes
     self._checkAlignedIndexes(rlz)
-    #  NB If no scalar entry is made, this construction fails.  In that case,
-    #  instead of treating each dataarrray as an object, numpy.asarray calls their asarray methods,
-    #  unfolding them and making a full numpy array with more dimensions, instead of effectively
-    #  a list of realizations, where each realization is effectively a list of xr.DataArray objects.
-    #
-    #  To mitigate this behavior, we forcibly add a [0.0] entry to each realization, then exclude
-    #  it once the realizations are constructed.  This seems like an inefficient option; others
-    #  should be explored.  - talbpaul, 12/2017
-    #  newData is a numpy array of realizations,
-    #  each of which is a numpy array of some combination of scalar values and/or xr.DataArrays.
-    #  This is because the cNDarray collector expects a LIST of realization, not a single realization.
-    #  Maybe the "append" method should be renamed to "extend" or changed to append one at a time.
-    # set realizations as a list of realizations (which are ordered lists)
-    newData = np.array(list(rlz[var] for var in self._orderedVars)+[0.0], dtype=object)
-    newData = newData[:-1]
     # if data storage isn't set up, set it up
     if self._collector is None:
       self._collector = self._newCollector(width=len(self._orderedVars))
-    # append
-    self._collector.append(newData)
+    # append, the collector stores each variable in its own (typed, where possible) column
+    self._collector.append(list(rlz[var] for var in self._orderedVars))
 
     # if hierarchical, clear the parent as an ending
     self._clearParentEndingStatus(rlz)
     # reset scaling factors, kd tree
     self._resetScaling()
 
+  def addRealizations(self, batch):
+    """
+      Adds many "rows" (or "samples") to this data object at once.
+      Equivalent to calling addRealization for each realization of the batch, but whenever possible
+      the batch is checked, formatted and appended to the collector only once.
+      @ In, batch, list(dict) or dict, either a list of realizations (see addRealization) or
+        {var:vals} where "vals" is a np.ndarray with one entry per realization along the first axis
+      @ Out, None
+    """
+    columns = self._batchToColumns(batch)
+    # if the batch can not be collected at once (e.g. ND or ragged data, hierarchical data objects),
+    # fall back to collecting one realization at a time
+    if columns is None:
+      DataObject.addRealizations(self, batch)
+      return
+    # format the data; indexes are typed on the first collection, as in _formatRealization
+    if self._collector is None or len(self._collector) == 0:
+      for var in self._pivotParams:
+        columns[var] = np.asarray(columns[var], dtype=self._getCompatibleType(columns[var].item(0)))
+    # establish types if not done yet
+    self._setDataTypes(dict((var, vals[0]) for var, vals in columns.items()))
+    # check alignment of indexes; all the realizations in the batch share the same index values
+    self._checkAlignedIndexes(dict((var, columns[var][0].copy()) for var in self.indexes))
+    # if data storage isn't set up, set it up
+    if self._collector is None:
+      self._collector = self._newCollector(width=len(self._orderedVars), length=max(len(utils.first(columns.values())), 100))
+    # append the whole batch, variable by variable
+    self._collector.extend(list(columns[var] for var in self._orderedVars))
+    # reset scaling factors, kd tree
+    self._resetScaling()
+
   def addVariable(self, varName, values, classify='meta', indices=None):
     """
       Adds a variable/column to the data.  "values" needs to be as long as self.size.
@@ -305,6 +321,7 @@ class DataSet(DataObject):
       column = self._collapseNDtoDataArray(values, varName, labels=labels)
       # add to the dataset
       self._data = self._data.assign(**{varName:column})
+      self._valueIndexes.pop(varName, None)
     if classify == 'input' and varName not in self._inputs:
       self._inputs.append(varName)
     elif classify == 'output' and varName not in self._outputs:
@@ -507,7 +524,7 @@ class DataSet(DataObject):
       val = self._data[var]
       # format as scalar
       if len(val.dims) == 0:
-        res = self._data[var].item(0)
+        res = self._data[var].values.item(0)
       # format as dataarray
       else:
         res = self._data[var]
@@ -548,6 +565,15 @@ class DataSet(DataObject):
     # after loading, set or reset scaling factors
     self._setScalingFactors()
 
+  def loadInMemory(self):
+    """
+      Loads in memory the data lazily read from disk (e.g. before the file backing it is modified).
+      @ In, None
+      @ Out, None
+    """
+    if self._isLazy():
+      self._data = self._data.load()
+
   # @profile
   def realization(self, index=None, matchDict=None, noMatchDict=None, tol=1e-15, unpackXArray=False, asDataSet=False, first=True):
     """
@@ -574,7 +600,6 @@ class DataSet(DataObject):
                                      if asDataSet: xarray.Dataset, all matching realizations as xarray.Dataset OR None if not found
                                      else        : list, list of matching realizations as [{var:value1}, {var:value2}, ...]
     """
-    # TODO convert input space to KD tree for faster searching -> XArray.DataArray has this built in?
     # first, check that some direction was given, either an index or a match to find
     if (index is None and (matchDict is None and noMatchDict is None)) or (index is not None and (matchDict is not None or noMatchDict is not None)):
       self.raiseAnError(TypeError,'Either "index" OR ("matchDict" and/or "noMatchDict") (not both) must be specified to use "realization!"')
@@ -691,6 +716,7 @@ class DataSet(DataObject):
 
     if self._scaleFactors is not None:
       self._scaleFactors.pop(variable,None)
+    self._valueIndexes.pop(variable, None)
     #either way reset kdtree
     self.inputKDTree = None
 
@@ -726,6 +752,7 @@ class DataSet(DataObject):
     # change scaling factor entry
     if old in self._scaleFactors:
       self._scaleFactors[new] = self._scaleFactors.pop(old)
+    self._valueIndexes.pop(old, None)
     if self._data is not None:
       self._data = self._data.rename({old:new})
 
@@ -741,6 +768,7 @@ class DataSet(DataObject):
     self._meta = {}
     self._alignedIndexes = {}
     self._scaleFactors = {}
+    self._valueIndexes = {}
 
   def setData(self, data, meta):
     """
@@ -752,6 +780,7 @@ class DataSet(DataObject):
     assert isinstance(data, xr.Dataset)
     self._collector = None
     self._data = data
+    self._valueIndexes = {}
     self._meta = meta
     # if we have meta information, we can reconstruct the IO space for this DO
     if 'DataSet' in meta:
@@ -906,6 +935,83 @@ class DataSet(DataObject):
 
     return rlz
 
+  def _batchToColumns(self, batch):
+    """
+      Collects a batch of realizations (see addRealizations) into one array for each variable, if
+      the batch can be added to the collector at once, namely if
+        - the realizations are neither hierarchical nor need autogenerated indexes,
+        - the index maps provided, if any, agree with the dimensions of the variables,
+        - each scalar variable has one entry per realization,
+        - the index-dependent variables depend on a single index, whose values are the same for all
+          the realizations, and the variables values are consistent with the index values,
+        - each variable has the same type in all the realizations.
+      @ In, batch, list(dict) or dict, the batch of realizations
+      @ Out, columns, dict, {var:np.ndarray} with the realizations along the first axis, or None if
+        the batch has to be added one realization at a time
+    """
+    if self._autogenerate or 'RAVEN_parentID' in self.getVars() or not len(batch):
+      return None
+    isDict = isinstance(batch, dict)
+    # check the format once per batch, on its first realization, as addRealization does for each one
+    try:
+      if isDict:
+        first = dict((var, np.atleast_1d(np.asarray(batch[var])[0])) for var in self.getVars() + self.indexes)
+      else:
+        first = dict((var, batch[0][var]) for var in self.getVars() + self.indexes)
+    except (KeyError, IndexError):
+      # the one-at-a-time collection provides the error message
+      return None
+    indexMap = batch.get('_indexMap', None) if isDict else batch[0].get('_indexMap', None)
+    if indexMap is not None:
+      indexMap = dict((key, val) for key, val in indexMap[0].items() if key in self.getVars())
+    if not self._checkRealizationFormat(first, indexMap=indexMap):
+      self.raiseAnError(SyntaxError, f'Realization was not formatted correctly for "{self.name}"! See warnings above.')
+    dims = self.getDimensions()
+    # the index maps provided, if any, have to agree with the dimensions of this data object
+    indexMaps = [batch.get('_indexMap', None)] if isDict else list(rlz.get('_indexMap', None) for rlz in batch)
+    for indexMap in indexMaps:
+      if indexMap is not None and any(list(idx) != dims[var] for var, idx in indexMap[0].items() if var in dims):
+        return None
+    columns = {}
+    for var in self.getVars() + self.indexes:
+      varDims = dims.get(var, [])
+      if len(varDims) > 1:
+        return None
+      try:
+        if isDict:
+          # copy, so that neither the collector nor the aligned indexes share memory with the caller
+          values = np.array(batch[var])
+        else:
+          entries = list(rlz[var] for rlz in batch)
+          if not all(isinstance(entry, np.ndarray) and entry.ndim == 1 for entry in entries):
+            return None
+          # strings of different lengths are fine, other types need to match
+          dtypes = set(entry.dtype.kind if entry.dtype.kind in 'SU' else entry.dtype for entry in entries)
+          if len(dtypes) > 1 or len(set(entry.shape for entry in entries)) > 1:
+            return None
+          values = np.stack(entries)
+      except KeyError:
+        # the one-at-a-time collection provides the error message
+        return None
+      # scalars have one entry per realization
+      if not varDims and var not in self._pivotParams:
+        if values.ndim == 2 and values.shape[1] == 1:
+          values = values[:, 0]
+        if values.ndim != 1 or (values.dtype == object and not all(mathUtils.isSingleValued(val) for val in values)):
+          return None
+      # indexes and histories are stored as (realization, index) matrices
+      elif values.ndim != 2 or values.dtype == object:
+        return None
+      columns[var] = values
+    for index in self.indexes:
+      indexValues = columns[index]
+      if not (indexValues == indexValues[0]).all():
+        return None
+      if any(columns[var].shape != indexValues.shape for var in self._pivotParams[index] if var in columns):
+        return None
+
+    return columns
+
   def _changeVariableValue(self, index, var, value):
     """
       Changes the value of a variable for a particular realization in the data object, in collector or data.
@@ -920,12 +1026,17 @@ class DataSet(DataObject):
     assert(mathUtils.isSingleValued(value)) #['float','str','int','unicode','bool'])
     lenColl = len(self._collector) if self._collector is not None else 0
     lenData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    # the values of this variable are not the indexed ones anymore
+    self._valueIndexes.pop(var, None)
     # if it's in the data ...
     if index < lenData:
+      if self._isLazy(var):
+        # lazily loaded from disk, bring the variable in memory to modify it
+        self._data[var] = self._data[var].compute()
       self._data[var].values[index] = value
     # if it's in the collector ...
     elif index < lenColl + lenData:
-      self._collector[index][self._orderedVars.index(var)] = value
+      self._collector[index - lenData, self._orderedVars.index(var)] = value
     else:
       self.raiseAnError(IndexError, f'Requested value change for realization "{index}", which is past the end of the data object!')
 
@@ -1349,6 +1460,8 @@ class DataSet(DataObject):
           continue
         # gather the data type from first realization: if np.array, it's ND; otherwise singular
         dtype = self.types[v]
+        # column of the collector, typed and without copies where possible
+        column = self._collector.getColumn(v)
         if isinstance(self._collector[0,v], np.ndarray):
           # for each index, determine if all aligned; make data arrays as required
           dims = self.getDimensions(var)[var]
@@ -1358,10 +1471,13 @@ class DataSet(DataObject):
           # SPECIAL CASE: if only histories/scalars, and histories are aligned, we can shortcut this
           if len(dims) == 1 and dims[0] in self._alignedIndexes:
             # since aligned, grab the data into one large chunk and make a datarray with all rlzs
-            data = np.vstack(self._collector[:,v]).astype(dtype)
+            # if the collector stored the histories as a single block, that's the chunk already
+            data = column if column.ndim > 1 else np.vstack(column)
+            data = data.astype(dtype, copy=False)
             coords = {dims[0]: self._alignedIndexes[dims[0]]}
             arrays[var] = self.constructNDSample(data, dims=[self.sampleTag]+dims, coords=coords)
           else:
+            samples = np.empty(len(self._collector), dtype=object)
             for r in range(len(self._collector)):
               values = self._collector[r, v]
               dtype = self._getCompatibleType(values[0])
@@ -1372,28 +1488,33 @@ class DataSet(DataObject):
                 if val is None:
                   val = self._collector[r, self._orderedVars.index(idx)]
                 coords[idx] = val
-              self._collector[r][v] = self.constructNDSample(values, dims, coords, name=str(r))
+              samples[r] = self.constructNDSample(values, dims, coords, name=str(r))
             # then collapse these entries into a single datarray
-            arrays[var] = self._collapseNDtoDataArray(self._collector[:,v], var, dtype=dtype)
+            arrays[var] = self._collapseNDtoDataArray(samples, var, dtype=dtype)
         # if it's a dataarray, then that's old-style histories, no-can do right now
         elif isinstance(self._collector[0,v], xr.DataArray):
           self.raiseAnError(NotImplementedError, 'History entries should be numpy arrays, not data arrays!')
         # if not ND, then it's a simple data array construction
         else:
           try:
-            varData = np.array(self._collector[:,v], dtype=dtype)
+            # no copy if the collector already stored the column with the final type
+            varData = np.asarray(column, dtype=dtype)
           except ValueError as e:
             # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
-            if dtype != float and pd.isnull(self._collector[:,v]).sum() != 0:
+            if dtype != float and pd.isnull(column).sum() != 0:
               self.raiseAWarning(f'NaN detected, but no safe casting NaN to "{dtype}" so switching to "object" type. ' \
                   + ' This may cause problems with other entities in RAVEN.')
-              varData = self._collector[:,v][:]
+              varData = column
               dtype = object
             # otherwise, let error be raised.
             else:
               raise e
           # create single dataarrays
-          arrays[var] = self._collapseNDtoDataArray(varData,var,dtype=dtype)
+          if varData.dtype == object:
+            arrays[var] = self._collapseNDtoDataArray(varData, var, dtype=dtype)
+          else:
+            # typed column, wrap it directly
+            arrays[var] = xr.DataArray(varData, dims=[self.sampleTag], coords={self.sampleTag:range(len(varData))}, name=var)
         # END if for variable data type (ndarray, xarray, or scalar)
         # re-index samples
         # was arrays[var][self.sampleTag] += firstSample
@@ -1413,6 +1534,45 @@ class DataSet(DataObject):
 
     return self._data
 
+  def _findCandidates(self, match, tol, relative):
+    """
+      Uses the value indexes to find the realizations that might match the requested values.
+      The candidates are a superset of the matches, to be checked with the matching rule of the caller.
+      @ In, match, dict, {var:value} to match
+      @ In, tol, float, tolerance to which match should be made
+      @ In, relative, bool, if True the tolerance is relative to the stored values (as in the collector),
+        otherwise it applies to the values scaled by the scaling factors (as in the data)
+      @ Out, candidates, np.ndarray or None, sorted indices of the candidates (data first, then collector),
+        None if the indexes can not narrow the search
+    """
+    candidates = None
+    for var, val in match.items():
+      index = self._getValueIndex(var)
+      if index is None:
+        continue
+      if mathUtils.isABoolean(val):
+        found = index.findNumeric(float(val), 0.0)
+      elif mathUtils.isAFloatOrInt(val):
+        if not np.isfinite(val) or (relative and tol >= 1):
+          continue
+        # half width of the window containing all the possible matches, with some slack for roundoff
+        if relative:
+          halfWidth = 2.0 * tol * abs(val) / (1.0 - tol)
+        else:
+          loc, scale = self._getScalingFactors(var)
+          halfWidth = 2.0 * tol * abs(scale) + 1e-8 * (abs(val) + abs(loc) + abs(scale))
+        found = index.findNumeric(float(val), halfWidth)
+      else:
+        try:
+          found = index.findExact(val)
+        except TypeError:
+          # unhashable, can not be looked up
+          continue
+      candidates = found if candidates is None else np.intersect1d(candidates, found, assume_unique=True)
+      if len(candidates) == 0:
+        break
+    return candidates
+
   def _formatRealization(self, rlz):
     """
       Formats realization without truncating data
@@ -1569,22 +1729,10 @@ class DataSet(DataObject):
                                   self.name.strip(),'":',",".join(missing))
     # set orderedVars to all vars, for now don't be fancy with alignedIndexes
     self._orderedVars = self.vars + self.indexes
-    # make a collector from scratch
+    # make a collector from scratch, filled column by column
     rows = len(utils.first(source.values()))
-    cols = len(self._orderedVars)
-    # can this for-loop be done in a comprehension?  The dtype seems to be a bit of an issue.
-    data = np.zeros([rows,cols], dtype=object)
-    for v,var in enumerate(self._orderedVars):
-      if len(source[var].shape) > 1:
-        # we can't set all at once, because the user gave us an ND array instead of a np.array(dtype=object) of np.array.
-        #    if we try -> ValueError: "could not broadcast input array from shape (#rlz,#time) into shape (#rlz)
-        for i in range(len(data)):
-          data[i,v] = source[var][i]
-      else:
-        # we can set it at once, the fast way.
-        data[:,v] = source[var]
-    # set up collector as cached nd array of values -> TODO might be some wasteful copying here
-    self._collector = cached_ndarray.cNDarray(values=data, dtype=object)
+    self._collector = self._newCollector(width=len(self._orderedVars), length=rows)
+    self._collector.extend(list(source[var] for var in self._orderedVars))
     # set datatypes for each variable
     rlz = self.realization(index=0)
     self._setDataTypes(rlz)
@@ -1628,6 +1776,7 @@ class DataSet(DataObject):
                 self.name.strip(),'":',",".join(requiredDims))
     self._orderedVars = self.vars
     self._data = datasetSub
+    self._valueIndexes = {}
     for key, val in self._data.attrs.items():
       self._meta[key] = val
 
@@ -1692,8 +1841,6 @@ class DataSet(DataObject):
 
     assert(self._collector is not None)
 
-    # TODO KD Tree for faster values -> still want in collector?
-    # TODO slow double loop
     matchVars, matchVals = zip(*toMatch.items()) if toMatch else ([], [])
     avoidVars, avoidVals = zip(*noMatch.items()) if noMatch else ([], [])
     try:
@@ -1704,9 +1851,17 @@ class DataSet(DataObject):
       self.raiseAnError(ValueError, f"Variable {str(e)} of DataObject '{self.name}'. "
                         f"Available variables are: {', '.join(self._orderedVars)}. "
                         "Check <Input>/<Output> sections." )
+    rows = range(len(self._collector))
     if not first:
       rr, rlz = [], []
-    for r, _ in enumerate(self._collector[:]): #TODO: CAN WE MAKE R START FROM LAST MATCHINDEXES ?
+    elif toMatch:
+      # only check the realizations the value indexes can not exclude
+      candidates = self._findCandidates(toMatch, tol, relative=True)
+      if candidates is not None:
+        numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+        rows = (candidates[candidates >= numInData] - numInData).tolist()
+    match = False
+    for r in rows:
       match = True
       # find matches first
       if toMatch:
@@ -1755,8 +1910,11 @@ class DataSet(DataObject):
       @ Out, rlz, dict, realization as {var:value} where value is a DataArray with only coordinate dimensions
     """
     assert(self._data is not None)
-    rlz = self._data[{self.sampleTag:index}].drop_vars(self.sampleTag).data_vars
-    rlz = self._convertFinalizedDataRealizationToDict(rlz, unpackXArray)
+    rlz = self._data[{self.sampleTag:index}].drop_vars(self.sampleTag)
+    if self._isLazy():
+      # read the single realization from file
+      rlz = rlz.compute()
+    rlz = self._convertFinalizedDataRealizationToDict(rlz.data_vars, unpackXArray)
     return rlz
 
   # @profile
@@ -1789,10 +1947,18 @@ class DataSet(DataObject):
       match = {}
     if noMatch is None:
       noMatch = {}
+    data = self._data
+    if match:
+      # only check the realizations the value indexes can not exclude
+      candidates = self._findCandidates(match, tol, relative=False)
+      if candidates is not None:
+        candidates = candidates[candidates < len(data[self.sampleTag])]
+        if first and len(candidates) == 0:
+          return len(self), None
+        data = data.isel({self.sampleTag: candidates})
     matchVars = list(match.keys())
     avoidVars = list(noMatch.keys())
     # TODO what if a variable is in both??
-    # TODO this could be slow, should do KD tree instead
     mask = 1.0
     for var in matchVars: #, val in match.items():
       val = match[var]
@@ -1802,9 +1968,9 @@ class DataSet(DataObject):
         loc, scale = self._getScalingFactors(var)
         scaleVal = (val-loc) / scale
         # create mask of where the dataarray matches the desired value
-        mask *= abs((self._data[var]-loc)/scale - scaleVal) < tol
+        mask *= abs((data[var]-loc)/scale - scaleVal) < tol
       else:
-        mask *= self._data[var] == val
+        mask *= data[var] == val
       # if all potential matches eliminated, stop looking
       if not np.any(mask):
         break
@@ -1818,18 +1984,26 @@ class DataSet(DataObject):
           # scale if we know how
           loc, scale = self._getScalingFactors(var)
           # create mask of where the dataarray matches the desired value
-          dataVal = (self._data[var] - loc) / scale
+          dataVal = (data[var] - loc) / scale
           for val in vals:
             scaleVal = (val-loc) / scale
             mask *= np.logical_not(abs(dataVal - scaleVal) < tol)
         else:
           for val in vals:
-            mask *= np.logical_not(self._data[var] == val)
+            mask *= np.logical_not(data[var] == val)
         # if all potential  matches eliminated, stop looking
         if sum(mask) == 0:
           break
 
-    rlz = self._data.where(mask, drop=True)
+    if first and data is not self._data and np.ndim(mask) == 1:
+      # searching among the candidates only, the first match can be picked directly
+      hits = np.flatnonzero(np.asarray(mask))
+      if len(hits) == 0:
+        return len(self), None
+      rr = data[self.sampleTag].values[hits[0]].item()
+      return rr, self._getRealizationFromDataByIndex(rr, unpackXArray)
+
+    rlz = data.where(mask, drop=True)
     try:
       rr = rlz[self.sampleTag].item(0) if first else rlz[self.sampleTag].data.tolist()
     except IndexError:
@@ -1873,6 +2047,9 @@ class DataSet(DataObject):
       @ Out, loc, float, translation scalar
       @ Out, scale, float, scaling scalar
     """
+    if var not in self._scaleFactors and self._isLazy(var):
+      # factors of lazily loaded variables are computed on demand
+      self._setScalingFactors(var)
     try:
       loc, scale = self._scaleFactors[var]
     except KeyError:
@@ -1882,6 +2059,37 @@ class DataSet(DataObject):
       scale = 1.0
     return loc, scale
 
+  def _getValueIndex(self, var):
+    """
+      Obtains the index of the values of a scalar variable over all the realizations (data first,
+      then collector), bringing it up to date with the realizations added since it was last used.
+      @ In, var, str, variable name
+      @ Out, index, valueIndex.ValueIndex or None, the index, or None if "var" can not be indexed
+    """
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    numInCollector = len(self._collector) if self._collector is not None else 0
+    index = self._valueIndexes.get(var, False)
+    if index is None:
+      return None
+    if index is False or index.size > numInData + numInCollector:
+      index = valueIndex.ValueIndex()
+    try:
+      if index.size < numInData:
+        values = self._data[var].values
+        if values.ndim != 1:
+          raise TypeError('Only scalar variables are indexed')
+        index.extend(values[index.size:])
+      if index.size < numInData + numInCollector:
+        values = self._collector.getColumn(self._orderedVars.index(var))
+        if values.ndim != 1:
+          raise TypeError('Only scalar variables are indexed')
+        index.extend(values[index.size - numInData:])
+    except (KeyError, ValueError, TypeError):
+      # not a stored scalar variable (or not hashable), the search can not be narrowed
+      index = None
+    self._valueIndexes[var] = index
+    return index
+
   def _getVariableIndex(self, var):
     """
       Obtains the index in the list of variables for the requested var.
@@ -1904,6 +2112,19 @@ class DataSet(DataObject):
       provided = list(s.strip() for s in f.readline().split(','))
     return provided
 
+  def _isLazy(self, var=None):
+    """
+      Checks if the data (or a variable) is lazily loaded, i.e. backed by chunked (dask) arrays
+      read from disk only when used.
+      @ In, var, str, optional, if given then only checks "var"
+      @ Out, isLazy, bool, True if lazily loaded
+    """
+    if self._data is None:
+      return False
+    if var is None:
+      return any(data.chunks is not None for data in self._data.data_vars.values())
+    return var in self._data.data_vars and self._data[var].chunks is not None
+
   def _loadCsvMeta(self, fileName):
     """
       Attempts to load metadata from an associated XML file.
@@ -1944,17 +2165,14 @@ class DataSet(DataObject):
 
     return dims
 
-  def _newCollector(self, width=1, length=100, dtype=None):
+  def _newCollector(self, width=1, length=100):
     """
       Creates a new collector object and returns it.
       @ In, width, int, optional, width of collector
       @ In, length, int, optional, initial length of (allocated) collector
-      @ In, dtype, type, optional, type of entires (float if all float, usually should be object)
+      @ Out, collector, cached_ndarray.cColumnarArray, the collector, storing each variable in its own column
     """
-    if dtype is None:
-      dtype = self.defaultDtype # set in subclasses if different
-
-    return cached_ndarray.cNDarray(width=width, length=length, dtype=dtype)
+    return cached_ndarray.cColumnarArray(width=width, length=length)
 
   def _readPandasCSV(self, fname, nullOK=None):
     """
@@ -2023,6 +2241,10 @@ class DataSet(DataObject):
     # TODO someday make KDTree too!
     assert(self._data is not None) # TODO check against collector entries?
     ds = self._data[varList] if var is not None else self._data
+    if var is None and self._isLazy():
+      # do not read all the lazily loaded variables now, their factors are computed on demand
+      varList = [name for name in varList if not self._isLazy(name)]
+      ds = self._data[[name for name in varList if name in self._data]]
     mean = ds.mean().variables
     scale = ds.std().variables
     for name in varList:
@@ -2349,9 +2571,9 @@ class DataSet(DataObject):
     # get from the collector first
     if self._collector is not None and len(self._collector) > 0:
       # first get rows from collector
-      fromColl = self._collector[np.where(self._collector[:, self._orderedVars.index('RAVEN_isEnding')])]
+      rows = np.where(self._collector[:, self._orderedVars.index('RAVEN_isEnding')])[0]
       # then turn them into realization-like
-      fromColl = list( dict(zip(self._orderedVars, c)) for c in fromColl )
+      fromColl = list( dict(zip(self._orderedVars, self._collector[r])) for r in rows )
     else:
       fromColl = []
     # then get from data
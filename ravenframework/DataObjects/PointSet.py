@@ -92,6 +92,17 @@ class PointSet(DataSet):
       self._selectOutput = ('outputRow',-1)
 
   ### INTERNAL USE FUNCTIONS ###
+  def _batchToColumns(self, batch):
+    """
+      Collects a batch of realizations into one array for each variable, if the batch can be added at once.
+      Index-dependent variables need to be collapsed one realization at a time (see _selectiveRealization).
+      @ In, batch, list(dict) or dict, the batch of realizations (see addRealizations)
+      @ Out, columns, dict, {var:np.ndarray} with the realizations along the first axis, or None
+    """
+    if self.indexes:
+      return None
+    return DataSet._batchToColumns(self, batch)
+
   def _convertFinalizedDataRealizationToDict(self,rlz, unpackXArray=False):
     """
       After collapsing into xr.Dataset, all entries are stored as xr.DataArrays.
@@ -24,11 +24,13 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 import copy
 import os
 import abc
+import weakref
 # External Modules End------------------------------------------------------------------------------
 
 # Internal Modules----------------------------------------------------------------------------------
 from ..BaseClasses import BaseEntity, InputDataUser
 from ..utils import InputData, InputTypes
+from ..utils import importerUtils as im
 # Internal Modules End------------------------------------------------------------------------------
 
 class DataBase(BaseEntity, InputDataUser):
@@ -50,6 +52,7 @@ class DataBase(BaseEntity, InputDataUser):
     inputSpecification.addParam("directory", InputTypes.StringType)
     inputSpecification.addParam("filename", InputTypes.StringType)
     inputSpecification.addParam("readMode", InputTypes.makeEnumType("readMode", "readModeType", ["overwrite", "read"]), True)
+    inputSpecification.addParam("lazy", InputTypes.BoolType)
     inputSpecification.addSub(InputData.parameterInputFactory("variables", contentType=InputTypes.StringListType))
 
     return inputSpecification
@@ -71,6 +74,8 @@ class DataBase(BaseEntity, InputDataUser):
     self.variables = None      # if not None, list of specific variables requested to be stored by user
     self._extension = '.db'    # filetype extension to use, if no filename given
     self.readMode = None
+    self.lazy = False          # if True, load into DataObjects lazily (data read from disk only when used)
+    self._lazyTargets = []     # weak references to the DataObjects lazily loaded from this database
 
   def applyRunInfo(self, runInfo):
     """
@@ -103,6 +108,10 @@ class DataBase(BaseEntity, InputDataUser):
     varNode = paramInput.findFirst("variables")
     if varNode is not None:
       self.variables =  varNode.value
+    # lazy loading
+    self.lazy = paramInput.parameterValues.get('lazy', False)
+    if self.lazy and not im.isLibAvail('dask'):
+      self.raiseAnError(ImportError, f'{self.type} "{self.name}": lazy loading requires the "dask" library!')
     # read mode
     self.readMode = paramInput.parameterValues['readMode']
     self.raiseADebug(f'{self.type} "{self.name}" Read Mode is "{self.readMode}".')
@@ -157,6 +166,26 @@ class DataBase(BaseEntity, InputDataUser):
 
     return path
 
+  def _registerLazyTarget(self, target):
+    """
+      Keeps track of a DataObject lazily loaded from this database (see _releaseLazyData)
+      @ In, target, DataObjects.DataObject, the DataObject backed by the database file
+      @ Out, None
+    """
+    self._lazyTargets.append(weakref.ref(target))
+
+  def _releaseLazyData(self):
+    """
+      Loads in memory the DataObjects lazily loaded from this database, before the file is modified
+      @ In, None
+      @ Out, None
+    """
+    for ref in self._lazyTargets:
+      target = ref()
+      if target is not None:
+        target.loadInMemory()
+    self._lazyTargets = []
+
   @abc.abstractmethod
   def saveDataToFile(self, source):
     """
@@ -185,6 +214,16 @@ class DataBase(BaseEntity, InputDataUser):
       @ Out, None
     """
 
+  def addRealizations(self, batch):
+    """
+      Adds many "rows" (or "samples") to this database at once.
+      By default, the realizations are added one at a time through addRealization.
+      @ In, batch, list(dict), the realizations to add (see addRealization)
+      @ Out, None
+    """
+    for rlz in batch:
+      self.addRealization(rlz)
+
   @abc.abstractmethod
   def allRealizations(self):
     """
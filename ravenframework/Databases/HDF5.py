@@ -25,8 +25,9 @@ import numpy as np
 # External Modules End------------------------------------------------------------------------------
 
 # Internal Modules----------------------------------------------------------------------------------
-from ..h5py_interface_creator import hdf5Database as h5Data
+from ..h5py_interface_creator import createDatabase
 from ..DataObjects import PointSet, HistorySet
+from ..utils import InputTypes
 from .Database import DataBase
 # Internal Modules End------------------------------------------------------------------------------
 
@@ -36,6 +37,25 @@ class HDF5(DataBase):
     Used to add and retrieve attributes and values from said database
   """
 
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super().getInputSpecification()
+    inputSpecification.addParam("layout", InputTypes.makeEnumType("layout", "layoutType", ["group", "columnar"]),
+        descr=r"""structure of a newly created file: a group per realization ("group") or a chunked dataset
+        per variable ("columnar"). The layout of an existing file is detected from the file.""")
+    inputSpecification.addParam("compression", InputTypes.makeEnumType("compression", "compressionType", ["gzip", "lzf", "none"]),
+        descr=r"""compression filter of the datasets of the "columnar" layout. It has no effect on the
+        "group" layout (the default), whose datasets are not compressed.""")
+
+    return inputSpecification
+
   def __init__(self):
     """
       Constructor
@@ -49,6 +69,8 @@ class HDF5(DataBase):
     self._allvars  = []
     self.printTag = 'DATABASE-HDF5'
     self._extension = '.h5'
+    self.layout = 'group'       # layout of new files, "group" (a group per realization) or "columnar" (a dataset per variable)
+    self.compression = 'gzip'   # compression filter of the columnar layout
 
   def __getstate__(self):
     """
@@ -59,6 +81,7 @@ class HDF5(DataBase):
       @ Out, state, dict, the namespace state
     """
     # capture what is normally pickled
+    self._releaseLazyData()
     state = self.__dict__.copy()
     # we pop the database instance and close it
     state.pop("database")
@@ -77,7 +100,7 @@ class HDF5(DataBase):
     """
     self.__dict__.update(newstate)
     self.exist = True
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist)
+    self.database = createDatabase(self.name, self.databaseDir, self.filename, self.exist, layout=self.layout, compression=self.compression)
 
   def _handleInput(self, paramInput):
     """
@@ -85,6 +108,9 @@ class HDF5(DataBase):
       @ In, paramInput, ParameterInput, the already parsed input.
       @ Out, None
     """
+    self.layout = paramInput.parameterValues.get('layout', self.layout)
+    compression = paramInput.parameterValues.get('compression', self.compression)
+    self.compression = None if compression == 'none' else compression
     super()._handleInput(paramInput)
 
   #####################
@@ -106,9 +132,11 @@ class HDF5(DataBase):
       @ Out, None
     """
     if self.database is not None:
+      self._releaseLazyData()
       self.database.closeDatabaseW()
     super().initializeDatabase()
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist, self.variables)
+    self.database = createDatabase(self.name, self.databaseDir, self.filename, self.exist, self.variables,
+                                   layout=self.layout, compression=self.compression)
 
   def saveDataToFile(self, source):
     """
@@ -119,10 +147,11 @@ class HDF5(DataBase):
     if not isinstance(source, (PointSet, HistorySet)):
       self.raiseAnError(TypeError, 'RAVEN HDF5 Databases cannot currently handle N-Dimensional Datasets; ' +
                         f'use NetCDF instead. Received Dataset for database "{source.name}"')
+    batch = []
     for r in range(len(source)):
       rlz = source.realization(r, unpackXArray=True)
-      rlz = dict((var, np.atleast_1d(val)) for var, val in rlz.items())
-      self.addRealization(rlz)
+      batch.append(dict((var, np.atleast_1d(val)) for var, val in rlz.items()))
+    self.addRealizations(batch)
 
   def loadIntoData(self, target):
     """
@@ -130,9 +159,36 @@ class HDF5(DataBase):
       @ In, target, DataObjects.DataObjet, object to write data into
       @ Out, None
     """
-    allRlz = self.allRealizations()
-    for rlz in allRlz:
-      target.addRealization(rlz)
+    if self.lazy:
+      dataset = self._lazyDataset(target)
+      if dataset is not None:
+        target.load(dataset, style='dataset')
+        self._registerLazyTarget(target)
+        return
+    target.addRealizations(self.allRealizations())
+
+  def _lazyDataset(self, target):
+    """
+      Builds the dataset to lazily load this database into the target data object
+      @ In, target, DataObjects.DataObjet, object to write data into
+      @ Out, dataset, xr.Dataset or None, the lazy dataset (None if it can not be lazily loaded)
+    """
+    if not hasattr(self.database, 'retrieveLazyDataset'):
+      self.raiseAWarning(f'Lazy loading requires the "columnar" layout: Database "{self.name}" is loaded in memory!')
+      return None
+    if not target.isEmpty or target.hierarchical:
+      self.raiseAWarning(f'Lazy loading is only available into empty, not hierarchical, DataObjects: Database "{self.name}" is loaded in memory!')
+      return None
+    allRealizationNames = self.database.retrieveAllHistoryNames()
+    # same order as allRealizations
+    allRealizationNames.sort()
+    dims = dict((var, target.getDimensions(var)[var]) for var in target.getVars())
+    dataset = self.database.retrieveLazyDataset(allRealizationNames, dims, target.sampleTag)
+    if dataset is None:
+      self.raiseAWarning(f'The structure of "{target.name}" requires to reformat the realizations ' +
+                         f'(e.g. selecting values from histories): Database "{self.name}" is loaded in memory!')
+
+    return dataset
 
   def addRealization(self, rlz):
     """
@@ -145,19 +201,56 @@ class HDF5(DataBase):
                          "val" is either a float or a np.ndarray of values.
       @ Out, None
     """
+    self._checkRealization(rlz, len(self.database))
+    self._releaseLazyData()
+    self.database.addGroup(rlz)
+    self.built = True
+
+  def addRealizations(self, batch):
+    """
+      Adds many "rows" (or "samples") to this database at once.
+      @ In, batch, list(dict), the realizations to add (see addRealization)
+      @ Out, None
+    """
+    if not len(batch):
+      return
+    for r, rlz in enumerate(batch):
+      self._checkRealization(rlz, len(self.database) + r)
+    self._releaseLazyData()
+    self.database.addGroups(batch)
+    self.built = True
+
+  def _releaseLazyData(self):
+    """
+      Loads in memory the DataObjects lazily loaded from this database and closes the file
+      handles reading them, before the file is modified
+      @ In, None
+      @ Out, None
+    """
+    if not self._lazyTargets:
+      return
+    super()._releaseLazyData()
+    if hasattr(self.database, 'closeLazyColumns'):
+      self.database.closeLazyColumns()
+
+  def _checkRealization(self, rlz, prefix):
+    """
+      Checks a realization can be stored in the database, adding its prefix if missing
+      @ In, rlz, dict, {var:val} realization (see addRealization)
+      @ In, prefix, int, prefix to use if the realization does not have one
+      @ Out, None
+    """
     # realization must be a dictionary
     assert isinstance(rlz, dict)
     # prefix must be present
     if 'prefix' not in rlz:
-      rlz['prefix'] = len(self.database)
+      rlz['prefix'] = prefix
     # check dimensionality
     if '_indexMap' in rlz:
       for var, dims in rlz['_indexMap'][0].items():
         if len(dims) > 1:
           self.raiseAnError(TypeError, 'RAVEN HDF5 Databases cannot currently handle N-Dimensional data; ' +
                             f'use NetCDF instead. Received ND data for variable "{var}": {dims}')
-    self.database.addGroup(rlz)
-    self.built = True
 
   #####################
   # utilities
@@ -226,7 +319,7 @@ class HDF5(DataBase):
     allRealizationNames = self.database.retrieveAllHistoryNames()
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
     allRealizationNames.sort()
-    allData = [self.realization(name) for name in allRealizationNames]
+    allData = self.database.retrieveRealizations(allRealizationNames)
 
     return allData
 
@@ -57,6 +57,8 @@ class NetCDF(DataBase):
     self.printTag = 'DATABASE-NetCDF'  # For printing verbosity labels
     self._format = 'netcdf4'  # writing format for disk
     self._extension = '.nc'
+    self._lazyChunkSize = 10000 # number of realizations in each chunk of lazily loaded data
+    self._lazyData = []         # datasets lazily loaded from the file (keeping it open)
 
   def saveDataToFile(self, source):
     """
@@ -65,8 +67,12 @@ class NetCDF(DataBase):
       @ Out, None
     """
     ds, meta = source.getData()
+    # the data might be lazily read from the file about to be written (e.g. loaded from this
+    # database and extended), bring it in memory first
+    ds = ds.compute()
     # we actually just tell the DataSet to write out as netCDF
     path = self.get_fullpath()
+    self._releaseLazyData()
     # TODO set up to use dask for on-disk operations
     # convert metadata into writeable
     for key, xml in meta.items():
@@ -105,11 +111,19 @@ class NetCDF(DataBase):
     # NOTE: DO NOT use open_dataset unless you wrap it in a "with xr.open_dataset(f) as ds"!
     # -> open_dataset does NOT close the file object after loading!
     # -> however, load_dataset fully loads the ds into memory and closes the file.
-    ds = xr.load_dataset(self.get_fullpath(), engine=self._format)
+    if self.lazy:
+      # dask arrays, read from file only when used; the file is kept open until the
+      # database is modified (see _releaseLazyData)
+      ds = xr.open_dataset(self.get_fullpath(), engine=self._format, chunks={'RAVEN_sample_ID': self._lazyChunkSize})
+      self._lazyData.append(ds)
+    else:
+      ds = xr.load_dataset(self.get_fullpath(), engine=self._format)
     # the meta data, convert from string to xml
     meta = dict((key, xmlUtils.staticFromString(val)) for key, val in ds.attrs.items())
     # set D.O. properties
     target.setData(ds, meta)
+    if self.lazy:
+      self._registerLazyTarget(target)
 
   def addRealization(self, rlz):
     """
@@ -125,6 +139,7 @@ class NetCDF(DataBase):
     # apparently we're storing samples!
     # -> do we already have data present?
     path = self.get_fullpath()
+    self._releaseLazyData()
     if os.path.isfile(path):
       # load data as 100 sample chunks, lazily (not into memory)
       # -> using the argument "chunks" triggers the lazy loading using dask
@@ -159,3 +174,15 @@ class NetCDF(DataBase):
     else:
       new = rlzDS
     new.to_netcdf(path) # TODO would appending instead of writing work for new samples? I doubt it.
+
+  def _releaseLazyData(self):
+    """
+      Loads in memory the DataObjects lazily loaded from this database and closes the file,
+      before modifying it
+      @ In, None
+      @ Out, None
+    """
+    super()._releaseLazyData()
+    for ds in self._lazyData:
+      ds.close()
+    self._lazyData = []
@@ -371,6 +371,15 @@ class Distribution(BaseEntity, InputDataUser):
     """
     return self.memory
 
+  def isVectorized(self):
+    """
+      Function to check if the ppf, pdf and cdf accept arrays of coordinates, returning
+      the same values as the coordinate-by-coordinate calls, and rvs draws one random number per sample
+      @ In, None
+      @ Out, isVectorized, bool, True if the distribution can be evaluated on arrays
+    """
+    return False
+
   def reset(self):
     """
       Function that reset the distribution
@@ -487,6 +496,18 @@ class BoostDistribution(Distribution):
     untrMode = self._distribution.untrMode()
     return untrMode
 
+  def isVectorized(self):
+    """
+      Function to check if the ppf, pdf and cdf accept arrays of coordinates, returning
+      the same values as the coordinate-by-coordinate calls, and rvs draws one random number per sample
+      @ In, None
+      @ Out, isVectorized, bool, True if the distribution can be evaluated on arrays
+    """
+    # the continuous distributions are evaluated through scipy, element-wise
+    cls = type(self)
+    return (isinstance(self._distribution, Distributions1D.ContinuousDistribution) and not self.memory
+            and all(getattr(cls, method) is getattr(BoostDistribution, method) for method in ['ppf', 'pdf', 'cdf', 'rvs']))
+
   def rvs(self, size=None):
     """
       Function to get random numbers
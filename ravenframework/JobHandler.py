@@ -25,6 +25,8 @@ import threading
 from random import randint
 import socket
 import re
+import multiprocessing
+import concurrent.futures
 
 from .utils import importerUtils as im
 from .utils import utils
@@ -64,7 +66,8 @@ class JobHandler(BaseType):
     self.__isDistributedInitialized = False # Is Ray or Dask Initialized?
     self._server = None         # Variable containing the info about the RAY or DASK parallel server.
                                   # If None, multi-threading is used
-    self.sleepTime = 1e-4         # Sleep time for collecting/inquiring/submitting new jobs
+    self.sleepTime = 1e-4         # Polling time for runners that cannot signal their completion (e.g. ray)
+    self.maxWaitTime = 0.1        # Upper bound for the time the polling thread blocks waiting for job events
     self.completed = False        # Is the execution completed? When True, the JobHandler is shut down
     self.__profileJobs = False    # Determines whether to collect and print job timing summaries at the end of job runs.
     self.maxQueueSize = None      # Prevents the pending queue from growing indefinitely, but also
@@ -98,6 +101,14 @@ class JobHandler(BaseType):
     ############################################################################
 
     self.__queueLock = threading.RLock()
+    # Set by the runners when they finish and whenever a job is queued, it wakes
+    # up the startLoop thread that fills the free slots and collects finished jobs
+    self.__loopEvent = threading.Event()
+    # Set by the startLoop thread whenever jobs are started or finished, so that
+    # the clients (Steps) can block until there is something to collect or to submit
+    self.__clientEvent = threading.Event()
+    # True if some running job cannot signal its completion and needs to be polled
+    self.__pollRunning = False
     # List of submitted job identifiers, includes jobs that have completed as
     # this list is not cleared until a new step is entered
     self.__submittedJobs = []
@@ -110,6 +121,12 @@ class JobHandler(BaseType):
     self.remoteServers = None
     self.daskSchedulerFile = None
     self._daskScheduler = None
+    # Function and leading arguments shipped once to the worker processes (processpool),
+    # they are kept until a new step is entered {key: (referencedObjects, SharedArguments)}
+    self.__sharedArguments = {}
+    self.__sharedGeneration = 0
+    # Owner of the processes of the external codes run without a thread per job
+    self.__supervisor = None
 
   def __getstate__(self):
     """
@@ -119,10 +136,14 @@ class JobHandler(BaseType):
     """
     state = copy.copy(self.__dict__)
     state.pop('_JobHandler__queueLock')
+    state.pop('_JobHandler__loopEvent')
+    state.pop('_JobHandler__clientEvent')
     #XXX we probably need to record how this was init, and store that
     # such as the scheduler file
-    if self._parallelLib == ParallelLibEnum.dask and '_server' in state:
+    if self._parallelLib in [ParallelLibEnum.dask, ParallelLibEnum.processpool] and '_server' in state:
       state.pop('_server')
+    state.pop('_JobHandler__sharedArguments', None)
+    state.pop('_JobHandler__supervisor', None)
     return state
 
   def __setstate__(self, d):
@@ -133,6 +154,10 @@ class JobHandler(BaseType):
     """
     self.__dict__.update(d)
     self.__queueLock = threading.RLock()
+    self.__loopEvent = threading.Event()
+    self.__clientEvent = threading.Event()
+    self.__sharedArguments = {}
+    self.__supervisor = None
 
   def applyRunInfo(self, runInfo):
     """
@@ -218,7 +243,13 @@ class JobHandler(BaseType):
       @ Out, None
     """
     self.raiseADebug("Initializing parallel InternalParallel: {0} Nodes: {1}".format(self.runInfoDict['internalParallel'],len(self.runInfoDict['Nodes'])))
-    if self._parallelLib != ParallelLibEnum.shared:
+    if self._parallelLib == ParallelLibEnum.processpool:
+      # persistent local worker processes; "spawn" since fork is unsafe with the running threads
+      nWorkers = max(int(self.runInfoDict['batchSize']), 1)
+      self._server = concurrent.futures.ProcessPoolExecutor(max_workers=nWorkers,
+                                                            mp_context=multiprocessing.get_context('spawn'))
+      self.raiseADebug("JobHandler initialized with a pool of", nWorkers, "worker processes")
+    elif self._parallelLib != ParallelLibEnum.shared:
       # dashboard?
       db = self.runInfoDict['includeDashboard']
       # Check if the list of unique nodes is present and, in case, initialize the
@@ -376,6 +407,8 @@ class JobHandler(BaseType):
       self._server.close()
       if self._daskScheduler is not None:
         self._daskScheduler.terminate()
+    elif self._parallelLib == ParallelLibEnum.processpool and self._server is not None:
+      self._server.shutdown(wait=False, cancel_futures=True)
 
   def __runHeadNode(self, nProcs, port=None):
     """
@@ -600,17 +633,34 @@ class JobHandler(BaseType):
 
   def startLoop(self):
     """
-    This function begins the polling loop for the JobHandler where it will
-    constantly fill up its running queue with jobs in its pending queue and
-    unload finished jobs into its finished queue to be extracted by
+    This function begins the scheduling loop for the JobHandler where it will
+    fill up its running queue with jobs in its pending queue and unload
+    finished jobs into its finished queue to be extracted by the Steps.
+    The loop blocks until a runner signals its completion or a new job is
+    queued; runners that cannot signal (e.g. ray) are polled every sleepTime.
+    @ In, None
+    @ Out, None
     """
     while not self.completed:
       self.fillJobQueue()
       self.cleanJobQueue()
-      # TODO May want to revisit this:
-      # http://stackoverflow.com/questions/29082268/python-time-sleep-vs-event-wait
-      # probably when we move to Python 3.
-      time.sleep(self.sleepTime)
+      timeout = self.sleepTime if self.__pollRunning else self.maxWaitTime
+      # NOTE clearing after the wait is safe: whatever triggered the event
+      # happened before the next fill/clean pass, which will take care of it
+      self.__loopEvent.wait(timeout)
+      self.__loopEvent.clear()
+
+  def waitForJobEvents(self, timeout=None):
+    """
+      Blocks the calling thread until a job is started or finished (i.e. there is
+      something to collect or room for new jobs) or until the timeout expires.
+      This is meant to replace sleep-polling in the loops collecting the jobs.
+      @ In, timeout, float, optional, maximum waiting time in seconds (None waits indefinitely)
+      @ Out, signalled, bool, True if an event occurred, False if the timeout expired
+    """
+    signalled = self.__clientEvent.wait(timeout)
+    self.__clientEvent.clear()
+    return signalled
 
   def addJob(self, args, functionToRun, identifier, metadata=None, forceUseThreads = False, uniqueHandler="any", clientQueue = False, groupInfo = None):
     """
@@ -640,6 +690,41 @@ class JobHandler(BaseType):
         clientQueue
       @ Out, None
     """
+    internalJob = self.__createRunner(args, functionToRun, identifier, metadata, forceUseThreads, uniqueHandler)
+    self.__queueRunner(internalJob, identifier, clientQueue, groupInfo)
+
+  def addBatchJob(self, args, functionToRun, members, forceUseThreads=False, uniqueHandler="any"):
+    """
+      Method to add an internal run evaluating several samples at once (e.g. a ROM evaluated
+      on a matrix of samples). Once finished, the run is split in a finished run for each sample,
+      so that the samples are collected as if they were run one at a time.
+      @ In, args, dict, this is a list of arguments that will be passed as
+        function parameters into whatever method is stored in functionToRun.
+        e.g., functionToRun(*args)
+      @ In, functionToRun, function or method, the function that needs to be
+        executed, returning the list of the realizations of the samples (None for the samples that failed)
+      @ In, members, list(tuple), the (identifier, metadata) of each sample of the batch
+      @ In, forceUseThreads, bool, optional, flag that, if True, is going to
+        force the usage of multi-threading even if parallel python is activated
+      @ In, uniqueHandler, string, optional, the special keyword attached to the runs (see addJob)
+      @ Out, None
+    """
+    identifier = members[0][0]
+    internalJob = self.__createRunner(args, functionToRun, identifier, None, forceUseThreads, uniqueHandler)
+    internalJob.batchMembers = members
+    self.__queueRunner(internalJob, identifier, False, None)
+
+  def __createRunner(self, args, functionToRun, identifier, metadata, forceUseThreads, uniqueHandler):
+    """
+      Creates the runner of an internal run (function execution), depending on the parallel library in use
+      @ In, args, dict, the arguments of functionToRun (see addJob)
+      @ In, functionToRun, function or method, the function that needs to be executed
+      @ In, identifier, string, the job identifier
+      @ In, metadata, dict, dictionary of metadata associated to this run
+      @ In, forceUseThreads, bool, if True, force the usage of multi-threading
+      @ In, uniqueHandler, string, the special keyword attached to this runner (see addJob)
+      @ Out, internalJob, Runner, the runner
+    """
     assert "original_function" in dir(functionToRun), "to parallelize a function, it must be" \
            " decorated with RAVEN Parallel decorator"
     if self._server is None or forceUseThreads:
@@ -669,6 +754,85 @@ class JobHandler(BaseType):
                                                      metadata=metadata,
                                                      uniqueHandler=uniqueHandler,
                                                      profile=self.__profileJobs)
+      elif self._parallelLib == ParallelLibEnum.processpool:
+        shared = self.__shareWithWorkers(functionToRun.original_function, args)
+        internalJob = Runners.factory.returnInstance('ProcessPoolRunner', (self._server, shared) + tuple(args),
+                                                     functionToRun.original_function,
+                                                     identifier=identifier,
+                                                     metadata=metadata,
+                                                     uniqueHandler=uniqueHandler,
+                                                     profile=self.__profileJobs)
+    return internalJob
+
+  def __splitBatch(self, run):
+    """
+      Splits a finished batch run (see addBatchJob) in a finished run for each of its samples
+      @ In, run, Runner, the finished batch run
+      @ Out, members, list(Runner), the finished runs of the samples
+    """
+    evaluations = run.getEvaluation()
+    if isinstance(evaluations, Runners.Error) or run.getReturnCode() != 0:
+      self.raiseAWarning(f'The batch of jobs starting with "{run.identifier}" failed!')
+      evaluations = [None] * len(run.batchMembers)
+    members = []
+    for (identifier, metadata), evaluation in zip(run.batchMembers, evaluations):
+      data = None if evaluation is None else {'inputs': {}, 'outputs': evaluation, 'metadata': {}}
+      member = Runners.factory.returnInstance('PassthroughRunner', data, None,
+                                              identifier=identifier,
+                                              metadata=metadata,
+                                              uniqueHandler=run.uniqueHandler,
+                                              profile=self.__profileJobs)
+      member.clientRunner = run.clientRunner
+      if evaluation is None:
+        member.returnCode = -1
+      members.append(member)
+    return members
+
+  def addProcessJob(self, args, functionToRun, prepare, finalize, identifier, metadata=None, uniqueHandler="any", groupInfo=None):
+    """
+      Method to add a run of an external process (e.g. a Code model run).
+      With multi-threading, the process is launched and waited for by the process
+      supervisor of this JobHandler, so that no thread is held while the process runs
+      (see Runners.ExternalProcessRunner). With the distributed parallel libraries, the
+      whole run is executed by the workers through functionToRun, as for addJob.
+      @ In, args, list, arguments of functionToRun and prepare, e.g. prepare(*args)
+      @ In, functionToRun, function or method, the function running the whole job (preparation,
+        process and finalization), decorated with the RAVEN Parallel decorator
+      @ In, prepare, function or method, function preparing the run and returning the process to
+        launch, as a dict {"command":command, "timeout":wall time, "popen":subprocess.Popen arguments}
+        along with any state needed by the finalization
+      @ In, finalize, function or method, function collecting the outcome of the run as
+        finalize(run, pid, returnCode, timedOut), with "timedOut" True if the process exceeded the wall time
+      @ In, identifier, string, the job identifier
+      @ In, metadata, dict, optional, dictionary of metadata associated to this run
+      @ In, uniqueHandler, string, optional, the special keyword attached to this runner (see addJob)
+      @ In, groupInfo, dict, optional, {id:string, size:int}, grouping of the run (see addJob)
+      @ Out, None
+    """
+    if self._server is not None:
+      self.addJob(args, functionToRun, identifier, metadata=metadata, uniqueHandler=uniqueHandler, groupInfo=groupInfo)
+      return
+    if self.__supervisor is None:
+      self.__supervisor = Runners.ProcessSupervisor()
+    internalJob = Runners.factory.returnInstance('ExternalProcessRunner', args,
+                                                 prepare,
+                                                 supervisor=self.__supervisor,
+                                                 finalize=finalize,
+                                                 identifier=identifier,
+                                                 metadata=metadata,
+                                                 uniqueHandler=uniqueHandler,
+                                                 profile=self.__profileJobs)
+    self.__queueRunner(internalJob, identifier, False, groupInfo)
+
+  def __queueRunner(self, internalJob, identifier, clientQueue, groupInfo):
+    """
+      Sets the client and grouping information of a new runner and adds it to the queue
+      @ In, internalJob, Runner, the new runner
+      @ In, identifier, string, the job identifier
+      @ In, clientQueue, boolean, if this run needs to be added in the clientQueue
+      @ In, groupInfo, dict, {id:string, size:int} or None, see addJob
+      @ Out, None
+    """
     # set the client info
     internalJob.clientRunner = clientQueue
     #  set the groupping id if present
@@ -684,9 +848,28 @@ class JobHandler(BaseType):
       if self.__batching[groupId]["counter"] > self.__batching[groupId]["size"]:
         self.raiseAnError(RuntimeError, f"group id {groupId} is full. Size reached:")
       self.__batching[groupId]["ids"].append(identifier)
+    internalJob.setCompletionCallback(self.__loopEvent.set)
     # add the runner in the Queue
     self.reAddJob(internalJob)
 
+  def __shareWithWorkers(self, function, args):
+    """
+      Returns the SharedArguments (function and leading arguments serialized only once
+      and cached by the worker processes) for a job. For model evaluations, the
+      model and the step inputs (the first two arguments) are shared, so that only
+      the sampler information is sent to the workers for each job.
+      @ In, function, function, the function to run
+      @ In, args, tuple, the job arguments
+      @ Out, shared, Runners.SharedArguments, the shared arguments
+    """
+    sharedArgs = tuple(args[:2]) if len(args) > 1 and isinstance(args[0], Models.Model) else ()
+    key = (id(function),) + tuple(id(arg) for arg in sharedArgs)
+    if key not in self.__sharedArguments:
+      token = (self.__sharedGeneration, len(self.__sharedArguments))
+      # keep the objects referenced, so their ids can not be recycled
+      self.__sharedArguments[key] = ((function, sharedArgs), Runners.SharedArguments(token, function, sharedArgs))
+    return self.__sharedArguments[key][1]
+
   def reAddJob(self, runner):
     """
       Method to add a runner object in the queue
@@ -701,6 +884,7 @@ class JobHandler(BaseType):
       if self.__profileJobs:
         runner.trackTime('queue')
       self.__submittedJobs.append(runner.identifier)
+    self.__loopEvent.set()
 
   def addClientJob(self, args, functionToRun, identifier, metadata=None, uniqueHandler="any", groupInfo = None):
     """
@@ -755,6 +939,7 @@ class JobHandler(BaseType):
     # place it on the finished queue
     with self.__queueLock:
       self.__finished.append(run)
+    self.__clientEvent.set()
 
   def isFinished(self, uniqueHandler=None):
     """
@@ -1082,6 +1267,8 @@ class JobHandler(BaseType):
             self.__nextId += 1
           else:
             break
+      # the queue got some room, the clients can submit new jobs
+      self.__clientEvent.set()
 
     # Repeat the same process above, only for the clientQueue
     emptySlots = [i for i,run in enumerate(self.__clientRunning) if run is None]
@@ -1095,6 +1282,7 @@ class JobHandler(BaseType):
             self.__nextId += 1
           else:
             break
+      self.__clientEvent.set()
 
   def cleanJobQueue(self):
     """
@@ -1106,15 +1294,27 @@ class JobHandler(BaseType):
     # The code handling these two lists was the exact same, I have taken the
     # liberty of condensing these loops into one and removing some of the
     # redundant checks to make this code a bit simpler.
+    anyFinished = False
+    pollRunning = False
     for runList in [self.__running, self.__clientRunning]:
       with self.__queueLock:
         # We need the queueLock, because if terminateJobs runs kill on it,
         #  kill changes variables that can cause run.isDone to error out.
         for i,run in enumerate(runList):
-          if run is not None and run.isDone():
-            self.__finished.append(run)
-            self.__finished[-1].trackTime('jobHandler_finished')
+          if run is None:
+            continue
+          if run.isDone():
+            finishedRuns = self.__splitBatch(run) if getattr(run, 'batchMembers', None) else [run]
+            for finishedRun in finishedRuns:
+              self.__finished.append(finishedRun)
+              finishedRun.trackTime('jobHandler_finished')
             runList[i] = None
+            anyFinished = True
+          elif not run.signalsCompletion:
+            pollRunning = True
+    self.__pollRunning = pollRunning
+    if anyFinished:
+      self.__clientEvent.set()
 
   def setProfileJobs(self,profile=False):
     """
@@ -1132,6 +1332,9 @@ class JobHandler(BaseType):
     """
     with self.__queueLock:
       self.__submittedJobs = []
+    # the objects shared with the worker processes might be changed by the new step
+    self.__sharedArguments = {}
+    self.__sharedGeneration += 1
 
   def shutdown(self):
     """
@@ -1141,7 +1344,11 @@ class JobHandler(BaseType):
     @ Out, None
     """
     self.completed = True
+    # wake up the polling thread, so it can exit
+    self.__loopEvent.set()
     self.__shutdownParallel()
+    if self.__supervisor is not None:
+      self.__supervisor.shutdown()
 
   def terminateAll(self):
     """
@@ -1184,5 +1391,7 @@ class JobHandler(BaseType):
           else:
             queue.remove(job)
           self.raiseADebug(f'Terminated job "{job.identifier}" by request.')
+    # slots might have been freed
+    self.__loopEvent.set()
     if len(ids):
       self.raiseADebug('Tried to remove some jobs but not found in any queues:',', '.join(ids))
@@ -22,6 +22,7 @@ import shutil
 import platform
 import shlex
 import time
+import subprocess
 import numpy as np
 import pandas as pd
 #External Modules End--------------------------------------------------------------------------------
@@ -57,6 +58,9 @@ class Code(Model):
     inputSpecification.addSub(InputData.parameterInputFactory("executable", contentType=InputTypes.StringType))
     inputSpecification.addSub(InputData.parameterInputFactory("walltime", contentType=InputTypes.FloatType))
     inputSpecification.addSub(InputData.parameterInputFactory("preexec", contentType=InputTypes.StringType))
+    StagingType = InputTypes.makeEnumType("staging", "stagingType", ["copy", "hardlink", "symlink"])
+    inputSpecification.addSub(InputData.parameterInputFactory("staging", contentType=StagingType))
+    inputSpecification.addSub(InputData.parameterInputFactory("outputColumns", contentType=InputTypes.StringListType))
 
     ## Begin command line arguments tag
     ClargsInput = InputData.parameterInputFactory("clargs")
@@ -118,6 +122,9 @@ class Code(Model):
     self.foundPreExec = True     # True indicates the pre-executable is found, otherwise not found
     self.maxWallTime = None      # If set, this indicates the maximum CPU time a job can take.
     self._ravenWorkingDir = None # RAVEN's working dir
+    self.staging = 'copy'        # how the input files declared read-only by the code interface are staged in the run directories
+    self._readOnlyInputs = set() # absolute paths of the original input files declared read-only by the code interface
+    self.outputColumns = None    # columns of the code output files to load (all if None)
 
   def applyRunInfo(self, runInfo):
     """
@@ -146,6 +153,10 @@ class Code(Model):
         self.maxWallTime = child.value
       if child.getName() =='preexec':
         self.preExec = child.value
+      if child.getName() == 'staging':
+        self.staging = child.value
+      if child.getName() == 'outputColumns':
+        self.outputColumns = child.value
       elif child.getName() == 'clargs':
         argtype    = child.parameterValues['type']      if 'type'      in child.parameterValues else None
         arg        = child.parameterValues['arg']       if 'arg'       in child.parameterValues else None
@@ -339,6 +350,10 @@ class Code(Model):
       # the deepcopy is needed to avoid the code interface
       # developer to modify the content of the runInfoDict
       self.code.initialize(copy.deepcopy(runInfoDict), self.oriInputFiles)
+    # files that the code interface never modifies can be linked instead of copied for each run
+    self._readOnlyInputs = set()
+    if self.staging != 'copy' and 'getReadOnlyInputFiles' in dir(self.code):
+      self._readOnlyInputs = set(inputFile.getAbsFile() for inputFile in self.code.getReadOnlyInputFiles(self.oriInputFiles))
 
   def createNewInput(self,currentInput,samplerType,**kwargs):
     """
@@ -387,7 +402,7 @@ class Code(Model):
         os.makedirs(subSubDirectory)
       ##########################################################################
       newInputSet[index].setPath(subSubDirectory)
-      shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      self._stageInputFile(self.oriInputFiles[index].getAbsFile(), subSubDirectory)
 
     kwargs['subDirectory'] = subDirectory
     kwargs['alias'] = self.alias
@@ -402,6 +417,33 @@ class Code(Model):
 
     return (newInput,kwargs)
 
+  def _stageInputFile(self, source, directory):
+    """
+      Places an original input file into the directory of a run. The files declared read-only by the
+      code interface are hard-linked or symlinked, according to the <staging> node, all the others are copied.
+      @ In, source, str, absolute path of the original input file
+      @ In, directory, str, directory of the run
+      @ Out, None
+    """
+    target = os.path.join(directory, os.path.basename(source))
+    # never write through a link left in place by a previous staging
+    if os.path.islink(target) or (os.path.exists(target) and os.stat(target).st_nlink > 1):
+      os.remove(target)
+    if source in self._readOnlyInputs:
+      try:
+        if os.path.exists(target):
+          os.remove(target)
+        if self.staging == 'hardlink':
+          os.link(source, target)
+        else:
+          os.symlink(source, target)
+        return
+      except OSError as e:
+        # e.g. hard links across file systems, or symlinks not allowed for the user
+        self.raiseAWarning(f'Input file "{source}" can not be staged with a {self.staging} ({e}), so the input files will be copied!')
+        self._readOnlyInputs = set()
+    shutil.copy(source, directory)
+
   def _expandCommand(self, origCommand):
     """
       Function to expand a command from string to list.
@@ -493,6 +535,30 @@ class Code(Model):
           the second item will be the output of this model given the specified
           inputs
     """
+    run = self.prepareRun(myInput, samplerType, kwargs)
+    ## This code should be evaluated by the job handler, so it is fine to wait
+    ## until the execution of the external subprocess completes.
+    process = utils.pickleSafeSubprocessPopen(run['command'], **run['popen'])
+    timedOut = False
+    try:
+      process.wait(timeout=run['timeout'])
+    except subprocess.TimeoutExpired:
+      process.kill()
+      process.wait()
+      timedOut = True
+    returnCode = -1 if timedOut else process.returncode
+    return self.finalizeRun(run, process.pid, returnCode, timedOut)
+
+  def prepareRun(self, myInput, samplerType, kwargs):
+    """
+        Prepares the run of an individual sample: creates the new input and the
+        execution command. See evaluateSample for the description of the parameters.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, kwargs, dict,  is a dictionary that contains the information coming from the sampler
+        @ Out, run, dict, the process to launch, as {"command":command, "timeout":wall time,
+          "popen":subprocess.Popen arguments}, along with the information needed by finalizeRun
+    """
     inputFiles = self.createNewInput(myInput, samplerType, **kwargs)
     self.currentInputFiles, metaData = (copy.deepcopy(inputFiles[0]),inputFiles[1]) if type(inputFiles).__name__ == 'tuple' else (inputFiles, None)
     returnedCommand = self.code.genCommand(self.currentInputFiles,self.executable, flags=self.clargs, fileArgs=self.fargs, preExec=self.preExec)
@@ -508,8 +574,6 @@ class Code(Model):
     precommand = kwargs['precommand']
     postcommand = kwargs['postcommand']
     bufferSize = kwargs['logfileBuffer']
-    fileExtensionsToDelete = kwargs['deleteOutExtension']
-    deleteSuccessfulLogFiles = kwargs['delSucLogFiles']
 
     codeLogFile = self.outFileRoot
     if codeLogFile is None:
@@ -598,26 +662,38 @@ class Code(Model):
     self.raiseADebug('self pid:' + str(os.getpid())+' ppid: '+str(os.getppid()))
     ## reset python path
     localenv.pop('PYTHONPATH',None)
-    ## This code should be evaluated by the job handler, so it is fine to wait
-    ## until the execution of the external subprocess completes.
-    process = utils.pickleSafeSubprocessPopen(command, shell=self.code.getRunOnShell(), stdout=outFileObject, stderr=outFileObject, cwd=localenv['PWD'], env=localenv)
-    if self.maxWallTime is not None:
-      timeout = time.time() + self.maxWallTime
-      while True:
-        time.sleep(0.5)
-        process.poll()
-        if time.time() > timeout and process.returncode is None:
-          self.raiseAWarning('walltime exceeded in run in working dir: '+str(metaData['subDirectory'])+'. Killing the run...')
-          process.kill()
-          process.returncode = -1
-        if process.returncode is not None or time.time() > timeout:
-          break
-    else:
-      process.wait()
-
-    returnCode = process.returncode
-    self.raiseADebug(" Process "+str(process.pid)+" finished "+time.ctime()+
-                     " with returncode "+str(process.returncode))
+    run = {'command': command,
+           'timeout': self.maxWallTime,
+           'popen': {'shell': self.code.getRunOnShell(), 'stdout': outFileObject, 'stderr': outFileObject,
+                     'cwd': localenv['PWD'], 'env': localenv},
+           'outFileObject': outFileObject,
+           'codeLogFile': codeLogFile,
+           'metaData': metaData,
+           'sampleDirectory': sampleDirectory,
+           'kwargs': kwargs}
+    return run
+
+  def finalizeRun(self, run, pid, returnCode, timedOut=False):
+    """
+        Collects the outcome of the run of an individual sample, once its process ended.
+        @ In, run, dict, the run, as returned by prepareRun
+        @ In, pid, int, the process id of the ended process
+        @ In, returnCode, int, the return code of the process
+        @ In, timedOut, bool, optional, True if the process has been killed for exceeding the walltime
+        @ Out, returnValue, dict, the realization of the run (see evaluateSample), or None if it failed
+    """
+    command = run['command']
+    outFileObject = run['outFileObject']
+    codeLogFile = run['codeLogFile']
+    metaData = run['metaData']
+    sampleDirectory = run['sampleDirectory']
+    kwargs = run['kwargs']
+    fileExtensionsToDelete = kwargs['deleteOutExtension']
+    deleteSuccessfulLogFiles = kwargs['delSucLogFiles']
+    if timedOut:
+      self.raiseAWarning('walltime exceeded in run in working dir: '+str(metaData['subDirectory'])+'. Killing the run...')
+    self.raiseADebug(" Process "+str(pid)+" finished "+time.ctime()+
+                     " with returncode "+str(returnCode))
     # procOutput = process.communicate()[0]
 
     ## If the returnCode is already non-zero, we should maintain our current
@@ -639,6 +715,7 @@ class Code(Model):
     ## below always adds .csv to the filename and the standard output file does
     ## not have an extension. - (DPM 4/6/2017)
     outputFile, isStr = codeLogFile, True
+    writtenCsv = False
     if 'finalizeCodeOutput' in dir(self.code) and returnCode == 0:
       finalCodeOutput = self.code.finalizeCodeOutput(command, codeLogFile, metaData['subDirectory'])
       ## Special case for RAVEN interface --ALFOA 09/17/17
@@ -660,21 +737,27 @@ class Code(Model):
       ## This may be a tautology at this point --DPM 4/12/17
       ## Special case for RAVEN interface. Added ravenCase flag --ALFOA 09/17/17
       if outputFile and isStr and not ravenCase:
-        outFile = Files.CSV()
-        ## Should we be adding the file extension here?
-        outFile.initialize(outputFile+'.csv', path=metaData['subDirectory'])
-
         csvLoader = CsvLoader.CsvLoader()
-        # does this CodeInterface have sufficiently intense (or limited) CSV files that
-        #   it needs to assume floats and use numpy, or can we use pandas?
-        loadUtility = self.code.getCsvLoadUtil()
-        csvData = csvLoader.loadCsvFile(outFile.getAbsFile(), nullOK=False, utility=loadUtility)
-        returnDict = csvLoader.toRealization(csvData)
+        if outputFile.endswith(('.npz', '.parquet')):
+          # binary output, e.g. written by the code interface in "finalizeCodeOutput"
+          returnDict = csvLoader.loadBinaryFile(os.path.join(metaData['subDirectory'], outputFile), usecols=self.outputColumns)
+        else:
+          outFile = Files.CSV()
+          ## Should we be adding the file extension here?
+          outFile.initialize(outputFile+'.csv', path=metaData['subDirectory'])
+          # does this CodeInterface have sufficiently intense (or limited) CSV files that
+          #   it needs to assume floats and use numpy, or can we use pandas?
+          loadUtility = self.code.getCsvLoadUtil()
+          csvData = csvLoader.loadCsvFile(outFile.getAbsFile(), nullOK=False, utility=loadUtility, usecols=self.outputColumns)
+          returnDict = csvLoader.toRealization(csvData)
+          # the data come from the CSV, no need to write it again
+          writtenCsv = True
 
       if not ravenCase:
         # check if the csv needs to be printed
-        if self.code.getIfWriteCsv():
-          csvFileName = os.path.join(metaData['subDirectory'],outputFile+'.csv')
+        if self.code.getIfWriteCsv() and not writtenCsv:
+          csvRoot = os.path.splitext(outputFile)[0] if outputFile.endswith(('.npz', '.parquet')) else outputFile
+          csvFileName = os.path.join(metaData['subDirectory'],csvRoot+'.csv')
           pd.DataFrame.from_dict(returnDict).to_csv(path_or_buf=csvFileName,index=False)
         self._replaceVariablesNamesWithAliasSystem(returnDict, 'inout', True)
         returnDict.update(kwargs)
@@ -788,6 +871,32 @@ class Code(Model):
       @ In, options, dict, optional, dictionary of options that can be passed in when the collect of the output is performed by another model (e.g. EnsembleModel)
       @ Out, None
     """
+    output.addRealizations(self._getRealizations(finishedJob))
+
+    ##TODO How to handle restart?
+    ##TODO How to handle collectOutputFromDataObject
+
+    return
+
+  def collectOutputs(self, finishedJobs, output):
+    """
+      Method that collects the outputs of a batch of runs that finished together
+      @ In, finishedJobs, list(InternalRunner), instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    realizations = []
+    for finishedJob in finishedJobs:
+      realizations.extend(self._getRealizations(finishedJob))
+    # the whole batch is stored at once
+    output.addRealizations(realizations)
+
+  def _getRealizations(self, finishedJob):
+    """
+      Obtains the realizations produced by a run
+      @ In, finishedJob, InternalRunner object, instance of the run just finished
+      @ Out, realizations, list(dict), the realizations of the run
+    """
     evaluation = finishedJob.getEvaluation()
     if not hasattr(evaluation, 'pop'):
       self.raiseAWarning("No pop in evaluation " + repr(evaluation) + " for job " + str(finishedJob.identifier) + ":" + repr(finishedJob) + " with return code "+ repr(finishedJob.getReturnCode()))
@@ -796,16 +905,9 @@ class Code(Model):
     self._replaceVariablesNamesWithAliasSystem(evaluation, 'input',True)
     # in the event a batch is run, the evaluations will be a dict as {'RAVEN_isBatch':True, 'realizations': [...]}
     if isinstance(evaluation,dict) and evaluation.get('RAVEN_isBatch',False):
-      for rlz in evaluation['realizations']:
-        output.addRealization(rlz)
+      return evaluation['realizations']
     # otherwise, we received a single realization
-    else:
-      output.addRealization(evaluation)
-
-    ##TODO How to handle restart?
-    ##TODO How to handle collectOutputFromDataObject
-
-    return
+    return [evaluation]
 
   ###################################################################################
   ## THIS METHOD NEEDS TO BE REWORKED WHEN THE NEW DATAOBJECT STRUCURE IS IN PLACE ##
@@ -973,8 +1075,11 @@ class Code(Model):
       ## works, we are unable to pass a member function as a job because the
       ## pp library loses track of what self is, so instead we call it from the
       ## class and pass self in as the first parameter
-      jobHandler.addJob((self, myInput, samplerType, kw), self.__class__.evaluateSample, prefix, metadata=metadata,
-                        uniqueHandler=uniqueHandler, groupInfo={'id': kwargs['batchInfo']['batchId'], 'size': nRuns} if batchMode else None)
+      ## With multi-threading, the process of the code is supervised by the jobHandler
+      ## (no thread is held while the code runs), see prepareRun and finalizeRun
+      jobHandler.addProcessJob((self, myInput, samplerType, kw), self.__class__.evaluateSample,
+                               self.__class__.prepareRun, self.finalizeRun, prefix, metadata=metadata,
+                               uniqueHandler=uniqueHandler, groupInfo={'id': kwargs['batchInfo']['batchId'], 'size': nRuns} if batchMode else None)
       if nRuns == 1:
         self.raiseAMessage('job "' + str(prefix) + '" submitted!')
       else:
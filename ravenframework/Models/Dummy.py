@@ -214,6 +214,35 @@ class Dummy(Model):
     output.addRealization(result)
     # END can be abstracted to base class
 
+  def collectOutputs(self, finishedJobs, output):
+    """
+      Method that collects the outputs of a batch of runs that finished together
+      @ In, finishedJobs, list(InternalRunner), instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    if type(self).collectOutput is not Dummy.collectOutput:
+      # the derived model collects its runs in its own way, one at a time
+      Model.collectOutputs(self, finishedJobs, output)
+    else:
+      self._collectBatch(finishedJobs, output)
+
+  def _collectBatch(self, finishedJobs, output):
+    """
+      Collects the evaluations of a batch of runs and stores them at once
+      @ In, finishedJobs, list(InternalRunner), instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    results = []
+    for finishedJob in finishedJobs:
+      result = finishedJob.getEvaluation()
+      # alias system
+      self._replaceVariablesNamesWithAliasSystem(result,'output',True)
+      results.append(result)
+    # the whole batch is stored at once
+    output.addRealizations(results)
+
   def collectOutputFromDict(self,exportDict,output,options=None):
     """
       Collect results from a dictionary
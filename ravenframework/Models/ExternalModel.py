@@ -346,7 +346,27 @@ class ExternalModel(Dummy):
       @ In, options, dict, optional, dictionary of options that can be passed in when the collect of the output is performed by another model (e.g. EnsembleModel)
       @ Out, None
     """
-    evaluation = finishedJob.getEvaluation()
+    self._checkHistorySizes(finishedJob.getEvaluation(), output)
+    Dummy.collectOutput(self, finishedJob, output, options)
+
+  def collectOutputs(self, finishedJobs, output):
+    """
+      Method that collects the outputs of a batch of runs that finished together
+      @ In, finishedJobs, list(InternalRunner), instances of the runs just finished
+      @ In, output, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    for finishedJob in finishedJobs:
+      self._checkHistorySizes(finishedJob.getEvaluation(), output)
+    self._collectBatch(finishedJobs, output)
+
+  def _checkHistorySizes(self, evaluation, output):
+    """
+      Checks that the outputs of an evaluation stored in a HistorySet have consistent sizes
+      @ In, evaluation, dict, the evaluation of the model
+      @ In, output, "DataObjects" object, output where the results of the calculation needs to be stored
+      @ Out, None
+    """
     # TODO this is done in dummy, so don't do it here?, but need to check before checking history lengths)
     # OLD instanciatedSelf = evaluation['RAVEN_instantiated_self']
     # OLD outcomes         = evaluatedOutput[0]
@@ -361,8 +381,6 @@ class ExternalModel(Dummy):
         if not mathUtils.sizeMatch(evaluation[key],outputSize):
           self.raiseAnError(Exception,"the time series size needs to be the same for the output space in a HistorySet! Variable:"+key+". Size in the HistorySet="+str(outputSize)+".Size outputed="+str(outputSize))
 
-    Dummy.collectOutput(self, finishedJob, output, options)
-
   def getSerializationFiles(self):
     """
       Returns a list of any files that this needs if it is serialized
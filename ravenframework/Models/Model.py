@@ -453,6 +453,27 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
                         uniqueHandler=uniqueHandler, forceUseThreads=forceThreads,
                         groupInfo={'id': kwargs['batchInfo']['batchId'], 'size': nRuns} if batchMode else None)
 
+  def canEvaluateBatch(self):
+    """
+      Checks if this model can evaluate several samples in a single job (see submitBatch)
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if the samples of a batch are evaluated at once
+    """
+    return False
+
+  def submitBatch(self, myInputs, samplerType, jobHandler, kwargsList):
+    """
+        Submits a batch of samples to be evaluated by this model. By default, each
+        sample is submitted as an individual job (see submit).
+        @ In, myInputs, list, the inputs of each sample (see submit)
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, jobHandler, JobHandler instance, the global job handler instance
+        @ In, kwargsList, list(dict), the information coming from the sampler for each sample (see submit)
+        @ Out, None
+    """
+    for myInput, kwargs in zip(myInputs, kwargsList):
+      self.submit(myInput, samplerType, jobHandler, **kwargs)
+
   def addOutputFromExportDictionary(self,exportDict,output,options,jobIdentifier):
     """
       Method that collects the outputs from them export dictionary
@@ -486,6 +507,17 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
     else:
       self.raiseAnError(IOError,'The place where we want to store the output has no addOutput method!')
 
+  def collectOutputs(self, finishedJobs, storeTo):
+    """
+      Method that collects the outputs of a batch of runs that finished together.
+      By default, the runs are collected one at a time through collectOutput.
+      @ In, finishedJobs, list(InternalRunner), instances of the runs just finished
+      @ In, storeTo, "DataObjects" object, output where the results of the calculations need to be stored
+      @ Out, None
+    """
+    for finishedJob in finishedJobs:
+      self.collectOutput(finishedJob, storeTo)
+
   def getAdditionalInputEdits(self,inputInfo):
     """
       Collects additional edits for the sampler to use when creating a new input.  By default does nothing.
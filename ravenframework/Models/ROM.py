@@ -520,7 +520,16 @@ class ROM(Dummy):
     inRun = self._manipulateInput(Input[0])
     # collect results from model run
     result = self._externalRun(inRun)
-    # build realization
+    return self._buildRealization(kwargs, inRun, result)
+
+  def _buildRealization(self, kwargs, inRun, result):
+    """
+      Builds the realization of an evaluated sample
+      @ In, kwargs, dict, the information coming from the sampler for this sample
+      @ In, inRun, dict, the input of the evaluation
+      @ In, result, dict, the outcome of the evaluation
+      @ Out, rlz, dict, the realization (metadata, input and output space)
+    """
     # assure rlz has all metadata
     self._replaceVariablesNamesWithAliasSystem(kwargs['SampledVars'] ,'input',True)
     rlz = dict((var,np.atleast_1d(kwargs[var])) for var in kwargs.keys())
@@ -528,6 +537,73 @@ class ROM(Dummy):
     rlz.update(dict((var,np.atleast_1d(inRun[var] if var in kwargs['SampledVars'] else result[var])) for var in set(itertools.chain(result.keys(),inRun.keys()))))
     return rlz
 
+  def canEvaluateBatch(self):
+    """
+      Checks if this ROM can evaluate several samples in a single job, i.e. if the trained
+      model evaluates a matrix of samples at once
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if the samples of a batch are evaluated at once
+    """
+    return (not self.segment and not self.isADynamicModel and len(self.supervisedContainer) == 1
+            and self.supervisedContainer[0].canEvaluateBatch())
+
+  def submitBatch(self, myInputs, samplerType, jobHandler, kwargsList):
+    """
+        Submits a batch of samples to be evaluated by this ROM in a single job (see evaluateBatch)
+        @ In, myInputs, list, the inputs of each sample (see submit)
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, jobHandler, JobHandler instance, the global job handler instance
+        @ In, kwargsList, list(dict), the information coming from the sampler for each sample (see submit)
+        @ Out, None
+    """
+    if not self.canEvaluateBatch():
+      super().submitBatch(myInputs, samplerType, jobHandler, kwargsList)
+      return
+    members = [(kwargs.get('prefix'), kwargs) for kwargs in kwargsList]
+    jobHandler.addBatchJob((self, myInputs, samplerType, kwargsList), self.__class__.evaluateBatch, members,
+                           forceUseThreads=kwargsList[0].get('forceThreads', False),
+                           uniqueHandler=kwargsList[0].get('uniqueHandler', 'any'))
+
+  @Parallel()
+  def evaluateBatch(self, myInputs, samplerType, kwargsList):
+    """
+        Evaluates a batch of samples through a single evaluation of the ROM on the matrix of the samples.
+        If the samples can not be stacked (e.g. non-scalar features) or the evaluation of the matrix
+        fails, the samples are evaluated one at a time.
+        @ In, myInputs, list, the inputs of each sample (see evaluateSample)
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, kwargsList, list(dict), the information coming from the sampler for each sample
+        @ Out, rlzs, list(dict), the realization of each sample (see evaluateSample), None for the samples that failed
+    """
+    inRuns = [self._manipulateInput(self.createNewInput(myInput, samplerType, **kwargs)[0]) for myInput, kwargs in zip(myInputs, kwargsList)]
+    nSamples = len(inRuns)
+    features = self.supervisedContainer[0].features
+    results = None
+    if all(feat in inRun and np.size(inRun[feat]) == 1 for inRun in inRuns for feat in features):
+      request = dict((feat, np.concatenate([np.atleast_1d(inRun[feat]) for inRun in inRuns])) for feat in features)
+      try:
+        evaluation = self.evaluate(request)
+      except Exception as ae:
+        self.raiseAWarning(f'The evaluation of the batch of {nSamples} samples failed ({ae}), evaluating the samples one at a time.')
+        evaluation = None
+      if evaluation is not None and all(np.shape(value)[:1] == (nSamples,) for value in evaluation.values()):
+        results = [dict((var, value[index:index+1]) for var, value in evaluation.items()) for index in range(nSamples)]
+    rlzs = []
+    for index, (inRun, kwargs) in enumerate(zip(inRuns, kwargsList)):
+      if results is not None:
+        result = results[index]
+        self._replaceVariablesNamesWithAliasSystem(result, 'output', True)
+        self._replaceVariablesNamesWithAliasSystem(inRun, 'input', True)
+      else:
+        try:
+          result = self._externalRun(inRun)
+        except Exception as ae:
+          self.raiseAWarning(f'The evaluation of sample "{kwargs.get("prefix")}" failed with error: {ae}')
+          rlzs.append(None)
+          continue
+      rlzs.append(self._buildRealization(kwargs, inRun, result))
+    return rlzs
+
   def setAdditionalParams(self, params):
     """
       Used to set parameters at a time other than initialization (such as deserializing).
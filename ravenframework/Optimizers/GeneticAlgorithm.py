@@ -623,6 +623,7 @@ class GeneticAlgorithm(RavenSampled):
       @ In, acceptable, str, 'accetable' status (i.e. first, accepted, rejected, final)
       @ Out, None
     """
+    toExport = []
     for i in range(rlz.sizes['RAVEN_sample_ID']):
       varList = self._solutionExport.getVars('input') + self._solutionExport.getVars('output') + list(self.toBeSampled.keys())
       rlzDict = dict((var,np.atleast_1d(rlz[var].data)[i]) for var in set(varList) if var in rlz.data_vars)
@@ -630,7 +631,9 @@ class GeneticAlgorithm(RavenSampled):
       rlzDict['fitness'] = np.atleast_1d(fitness.data)[i]
       for ind, consName in enumerate(g['Constraint'].values):
         rlzDict['ConstraintEvaluation_'+consName] = g[i,ind]
-      self._updateSolutionExport(traj, rlzDict, acceptable, None)
+      toExport.append(self._getSolutionExportRealization(traj, rlzDict, acceptable, None))
+    # the whole population is stored at once
+    self._solutionExport.addRealizations(toExport)
 
   def _resolveNewGeneration(self, traj, rlz, objectiveVal, fitness, g, info):
     """
@@ -627,6 +627,17 @@ class RavenSampled(Optimizer):
       @ In, rejectReason, str, reject reason of opt point, or return None if accepted
       @ Out, None
     """
+    self._solutionExport.addRealization(self._getSolutionExportRealization(traj, rlz, acceptable, rejectReason))
+
+  def _getSolutionExportRealization(self, traj, rlz, acceptable, rejectReason):
+    """
+      Builds the realization to be stored in the solution export.
+      @ In, traj, int, trajectory which should be written
+      @ In, rlz, dict, collected point
+      @ In, acceptable, bool, acceptability of opt point
+      @ In, rejectReason, str, reject reason of opt point, or return None if accepted
+      @ Out, toExport, dict, the realization for the solution export
+    """
     # make a holder for the realization that will go to the solutionExport
     toExport = {}
     # add some meta information
@@ -653,7 +664,7 @@ class RavenSampled(Optimizer):
         toExport[var] = rlz[var]
     # formatting
     toExport = dict((var, np.atleast_1d(val)) for var, val in toExport.items())
-    self._solutionExport.addRealization(toExport)
+    return toExport
 
   def _addToSolutionExport(self, traj, rlz, acceptable):
     """
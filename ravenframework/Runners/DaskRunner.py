@@ -49,6 +49,8 @@ class DaskRunner(InternalRunner):
     Class for running internal objects in distributed memory fashion using
     dask.
   """
+  signalsCompletion = True
+
   def __init__(self, args, functionToRun, **kwargs):
     """
       Init method
@@ -157,6 +159,7 @@ class DaskRunner(InternalRunner):
     """
     try:
       self.__func = self.__client.submit(self.functionToRun, *self.args, retries=0)
+      self.__func.add_done_callback(lambda _: self._notifyCompletion())
       self.trackTime('runner_started')
       self.started = True
       gc.collect()
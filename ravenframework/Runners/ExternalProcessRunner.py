@@ -0,0 +1,139 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Runner for the jobs consisting of an external process (e.g. a Code model run),
+  supervised by the ProcessSupervisor of the JobHandler instead of a thread per job.
+
+  Created on Oct 18, 2026
+"""
+#External Modules------------------------------------------------------------------------------------
+import sys
+import threading
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+class ExternalProcessRunner(InternalRunner):
+  """
+    Runs a job in three phases:
+      - "functionToRun(*args)" prepares the run and returns the process to launch, as a dict with
+        the "command", the "timeout" (wall time, None for no limit) and the "popen" arguments
+        (see subprocess.Popen), along with any state needed by the finalization;
+      - the process is launched and waited for by the ProcessSupervisor;
+      - "finalize(run, pid, returnCode, timedOut)" collects the outcome of the job, once the process ended.
+    The preparation runs when the JobHandler starts the job, the finalization when the outcome is
+    first requested (e.g. by the Step collecting the job).
+  """
+  signalsCompletion = True
+
+  def __init__(self, args, functionToRun, supervisor=None, finalize=None, **kwargs):
+    """
+      Init method
+      @ In, args, list, arguments of functionToRun (functionToRun(*args))
+      @ In, functionToRun, method or function, function preparing the run
+      @ In, supervisor, ProcessSupervisor, the supervisor owning the processes
+      @ In, finalize, method or function, function collecting the outcome as finalize(run, pid, returnCode, timedOut)
+      @ In, kwargs, dict, additional arguments to pass to base
+      @ Out, None
+    """
+    super().__init__(args, functionToRun, **kwargs)
+    self.supervisor = supervisor
+    self.finalize = finalize
+    self.run = None              # the run returned by functionToRun
+    self.supervised = None       # the supervised process
+    self.processDone = False     # set by the supervisor thread when the process ends
+    self.collected = False       # True once the outcome has been finalized
+    self.__collectLock = threading.Lock()
+    self.skipOnCopy.extend(['supervisor', 'finalize', 'supervised', '_ExternalProcessRunner__collectLock'])
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    if not self.started:
+      return False
+    return self.processDone
+
+  def start(self):
+    """
+      Prepares the run and launches its process
+      @ In, None
+      @ Out, None
+    """
+    self.started = True
+    try:
+      self.run = self.functionToRun(*self.args)
+      self.supervised = self.supervisor.launch(self.run['command'], self._processEnded,
+                                               timeout=self.run.get('timeout', None), **self.run['popen'])
+      self.trackTime('runner_started')
+    except Exception as ae:
+      self.exceptionTrace = sys.exc_info()
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+      self.returnCode = -1
+      self.collected = True
+      self.processDone = True
+      self._notifyCompletion()
+
+  def _processEnded(self, supervised):
+    """
+      Called by the supervisor thread when the process ends
+      @ In, supervised, SupervisedProcess, the ended process
+      @ Out, None
+    """
+    self.processDone = True
+    self._notifyCompletion()
+
+  def _collectRunnerResponse(self):
+    """
+      Finalizes the run, once its process ended, storing the outcome in self.runReturn
+      @ In, None
+      @ Out, None
+    """
+    with self.__collectLock:
+      if self.collected or not self.processDone:
+        return
+      self.collected = True
+      try:
+        supervised = self.supervised
+        self.runReturn = self.finalize(self.run, supervised.process.pid, supervised.returnCode, supervised.timedOut)
+      except Exception as ae:
+        self.exceptionTrace = sys.exc_info()
+        self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+        self.runReturn = None
+      if self.runReturn is None:
+        self.returnCode = -1
+
+  def getReturnCode(self):
+    """
+      Returns the return code of the job, finalizing the run if needed
+      @ In, None
+      @ Out, returnCode, int, the return code of this evaluation
+    """
+    self._collectRunnerResponse()
+    return self.returnCode
+
+  def kill(self):
+    """
+      Kills the process of this job
+      @ In, None
+      @ Out, None
+    """
+    if self.supervised is not None:
+      self.raiseADebug('Terminating process "{}" of job "{}"'.format(self.supervised.process.pid, self.identifier))
+      self.supervisor.kill(self.supervised)
+    self.trackTime('runner_killed')
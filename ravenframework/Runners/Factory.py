@@ -25,6 +25,8 @@ from .RayRunner import RayRunner
 from .InternalRunner import InternalRunner
 from .PassthroughRunner import PassthroughRunner
 from .SharedMemoryRunner import SharedMemoryRunner
+from .ProcessPoolRunner import ProcessPoolRunner
+from .ExternalProcessRunner import ExternalProcessRunner
 
 class RunnerFactory(EntityFactory):
   """ Specific implementation for runners """
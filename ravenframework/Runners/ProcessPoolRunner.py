@@ -0,0 +1,256 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Runner executing internal objects in a pool of persistent worker processes
+  (concurrent.futures.ProcessPoolExecutor), avoiding the GIL for pure-Python models.
+  The function to run and the leading, step-invariant arguments (e.g. the model
+  instance and the step inputs) are shipped once to each worker and cached there;
+  only the per-job arguments (e.g. the sampled values) and the job outcome cross
+  the process boundary for each job.
+
+  Created on Oct 18, 2026
+"""
+#External Modules------------------------------------------------------------------------------------
+import os
+import sys
+import copy
+import pickle
+import threading
+import cloudpickle
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+# Cache of the shared arguments in each worker process {token: (function, sharedArgs)}
+_workerCache = {}
+
+class _MissingSharedArguments:
+  """
+    Returned by a worker that does not (yet) hold the shared arguments of a job
+  """
+  pass
+
+def _evaluateInWorker(token, payload, args):
+  """
+    Function executed in the worker processes
+    @ In, token, tuple, (generation, serial) identifier of the shared arguments
+    @ In, payload, tuple or None, (pickled (function, sharedArgs), sysPath) if the shared
+      arguments need to be shipped, None if the worker is expected to hold them already
+    @ In, args, tuple, the per-job arguments, appended to the shared ones
+    @ Out, result, object, whatever the function returns or _MissingSharedArguments
+  """
+  if token not in _workerCache:
+    if payload is None:
+      return _MissingSharedArguments()
+    pickled, sysPath = payload
+    # make sure the modules imported by the main process (e.g. ExternalModel modules) are importable
+    for path in sysPath:
+      if path not in sys.path:
+        sys.path.append(path)
+    # the arguments of older generations (previous steps) are not needed anymore
+    for oldToken in [t for t in _workerCache if t[0] != token[0]]:
+      _workerCache.pop(oldToken)
+    _workerCache[token] = pickle.loads(pickled)
+  function, sharedArgs = _workerCache[token]
+  return function(*sharedArgs, *args)
+
+class SharedArguments:
+  """
+    Function and leading arguments shared by many jobs, serialized only once
+  """
+  def __init__(self, token, function, args):
+    """
+      Constructor
+      @ In, token, tuple, (generation, serial) unique identifier
+      @ In, function, method or function, function that needs to be run
+      @ In, args, tuple, the leading arguments of the function shared by the jobs
+      @ Out, None
+    """
+    self.token = token
+    self.nArgs = len(args)
+    sysPath = list(sys.path) + [p for p in os.environ.get('PYTHONPATH', '').split(os.pathsep) if p]
+    # cloudpickle handles the objects standard pickle can not (e.g. the modules loaded by ExternalModels)
+    self.payload = (cloudpickle.dumps((function, tuple(args))), sysPath)
+
+class ProcessPoolRunner(InternalRunner):
+  """
+    Class for running internal objects in a pool of persistent worker processes
+  """
+  signalsCompletion = True
+
+  def __init__(self, args, functionToRun, **kwargs):
+    """
+      Init method
+      @ In, args, list, this is a list of arguments that will be passed as
+        function parameters into whatever method is stored in functionToRun.
+        e.g., functionToRun(*args). The first two entries are the executor and
+        the SharedArguments (instance of this module) describing the leading
+        arguments of functionToRun
+      @ In, functionToRun, method or function, function that needs to be run
+      @ In, kwargs, dict, additional arguments to base class
+      @ Out, None
+    """
+    self.__executor, self.__shared, args = args[0], args[1], args[2:]
+    super().__init__(args, functionToRun, **kwargs)
+    self.__func = None
+    # __funcLock is needed because the future is replaced by the executor thread
+    # when the shared arguments need to be shipped to the worker
+    self.__funcLock = threading.RLock()
+    self.skipOnCopy.extend(['_ProcessPoolRunner__executor', '_ProcessPoolRunner__func', '_ProcessPoolRunner__funcLock'])
+
+  def __getstate__(self):
+    """
+      This function return the state of the ProcessPoolRunner
+      @ In, None
+      @ Out, state, dict, it contains all the information needed by the ProcessPoolRunner to be initialized
+    """
+    state = copy.copy(self.__dict__)
+    state.pop('_ProcessPoolRunner__funcLock')
+    state.pop('_ProcessPoolRunner__executor')
+    state.pop('_ProcessPoolRunner__func')
+    return state
+
+  def __setstate__(self, d):
+    """
+      Initialize the ProcessPoolRunner with the data contained in newstate
+      @ In, d, dict, it contains all the information needed by the ProcessPoolRunner to be initialized
+      @ Out, None
+    """
+    self.__dict__.update(d)
+    self.__funcLock = threading.RLock()
+    self.__executor = None
+    self.__func = None
+
+  @staticmethod
+  def _isMissing(future):
+    """
+      Checks if the worker executing the future did not hold the shared arguments
+      @ In, future, concurrent.futures.Future, completed future
+      @ Out, isMissing, bool, True if the job needs to be re-submitted with the shared arguments
+    """
+    return not future.cancelled() and future.exception() is None and isinstance(future.result(), _MissingSharedArguments)
+
+  def __submit(self, withPayload):
+    """
+      Submits the job to the executor
+      @ In, withPayload, bool, True to ship the shared arguments along with the job
+      @ Out, None
+    """
+    payload = self.__shared.payload if withPayload else None
+    future = self.__executor.submit(_evaluateInWorker, self.__shared.token, payload, tuple(self.args[self.__shared.nArgs:]))
+    with self.__funcLock:
+      self.__func = future
+    future.add_done_callback(self.__onDone)
+
+  def __onDone(self, future):
+    """
+      Callback invoked by the executor when a job completes
+      @ In, future, concurrent.futures.Future, the completed future
+      @ Out, None
+    """
+    with self.__funcLock:
+      if future is not self.__func:
+        # killed
+        return
+      resubmit = self._isMissing(future)
+    if resubmit:
+      # this worker has never seen the shared arguments, ship them (once per worker)
+      try:
+        self.__submit(True)
+        return
+      except Exception as ae:
+        self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+        self.returnCode = -1
+        with self.__funcLock:
+          self.__func = None
+    self._notifyCompletion()
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    ## If the process has not been started yet, then return False
+    if not self.started:
+      return False
+
+    with self.__funcLock:
+      if self.__func is None or self.hasBeenAdded:
+        return True
+      return self.__func.done() and not self._isMissing(self.__func)
+
+  def getReturnCode(self):
+    """
+      Returns the return code from running the code.  If return code not yet
+      set, then set it.
+      @ In, None
+      @ Out, returnCode, int,  the return code of this evaluation
+    """
+    if not self.hasBeenAdded:
+      self._collectRunnerResponse()
+    return self.returnCode
+
+  def _collectRunnerResponse(self):
+    """
+      Method to add the process response in the internal variable (pointer)
+      self.runReturn
+      @ In, None
+      @ Out, None
+    """
+    with self.__funcLock:
+      if not self.hasBeenAdded:
+        self.runReturn = None
+        if self.__func is not None:
+          try:
+            self.runReturn = self.__func.result()
+          except Exception as ae:
+            self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+        if self.runReturn is None:
+          self.returnCode = -1
+        self.hasBeenAdded = True
+
+  def start(self):
+    """
+      Method to start the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    try:
+      self.hasBeenAdded = False
+      self.returnCode = 0
+      # set before submitting, the job might be done before "submit" returns
+      self.started = True
+      self.__submit(False)
+      self.trackTime('runner_started')
+    except Exception as ae:
+      self.exceptionTrace = sys.exc_info()
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+      self.returnCode = -1
+
+  def kill(self):
+    """
+      Method to kill the job associated to this Runner
+      NOTE: a job already executing in a worker process is let finish, its outcome is discarded
+      @ In, None
+      @ Out, None
+    """
+    with self.__funcLock:
+      if self.__func is not None:
+        self.__func.cancel()
+      self.__func = None
+    self.returnCode = -1
+    self.trackTime('runner_killed')
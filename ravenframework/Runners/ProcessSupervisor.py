@@ -0,0 +1,262 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Supervisor of the child processes (external codes) launched by the JobHandler.
+  A single thread waits for all the child processes at once (through process file
+  descriptors where available, by polling otherwise), reports the exit codes as soon
+  as the processes end and kills the processes exceeding their wall time.
+
+  Created on Oct 18, 2026
+"""
+#External Modules------------------------------------------------------------------------------------
+import os
+import time
+import heapq
+import socket
+import threading
+import selectors
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from ..utils import utils
+#Internal Modules End--------------------------------------------------------------------------------
+
+class SupervisedProcess(object):
+  """
+    A child process owned by the ProcessSupervisor
+  """
+  def __init__(self, process, callback, deadline):
+    """
+      Constructor
+      @ In, process, subprocess.Popen, the child process
+      @ In, callback, callable, function called as callback(supervised) when the process ends
+      @ In, deadline, float, time (time.time) after which the process is killed, None for no limit
+      @ Out, None
+    """
+    self.process = process     # the child process
+    self.callback = callback   # called with this object when the process ends
+    self.deadline = deadline   # time after which the process is killed, if any
+    self.timedOut = False      # True if the process has been killed for exceeding its wall time
+    self.returnCode = None     # exit code, -1 if killed for exceeding its wall time
+    self.pidfd = None          # process file descriptor, if used to wait for the process
+
+class ProcessSupervisor(object):
+  """
+    Owns the child processes launched for the jobs, and waits for all of them
+    from a single thread, instead of a thread per process.
+  """
+  # polling interval for the platforms without process file descriptors (e.g. macOS, Windows)
+  pollInterval = 0.01
+
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self._usePidfd = hasattr(os, 'pidfd_open') # wait for the processes through their file descriptors
+    self._lock = threading.Lock()
+    self._pending = []          # processes launched but not registered by the supervisor thread yet
+    self._active = {}           # {pid: SupervisedProcess} being waited for (supervisor thread only)
+    self._deadlines = []        # heap of (deadline, pid) (supervisor thread only)
+    self._selector = None
+    self._wakeup = None         # socket pair used to wake up the supervisor thread
+    self._thread = None
+    self._stopping = False
+
+  def launch(self, command, callback, timeout=None, **popenKwargs):
+    """
+      Starts a child process and supervises it
+      @ In, command, str or list, the command to run (see subprocess.Popen)
+      @ In, callback, callable, function called as callback(supervised) from the supervisor
+        thread when the process ends, with supervised.returnCode set
+      @ In, timeout, float, optional, wall time (seconds) after which the process is killed
+      @ In, popenKwargs, dict, additional arguments for subprocess.Popen
+      @ Out, supervised, SupervisedProcess, the supervised process
+    """
+    self._start()
+    process = utils.pickleSafeSubprocessPopen(command, **popenKwargs)
+    supervised = SupervisedProcess(process, callback, None if timeout is None else time.time() + timeout)
+    with self._lock:
+      self._pending.append(supervised)
+    self._wake()
+    return supervised
+
+  def kill(self, supervised):
+    """
+      Kills a supervised process; its end is reported through the callback as usual
+      @ In, supervised, SupervisedProcess, the process to kill
+      @ Out, None
+    """
+    if supervised.process.poll() is None:
+      try:
+        supervised.process.kill()
+      except OSError:
+        # the process ended in the meantime
+        pass
+    self._wake()
+
+  def shutdown(self):
+    """
+      Kills the processes still running and stops the supervisor thread
+      @ In, None
+      @ Out, None
+    """
+    if self._thread is None:
+      return
+    self._stopping = True
+    self._wake()
+    self._thread.join()
+    self._thread = None
+    self._selector.close()
+    for sock in self._wakeup:
+      sock.close()
+
+  def numActive(self):
+    """
+      Returns the number of processes being supervised
+      @ In, None
+      @ Out, numActive, int, number of processes launched and not ended yet
+    """
+    with self._lock:
+      return len(self._active) + len(self._pending)
+
+  def _start(self):
+    """
+      Starts the supervisor thread, if not running yet
+      @ In, None
+      @ Out, None
+    """
+    with self._lock:
+      if self._thread is not None:
+        return
+      self._stopping = False
+      self._selector = selectors.DefaultSelector()
+      self._wakeup = socket.socketpair()
+      for sock in self._wakeup:
+        sock.setblocking(False)
+      self._selector.register(self._wakeup[0], selectors.EVENT_READ, None)
+      self._thread = threading.Thread(target=self._loop, name='ProcessSupervisor')
+      self._thread.daemon = True
+      self._thread.start()
+
+  def _wake(self):
+    """
+      Wakes up the supervisor thread
+      @ In, None
+      @ Out, None
+    """
+    if self._wakeup is None:
+      return
+    try:
+      self._wakeup[1].send(b'\0')
+    except (BlockingIOError, OSError):
+      # the wake up is already pending, or the supervisor is shutting down
+      pass
+
+  def _loop(self):
+    """
+      Target of the supervisor thread: waits for the processes to end or to exceed their wall time
+      @ In, None
+      @ Out, None
+    """
+    while not self._stopping:
+      self._register()
+      timeout = None
+      if self._deadlines:
+        timeout = max(0.0, self._deadlines[0][0] - time.time())
+      if self._active and not self._usePidfd:
+        timeout = self.pollInterval if timeout is None else min(timeout, self.pollInterval)
+      signalled = set()
+      for key, _ in self._selector.select(timeout):
+        if key.data is None:
+          # wake up, drain the socket
+          try:
+            while self._wakeup[0].recv(4096):
+              pass
+          except (BlockingIOError, OSError):
+            pass
+        else:
+          signalled.add(key.data)
+      self._killExpired()
+      # without file descriptors, all the processes are polled
+      self._collectEnded(signalled if self._usePidfd else list(self._active))
+    for supervised in list(self._active.values()) + self._pending:
+      if supervised.process.poll() is None:
+        supervised.process.kill()
+      self._release(supervised)
+
+  def _register(self):
+    """
+      Starts waiting for the newly launched processes
+      @ In, None
+      @ Out, None
+    """
+    with self._lock:
+      pending, self._pending = self._pending, []
+      for supervised in pending:
+        pid = supervised.process.pid
+        self._active[pid] = supervised
+        if supervised.deadline is not None:
+          heapq.heappush(self._deadlines, (supervised.deadline, pid))
+        if self._usePidfd:
+          try:
+            supervised.pidfd = os.pidfd_open(pid)
+            self._selector.register(supervised.pidfd, selectors.EVENT_READ, pid)
+          except OSError:
+            # e.g. not supported by the kernel, fall back to polling
+            supervised.pidfd = None
+            self._usePidfd = False
+
+  def _killExpired(self):
+    """
+      Kills the processes that exceeded their wall time
+      @ In, None
+      @ Out, None
+    """
+    now = time.time()
+    while self._deadlines and self._deadlines[0][0] <= now:
+      _, pid = heapq.heappop(self._deadlines)
+      supervised = self._active.get(pid, None)
+      if supervised is not None and supervised.process.poll() is None:
+        supervised.timedOut = True
+        supervised.process.kill()
+
+  def _collectEnded(self, pids):
+    """
+      Reports the processes that ended
+      @ In, pids, iterable(int), the process ids to check
+      @ Out, None
+    """
+    ended = []
+    with self._lock:
+      for pid in pids:
+        supervised = self._active.get(pid, None)
+        if supervised is not None and supervised.process.poll() is not None:
+          ended.append(self._active.pop(pid))
+    for supervised in ended:
+      supervised.returnCode = -1 if supervised.timedOut else supervised.process.returncode
+      self._release(supervised)
+      supervised.callback(supervised)
+
+  def _release(self, supervised):
+    """
+      Stops waiting for a process
+      @ In, supervised, SupervisedProcess, the process
+      @ Out, None
+    """
+    if supervised.pidfd is not None:
+      self._selector.unregister(supervised.pidfd)
+      os.close(supervised.pidfd)
+      supervised.pidfd = None
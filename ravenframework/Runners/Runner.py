@@ -37,6 +37,10 @@ class Runner(MessageUser):
     Generic base class for running codes and models in parallel environments
     both internally (shared data) and externally.
   """
+  # True if the runner invokes its completion callback when the job finishes,
+  # False if the owner needs to poll "isDone" to find out
+  signalsCompletion = False
+
   def __init__(self, identifier=None, metadata=None, uniqueHandler="any", profile=False):
     """
       Initialize command variable
@@ -56,6 +60,7 @@ class Runner(MessageUser):
     self.uniqueHandler  = uniqueHandler
     self.groupId        = None  # the id of the group this run belong to (batching, if activated)
     self.started        = False
+    self._completionCallback = None # callable invoked (no arguments) as soon as the job finishes
 
     ## First attempt to use a user-specified identifier name
     if identifier is not None:
@@ -123,6 +128,24 @@ class Runner(MessageUser):
     """
     return self.metadata
 
+  def setCompletionCallback(self, callback):
+    """
+      Sets the function to call as soon as the job associated with this Runner finishes.
+      It is only honored by Runners for which "signalsCompletion" is True.
+      @ In, callback, callable, function with no arguments (e.g. threading.Event.set)
+      @ Out, None
+    """
+    self._completionCallback = callback
+
+  def _notifyCompletion(self):
+    """
+      Invokes the completion callback, if any
+      @ In, None
+      @ Out, None
+    """
+    if self._completionCallback is not None:
+      self._completionCallback()
+
   def trackTime(self,event):
     """
       Records the time under 'event'.
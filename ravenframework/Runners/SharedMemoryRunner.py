@@ -37,6 +37,8 @@ class SharedMemoryRunner(InternalRunner):
     Class for running internal objects in a threaded fashion using the built-in
     threading library
   """
+  signalsCompletion = True
+
   def __init__(self, args, functionToRun, **kwargs):
     """
       Init method
@@ -57,6 +59,7 @@ class SharedMemoryRunner(InternalRunner):
 
     self.skipOnCopy.append('subque')
     self.thread = None
+    self.functionDone = False # set by the worker thread right before it signals completion
 
   def isDone(self):
     """
@@ -68,7 +71,7 @@ class SharedMemoryRunner(InternalRunner):
     if not self.started:
       return False
 
-    if self.thread is None:
+    if self.thread is None or self.functionDone:
       return True
     else:
       return not self.thread.is_alive()
@@ -112,19 +115,35 @@ class SharedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = InterruptibleThread(target = lambda q, *arg : q.append(self.functionToRun(*arg)),
+      self.functionDone = False
+      self.thread = InterruptibleThread(target = self._runAndNotify,
                                      name = self.identifier,
                                      args=(self.subque,) + tuple(self.args))
 
       self.thread.daemon = True
+      # set before starting, the function might be done before "start" returns
+      self.started = True
       self.thread.start()
       self.trackTime('runner_started')
-      self.started = True
     except Exception as ae:
       self.exceptionTrace = sys.exc_info()
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def _runAndNotify(self, subque, *args):
+    """
+      Target of the worker thread: runs the function, stores its outcome and
+      signals the completion of the job (also if the function raised)
+      @ In, subque, collections.deque, the container for the function outcome
+      @ In, args, list, the arguments to pass to the function
+      @ Out, None
+    """
+    try:
+      subque.append(self.functionToRun(*args))
+    finally:
+      self.functionDone = True
+      self._notifyCompletion()
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -29,7 +29,10 @@ from .InternalRunner import InternalRunner
 from .SharedMemoryRunner import SharedMemoryRunner
 from .RayRunner import RayRunner
 from .DaskRunner import DaskRunner
+from .ProcessPoolRunner import ProcessPoolRunner, SharedArguments
 from .PassthroughRunner import PassthroughRunner
+from .ExternalProcessRunner import ExternalProcessRunner
+from .ProcessSupervisor import ProcessSupervisor, SupervisedProcess
 from .Error import Error
 
 from .Factory import factory
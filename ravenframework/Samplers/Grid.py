@@ -26,7 +26,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 import sys
 import copy
 from operator import mul
-from functools import reduce
+from functools import reduce, partial
 import numpy as np
 # External Modules End------------------------------------------------------------------------------
 
@@ -86,6 +86,7 @@ class Grid(Sampler):
     self.externalgGridCoord = False    # boolean attribute. True if the coordinate list has been filled by external source (see factorial sampler)
     self.gridCoordinate = []           # current grid coordinates
     self.gridEntity = None
+    self.axisTables = {}               # {'name of the variable':{'ppf'/'pdf'/'cdf':{coordinate:value}}} evaluated on the grid nodes
 
   def localInputAndChecks(self, xmlNode, paramInput):
     """
@@ -154,6 +155,51 @@ class Grid(Sampler):
     """
     self.gridEntity.initialize()
     self.limit = self.gridEntity.len()
+    self._tabulateAxes()
+
+  def _tabulateAxes(self):
+    """
+      Evaluates, at once, the ppf, pdf and cdf of the 1D distributions on the nodes of their axis
+      (and, for the grids in value, on the middle points between the nodes), so that the points
+      of the grid look them up instead of calling the distributions point by point
+      @ In, None
+      @ Out, None
+    """
+    self.axisTables = {}
+    if not isinstance(self.gridEntity, GridEntities.GridEntity):
+      return
+    gridVectors = self.gridEntity.returnParameter('gridVectors')
+    for varName in self.axisName:
+      if varName not in gridVectors or varName not in self.variables2distributionsMapping:
+        continue
+      dist = self.distDict[varName]
+      if self.variables2distributionsMapping[varName]['totDim'] != 1 or not dist.isVectorized():
+        continue
+      nodes = np.asarray(gridVectors[varName], dtype=float)
+      tables = {}
+      if self.gridInfo[varName] == 'CDF':
+        coordinates = np.asarray(dist.ppf(nodes), dtype=float)
+        tables['ppf'] = dict(zip(nodes, coordinates))
+        cdfPoints = coordinates
+      else:
+        coordinates = nodes
+        cdfPoints = np.concatenate((nodes, (nodes[:-1] + nodes[1:])/2.0))
+      tables['pdf'] = dict(zip(coordinates, np.asarray(dist.pdf(coordinates), dtype=float)))
+      tables['cdf'] = dict(zip(cdfPoints, np.asarray(dist.cdf(cdfPoints), dtype=float)))
+      self.axisTables[varName] = tables
+
+  def _axisEvaluate(self, varName, method, x):
+    """
+      Evaluates the ppf, pdf or cdf of the distribution of an axis, from the tables of the grid nodes if available
+      @ In, varName, str, the name of the axis (variable)
+      @ In, method, str, the method of the distribution ('ppf', 'pdf' or 'cdf')
+      @ In, x, float, the coordinate
+      @ Out, value, float, the method evaluated in x
+    """
+    value = self.axisTables.get(varName, {}).get(method, {}).get(x, None)
+    if value is None:
+      value = getattr(self.distDict[varName], method)(x)
+    return value
 
   def localGenerateInput(self, model, oldInput):
     """
@@ -173,7 +219,7 @@ class Grid(Sampler):
       varName = self.axisName[i]
       if self.gridInfo[varName] == 'CDF':
         if self.distDict[varName].getDimensionality() == 1:
-          recastDict[varName] = [self.distDict[varName].ppf]
+          recastDict[varName] = [partial(self._axisEvaluate, varName, 'ppf')]
         else:
           recastDict[varName] = [self.distDict[varName].inverseMarginalDistribution,[self.variables2distributionsMapping[varName]['dim']-1]]
       elif self.gridInfo[varName] == 'value':
@@ -211,7 +257,7 @@ class Grid(Sampler):
           self.inputInfo['distributionName'][key] = self.toBeSampled[varName]
           self.inputInfo['distributionType'][key] = self.distDict[varName].type
           self.values[key] = coordinates[varName]
-          self.inputInfo['SampledVarsPb'][key] = self.distDict[varName].pdf(self.values[key])
+          self.inputInfo['SampledVarsPb'][key] = self._axisEvaluate(varName, 'pdf', self.values[key])
       # compute the SampledVarsPb for N-D distribution
       else:
         if self.variables2distributionsMapping[varName]['reducedDim'] == 1:
@@ -236,27 +282,27 @@ class Grid(Sampler):
         else:
           if self.gridInfo[varName]=='CDF':
             if coordinatesPlusOne[varName] != sys.maxsize and coordinatesMinusOne[varName] != -sys.maxsize:
-              midPlusCDF   = (coordinatesPlusOne[varName]+self.distDict[varName].cdf(self.values[key]))/2.0
-              midMinusCDF  = (coordinatesMinusOne[varName]+self.distDict[varName].cdf(self.values[key]))/2.0
+              midPlusCDF   = (coordinatesPlusOne[varName]+self._axisEvaluate(varName, 'cdf', self.values[key]))/2.0
+              midMinusCDF  = (coordinatesMinusOne[varName]+self._axisEvaluate(varName, 'cdf', self.values[key]))/2.0
             if coordinatesMinusOne[varName] == -sys.maxsize:
-              midPlusCDF   = (coordinatesPlusOne[varName]+self.distDict[varName].cdf(self.values[key]))/2.0
+              midPlusCDF   = (coordinatesPlusOne[varName]+self._axisEvaluate(varName, 'cdf', self.values[key]))/2.0
               midMinusCDF  = 0.0
             if coordinatesPlusOne[varName] == sys.maxsize:
               midPlusCDF   = 1.0
-              midMinusCDF  = (coordinatesMinusOne[varName]+self.distDict[varName].cdf(self.values[key]))/2.0
+              midMinusCDF  = (coordinatesMinusOne[varName]+self._axisEvaluate(varName, 'cdf', self.values[key]))/2.0
             gridWeight = midPlusCDF - midMinusCDF
           else:
             # Value
             if coordinatesPlusOne[varName] != sys.maxsize and coordinatesMinusOne[varName] != -sys.maxsize:
               midPlusValue   = (self.values[key]+coordinatesPlusOne[varName])/2.0
               midMinusValue  = (self.values[key]+coordinatesMinusOne[varName])/2.0
-              gridWeight = self.distDict[varName].cdf(midPlusValue) - self.distDict[varName].cdf(midMinusValue)
+              gridWeight = self._axisEvaluate(varName, 'cdf', midPlusValue) - self._axisEvaluate(varName, 'cdf', midMinusValue)
             if coordinatesMinusOne[varName] == -sys.maxsize:
               midPlusValue = (self.values[key]+coordinatesPlusOne[varName])/2.0
-              gridWeight = self.distDict[varName].cdf(midPlusValue) - 0.0
+              gridWeight = self._axisEvaluate(varName, 'cdf', midPlusValue) - 0.0
             if coordinatesPlusOne[varName] == sys.maxsize:
               midMinusValue  = (self.values[key]+coordinatesMinusOne[varName])/2.0
-              gridWeight = 1.0 - self.distDict[varName].cdf(midMinusValue)
+              gridWeight = 1.0 - self._axisEvaluate(varName, 'cdf', midMinusValue)
         self.inputInfo['ProbabilityWeight-'+varName] = gridWeight
         weight *= gridWeight
       # ND variable
@@ -307,5 +353,6 @@ class Grid(Sampler):
       @ Out, None
     """
     super().flush()
+    self.axisTables = {}
     if self.gridEntity is not None:
       self.gridEntity.flush()
@@ -62,6 +62,8 @@ class MonteCarlo(Sampler):
     samplerInitInput.addSub(samplingTypeInput)
     reseedEachIterationInput = InputData.parameterInputFactory("reseedEachIteration", contentType=InputTypes.StringType)
     samplerInitInput.addSub(reseedEachIterationInput)
+    designBlockSizeInput = InputData.parameterInputFactory("designBlockSize", contentType=InputTypes.IntegerType)
+    samplerInitInput.addSub(designBlockSizeInput)
 
     inputSpecification.addSub(samplerInitInput)
 
@@ -78,6 +80,11 @@ class MonteCarlo(Sampler):
     self.printTag = 'SAMPLER MONTECARLO'
     self.samplingType = None
     self.limit = None
+    self.designBlockSize = 1     # number of samples drawn at once (1 draws sample by sample)
+    self._blockSampling = False  # True if the samples are drawn by blocks of designBlockSize samples
+    self._design = {}            # current block of samples {'variable name':(values, pdfs)}
+    self._designRow = 0          # position of the next sample in the current block
+    self._designLength = 0       # number of samples in the current block
 
   def localInputAndChecks(self, xmlNode, paramInput):
     """
@@ -97,9 +104,50 @@ class MonteCarlo(Sampler):
           self.raiseAnError(IOError, self, f'Monte Carlo sampler {self.name}: specified type of samplingType is not recognized. Allowed type is: uniform')
       else:
         self.samplingType = None
+      if paramInput.findFirst('samplerInit').findFirst('designBlockSize') is not None:
+        self.designBlockSize = paramInput.findFirst('samplerInit').findFirst('designBlockSize').value
+        if self.designBlockSize < 1:
+          self.raiseAnError(IOError, f'Monte Carlo sampler {self.name}: designBlockSize must be a positive integer, got {self.designBlockSize}')
     else:
       self.raiseAnError(IOError, self, f'Monte Carlo sampler {self.name} needs the samplerInit block')
 
+  def localInitialize(self):
+    """
+      Will perform all initialization specific to this Sampler, checking if the samples can be drawn by blocks
+      @ In, None
+      @ Out, None
+    """
+    self._design = {}
+    self._designRow = 0
+    self._designLength = 0
+    self._blockSampling = False
+    if self.designBlockSize > 1:
+      notVectorized = [key for key in sorted(self.distDict) if self.variables2distributionsMapping[key]['totDim'] != 1 or not self.distDict[key].isVectorized()]
+      if self.reseedAtEachIteration or self.samplingType is not None or notVectorized:
+        reason = 'reseedEachIteration is requested' if self.reseedAtEachIteration else \
+                 f'samplingType "{self.samplingType}" is requested' if self.samplingType is not None else \
+                 f'the distributions of {", ".join(notVectorized)} cannot be evaluated on arrays'
+        self.raiseAWarning(f'Monte Carlo sampler {self.name}: designBlockSize is ignored since {reason}. Sampling one sample at a time.')
+      else:
+        self._blockSampling = True
+
+  def _generateDesignBlock(self):
+    """
+      Draws the next block of samples: the random numbers of the block are drawn at once (sample by sample,
+      variable by variable, as when sampling one sample at a time) and the ppf and pdf are evaluated on arrays
+      @ In, None
+      @ Out, None
+    """
+    keys = sorted(self.distDict)
+    # the block never goes beyond the limit, so that the random sequence is left where sampling one sample at a time leaves it
+    self._designLength = max(1, min(self.designBlockSize, self.limit - self.counter + 1))
+    uniforms = randomUtils.random(dim=len(keys), samples=self._designLength, keepMatrix=True)
+    self._design = {}
+    for column, key in enumerate(keys):
+      values = np.atleast_1d(self.distDict[key].ppf(uniforms[:, column]))
+      self._design[key] = (values, np.atleast_1d(self.distDict[key].pdf(values)))
+    self._designRow = 0
+
   def localGenerateInput(self, model, myInput):
     """
       Provides the next sample to take.
@@ -109,6 +157,11 @@ class MonteCarlo(Sampler):
       @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
       @ Out, None
     """
+    if self._blockSampling:
+      if self._designRow >= self._designLength:
+        self._generateDesignBlock()
+      row = self._designRow
+      self._designRow += 1
     # create values dictionary
     weight = 1.0
     for key in sorted(self.distDict):
@@ -133,11 +186,16 @@ class MonteCarlo(Sampler):
           midPlusCDF  = self.distDict[key].cdf(rvsnum + epsilon)
           midMinusCDF = self.distDict[key].cdf(rvsnum - epsilon)
           weight *= midPlusCDF - midMinusCDF
+        elif self._blockSampling:
+          rvsnum = self._design[key][0][row]
         else:
           rvsnum = self.distDict[key].rvs()
         for kkey in key.split(','):
           self.values[kkey] = np.atleast_1d(rvsnum)[0]
-        self.inputInfo['SampledVarsPb'][key] = self.distDict[key].pdf(rvsnum)
+        if self._blockSampling:
+          self.inputInfo['SampledVarsPb'][key] = self._design[key][1][row]
+        else:
+          self.inputInfo['SampledVarsPb'][key] = self.distDict[key].pdf(rvsnum)
         self.inputInfo['ProbabilityWeight-' + key] = 1.
       elif totDim > 1:
         if reducedDim == 1:
@@ -239,18 +239,18 @@ class Stratified(Grid):
         varCount += 1
         if self.gridInfo[varName] =='CDF':
           coordinate = lower + (upper-lower)*randomUtils.random()
-          ppfValue = self.distDict[varName].ppf(coordinate)
-          ppfLower = self.distDict[varName].ppf(min(upper,lower))
-          ppfUpper = self.distDict[varName].ppf(max(upper,lower))
-          gridWeight = self.distDict[varName].cdf(ppfUpper) - self.distDict[varName].cdf(ppfLower)
-          self.inputInfo['SampledVarsPb'][varName]  = self.distDict[varName].pdf(ppfValue)
+          ppfValue = self._axisEvaluate(varName, 'ppf', coordinate)
+          ppfLower = self._axisEvaluate(varName, 'ppf', min(upper,lower))
+          ppfUpper = self._axisEvaluate(varName, 'ppf', max(upper,lower))
+          gridWeight = self._axisEvaluate(varName, 'cdf', ppfUpper) - self._axisEvaluate(varName, 'cdf', ppfLower)
+          self.inputInfo['SampledVarsPb'][varName]  = self._axisEvaluate(varName, 'pdf', ppfValue)
         elif self.gridInfo[varName] == 'value':
-          coordinateCdf = self.distDict[varName].cdf(min(upper,lower)) + (self.distDict[varName].cdf(max(upper,lower))-self.distDict[varName].cdf(min(upper,lower)))*randomUtils.random()
+          coordinateCdf = self._axisEvaluate(varName, 'cdf', min(upper,lower)) + (self._axisEvaluate(varName, 'cdf', max(upper,lower))-self._axisEvaluate(varName, 'cdf', min(upper,lower)))*randomUtils.random()
           if coordinateCdf == 0.0:
             self.raiseAWarning(IOError, "The grid lower bound and upper bound in value will generate ZERO cdf value!!!")
-          coordinate = self.distDict[varName].ppf(coordinateCdf)
-          gridWeight = self.distDict[varName].cdf(max(upper,lower)) - self.distDict[varName].cdf(min(upper,lower))
-          self.inputInfo['SampledVarsPb'][varName] = self.distDict[varName].pdf(coordinate)
+          coordinate = self._axisEvaluate(varName, 'ppf', coordinateCdf)
+          gridWeight = self._axisEvaluate(varName, 'cdf', max(upper,lower)) - self._axisEvaluate(varName, 'cdf', min(upper,lower))
+          self.inputInfo['SampledVarsPb'][varName] = self._axisEvaluate(varName, 'pdf', coordinate)
         # compute the weight and ProbabilityWeight-varName
         weight *= gridWeight
         self.inputInfo['ProbabilityWeight-'+varName] = gridWeight
@@ -29,6 +29,7 @@ import copy
 from .SingleRun import SingleRun
 from .. import Models
 from ..utils import utils
+from ..utils import InputTypes
 from ..OutStreams import OutStreamEntity
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -47,8 +48,32 @@ class MultiRun(SingleRun):
     self._samplerInitDict = {}          # dictionary that gets sent to the initialization of the sampler
     self.counter = 0                    # counter of the runs already performed
     self._outputCollectionLambda = None # lambda function list to collect the output without checking the type
+    self._batchCollectionLambda = None  # lambda function list to collect the outputs of a batch of jobs at once
+    self.evaluationBatchSize = 1        # number of samples submitted to the model at once (if it can evaluate them in a single job)
     self.printTag = 'STEP MULTIRUN'
 
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super().getInputSpecification()
+    inputSpecification.addParam("evaluationBatchSize", InputTypes.IntegerType,
+        descr=r"""maximum number of samples submitted to the \xmlNode{Model} at once. If the model is
+              able to evaluate several samples in a single job (i.e. a static ROM whose engine predicts
+              a matrix of samples, such as the \xmlString{SciKitLearn} and \xmlString{NDspline} ROMs),
+              up to this number of samples are evaluated in a single job through a single evaluation
+              of the model, and the outcome is split back into a realization per sample. The
+              predictions obtained in this way can differ in the last digits (round-off) from the
+              ones obtained evaluating one sample at a time. Ignored by the models that are not able
+              to evaluate several samples at once and by the samplers generating their samples in batches.
+              \default{1}""")
+    return inputSpecification
+
   def _localInputAndCheckParam(self, paramInput):
     """
       Specialized reading, input consistency check and initialization of what will not change during
@@ -59,6 +84,9 @@ class MultiRun(SingleRun):
     SingleRun._localInputAndCheckParam(self,paramInput)
     if self.samplerType not in [item[0] for item in self.parList]:
       self.raiseAnError(IOError, 'Multi-run not possible without a sampler or optimizer!')
+    self.evaluationBatchSize = paramInput.parameterValues.get('evaluationBatchSize', 1)
+    if self.evaluationBatchSize < 1:
+      self.raiseAnError(IOError, f'The "evaluationBatchSize" of Step "{self.name}" must be a positive integer, got {self.evaluationBatchSize}!')
 
   def _initializeSampler(self, inDictionary):
     """
@@ -100,15 +128,19 @@ class MultiRun(SingleRun):
     self._initializeSampler(inDictionary)
     #generate lambda function list to collect the output without checking the type
     self._outputCollectionLambda = []
+    self._batchCollectionLambda = []
     # set up output collection lambdas
     for outIndex, output in enumerate(inDictionary['Output']):
       if not isinstance(output, OutStreamEntity):
         if 'SolutionExport' in inDictionary and output.name == inDictionary['SolutionExport'].name:
           self._outputCollectionLambda.append((lambda x:None, outIndex))
+          self._batchCollectionLambda.append((lambda x:None, outIndex))
         else:
           self._outputCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutput(x[0],x[1]), outIndex) )
+          self._batchCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputs(x[0],x[1]), outIndex) )
       else:
         self._outputCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
+        self._batchCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
     self._registerMetadata(inDictionary)
     self.raiseADebug(f'Generating input batch of size {inDictionary["jobHandler"].runInfoDict["batchSize"]}')
     # set up and run the first batch of samples
@@ -119,6 +151,22 @@ class MultiRun(SingleRun):
       if not model.amITrained:
         model.raiseAnError(RuntimeError, f'ROM model "{model.name}" has not been trained yet, so it cannot be sampled!'+\
                                         ' Use a RomTrainer step to train it.')
+    if self._evaluateInBatches(inDictionary[self.samplerType], model):
+      submitted = 0
+      batchSize = inDictionary['jobHandler'].runInfoDict['batchSize']
+      while submitted < batchSize:
+        size = min(self.evaluationBatchSize, batchSize - submitted)
+        try:
+          nSamples = self._submitBatch(inDictionary[self.samplerType], model, inDictionary['Input'], inDictionary['Output'], inDictionary['jobHandler'], size)
+        except utils.NoMoreSamplesNeeded:
+          self.raiseAMessage('Sampler returned "NoMoreSamplesNeeded".  Continuing...')
+          break
+        if nSamples > 0:
+          self.raiseAMessage(f'Submitted inputs {submitted+1} to {submitted+nSamples} as a single batch')
+        submitted += nSamples
+        if nSamples < size:
+          break
+      return
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
       if inDictionary[self.samplerType].amIreadyToProvideAnInput():
         try:
@@ -162,7 +210,8 @@ class MultiRun(SingleRun):
         #           in case of BATCHING, the finalizeActualSampling method MUST BE called ONCE/BATCH
         #           otherwise, the finalizeActualSampling method MUST BE called ONCE/job
         # FIXME: This method needs to be improved since it is very intrusise
-        if type(finishedJobObjs).__name__ in 'list':
+        isBatch = type(finishedJobObjs).__name__ in 'list'
+        if isBatch:
           finishedJobList = finishedJobObjs
           self.raiseADebug(f'BATCHING: Collecting JOB batch named "{finishedJobList[0].groupId}".')
         else:
@@ -172,8 +221,10 @@ class MultiRun(SingleRun):
           finishedJob.trackTime('step_collected')
           # update number of collected runs
           self.counter += 1
-          # collect run if it succeeded
+          # collect run if it succeeded (the successful jobs of a batch are collected at once below)
           if finishedJob.getReturnCode() == 0:
+            if isBatch:
+              continue
             for myLambda, outIndex in self._outputCollectionLambda:
               myLambda([finishedJob,outputs[outIndex]])
               self.raiseAMessage(f'Just collected job {finishedJob.identifier} and sent to output "{inDictionary["Output"][outIndex].name}"')
@@ -213,6 +264,11 @@ class MultiRun(SingleRun):
           currentFailures.sort(reverse=True)
           for idx in currentFailures:
             finishedJobList.pop(idx)
+        if isBatch and finishedJobList:
+          # the realizations of a batch are ingested in the outputs in one shot
+          for myLambda, outIndex in self._batchCollectionLambda:
+            myLambda([finishedJobList,outputs[outIndex]])
+            self.raiseAMessage(f'Just collected jobs {", ".join(job.identifier for job in finishedJobList)} and sent to output "{inDictionary["Output"][outIndex].name}"')
 
         if isinstance(finishedJobObjs, list): # TODO: should be consistent, if no batching should batch size be 1 or 0 ?
           # if sampler claims it's batching, then only collect once, since it will collect the batch
@@ -263,7 +319,8 @@ class MultiRun(SingleRun):
         # NOTE for some reason submission outside collection breaks the DET
         # however, it is necessary i.e. batch sampling
         self._addNewRuns(sampler, model, inputs, outputs, jobHandler, inDictionary, verbose=False)
-      time.sleep(self.sleepTime)
+      # block until some job is started or finished (at most sleepTime seconds)
+      jobHandler.waitForJobEvents(self.sleepTime)
     # END while loop that runs the step iterations (collection and submission-for-DET)
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
@@ -293,6 +350,24 @@ class MultiRun(SingleRun):
     # So, we take the minimum of these two values.
     if verbose:
       self.raiseADebug('Testing if the sampler is ready to generate a new input')
+    if self._evaluateInBatches(sampler, model):
+      # each available spot takes a batch of samples, within the number of inputs the sampler allows
+      runnable = sampler.endJobRunnable()
+      for _ in range(jobHandler.availability(isEnsemble)):
+        size = min(self.evaluationBatchSize, runnable)
+        if size < 1:
+          break
+        try:
+          nSamples = self._submitBatch(sampler, model, inputs, outputs, jobHandler, size)
+        except utils.NoMoreSamplesNeeded:
+          self.raiseAMessage(' ... Sampler returned "NoMoreSamplesNeeded".  Continuing...')
+          break
+        runnable -= nSamples
+        if nSamples < size:
+          if verbose:
+            self.raiseADebug(' ... sampler has no new inputs currently.')
+          break
+      return
     for _ in range(min(jobHandler.availability(isEnsemble), sampler.endJobRunnable())):
       if sampler.amIreadyToProvideAnInput():
         try:
@@ -310,6 +385,43 @@ class MultiRun(SingleRun):
       if verbose:
         self.raiseADebug(' ... no available JobHandler spots currently (or the Sampler is done.)')
 
+  def _evaluateInBatches(self, sampler, model):
+    """
+      Checks if the samples are submitted to the model in batches, each one evaluated in a single job
+      @ In, sampler, Sampler, the sampler in charge of generating the samples
+      @ In, model, Model, the model in charge of evaluating the samples
+      @ Out, inBatches, bool, True if the samples are submitted in batches
+    """
+    # the samplers generating their samples in batches (e.g. GA) already wait for the whole batch
+    return self.evaluationBatchSize > 1 and not sampler.inputInfo.get('batchMode', False) and model.canEvaluateBatch()
+
+  def _submitBatch(self, sampler, model, inputs, outputs, jobHandler, size):
+    """
+      Collects up to "size" new samples from the sampler and submits them to the model as a single batch
+      @ In, sampler, Sampler, the sampler in charge of generating the samples
+      @ In, model, Model, the model in charge of evaluating the samples
+      @ In, inputs, object, the raven object used as the input in this step
+      @ In, outputs, object, the raven object used as the output in this step
+      @ In, jobHandler, object, the raven object used to handle jobs
+      @ In, size, int, maximum number of samples in the batch
+      @ Out, nSamples, int, number of samples taken from the sampler (including the ones found in restart)
+    """
+    newInputs = []
+    kwargsList = []
+    nSamples = 0
+    try:
+      while nSamples < size and sampler.amIreadyToProvideAnInput():
+        newInput = self._findANewInputToRun(sampler, model, inputs, outputs, jobHandler)
+        nSamples += 1
+        if newInput is not None:
+          newInputs.append(newInput)
+          kwargsList.append(copy.deepcopy(sampler.inputInfo))
+    finally:
+      # the samples collected before the sampler stopped are submitted anyway
+      if newInputs:
+        model.submitBatch(newInputs, sampler.type, jobHandler, kwargsList)
+    return nSamples
+
   def _findANewInputToRun(self, sampler, model, inputs, outputs, jobHandler):
     """
       Repeatedly calls Sampler until a new run is found or "NoMoreSamplesNeeded" is raised.
@@ -350,3 +462,4 @@ class MultiRun(SingleRun):
     self._samplerInitDict = {}
     self.counter = 0
     self._outputCollectionLambda = None
+    self._batchCollectionLambda = None
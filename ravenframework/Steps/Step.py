@@ -67,7 +67,7 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
     """
     super().__init__(**kwargs)
     self.parList    = []   # List of list [[role played in the step, class type, specialization, global name (user assigned by the input)]]
-    self.sleepTime  = 0.005  # Waiting time before checking if a run is finished
+    self.sleepTime  = 0.005  # Maximum waiting time before checking if a run is finished
     # If a step possess re-seeding instruction it is going to ask to the sampler to re-seed according
     #  re-seeding = a number to be used as a new seed
     #  re-seeding = 'continue' the use the already present random environment
@@ -100,7 +100,8 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
                        \xmlNode{MultiRun} XML block."""
 
     inputSpecification.addParam("sleepTime", InputTypes.FloatType,
-        descr='Determines the wait time between successive iterations within this step, in seconds.')
+        descr='Determines the maximum wait time between successive iterations within this step, in seconds. '
+              'The step moves to the next iteration earlier as soon as a job is started or finished.')
     inputSpecification.addParam("re-seeding", InputTypes.StringType, descr=r"""
               this optional
               attribute could be used to control the seeding of the random number generator (RNG).
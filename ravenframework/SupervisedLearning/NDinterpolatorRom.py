@@ -34,6 +34,7 @@ class NDinterpolatorRom(SupervisedLearning):
   """
   A Reduced Order Model for interpolating N-dimensional data
   """
+  batchEvaluation = True # the samples (rows) are interpolated one after the other in a single call
   def __init__(self):
     """
       A constructor that will appropriately intialize a supervised learning object
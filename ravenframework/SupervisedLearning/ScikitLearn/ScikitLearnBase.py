@@ -37,6 +37,7 @@ class ScikitLearnBase(SupervisedLearning):
     Base Class for Scikitlearn-based surrogate models (classifiers and regressors)
   """
   info = {'problemtype':None, 'normalize':None}
+  batchEvaluation = True # the estimators predict a matrix of samples at once
 
   def __init__(self):
     """
@@ -212,7 +213,10 @@ class ScikitLearnBase(SupervisedLearning):
       except TypeError:
         outcomes = self.model.predict(featureVals)
     outcomes = np.atleast_1d(outcomes)
-    if len(outcomes.shape) == 1:
+    if len(outcomes.shape) == 1 and len(self.target) == 1 and len(featureVals) > 1:
+      # single target evaluated at several samples
+      returnDict = {self.target[0]: outcomes}
+    elif len(outcomes.shape) == 1:
       returnDict = {key:value for (key,value) in zip(self.target,outcomes)}
     else:
       returnDict = {key: outcomes[:, i] for i, key in enumerate(self.target)}
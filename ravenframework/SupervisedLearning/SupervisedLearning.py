@@ -48,6 +48,8 @@ class SupervisedLearning(BaseInterface):
                            # 'boolean', 'integer', 'float'
   qualityEstType   = []    # this describe the type of estimator returned known type are 'distance', 'probability'.
                            # The values are returned by the self.__confidenceLocal__(Features)
+  batchEvaluation  = False # True if __evaluateLocal__ evaluates a matrix of samples (one per row) at once, returning
+                           # an array of values per target (see canEvaluateBatch)
   @classmethod
   def getInputSpecification(cls):
     """
@@ -691,6 +693,16 @@ class SupervisedLearning(BaseInterface):
     """
     return self._dynamicHandling
 
+  def canEvaluateBatch(self):
+    """
+      This method is a utility function that tells if several samples can be evaluated
+      at once, through a single call to the evaluate method with an array of values per feature
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if a batch of samples can be evaluated at once
+    """
+    targetTransformation = self.performFeatureSpaceTransformation and self.featureSpaceTransformationSettings['whichSpace'] == 'target'
+    return self.batchEvaluation and not self.dynamicFeatures and not self.isDynamic() and not targetTransformation
+
   def reseed(self,seed):
     """
       Used to reset the seed of the ROM.  By default does nothing; overwrite in the inheriting classes as needed.
@@ -18,6 +18,7 @@ import copy
 import collections
 import numpy as np
 import scipy as sp
+import scipy.signal
 
 from .. import Decorators
 
@@ -369,29 +370,91 @@ class ARMA(TimeSeriesGenerator, TimeSeriesCharacterizer, TimeSeriesTransformer):
       @ In, settings, dict, settings for this ROM
       @ Out, synthetic, np.array(float), synthetic ARMA signal
     """
-    # TODO if there's not a model, generate one?
-    # -> I think we need the training signal though ...
-    synthetic = np.zeros((len(pivot), len(params)))
+    return self.generateMany(params, pivot, settings, 1)[0]
+
+  def generateMany(self, params, pivot, settings, numSamples):
+    """
+      Generates several synthetic histories at once from fitted parameters. The random numbers are
+      drawn in the same order as by "numSamples" successive calls to "generate", so that the histories
+      are the same as the ones obtained one at a time.
+      @ In, params, dict, characterization such as otained from self.characterize()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, settings for this ROM
+      @ In, numSamples, int, number of synthetic histories to generate
+      @ Out, synthetic, np.array(float), synthetic ARMA signals shaped [numSamples, pivotValues, targets]
+    """
+    size = len(pivot)
+    # noise for each sample and target, as drawn by successive calls to "generate"
+    noise = [[self._generateNoise(data['arma'], size) for data in params.values()] for _ in range(numSamples)]
+    synthetic = np.zeros((numSamples, size, len(params)))
     for t, (target, data) in enumerate(params.items()):
       armaData = data['arma']
-      P,d,Q = armaData['lags']
-      modelParams = np.r_[armaData.get('const', 0), armaData['ar'], armaData['ma'], armaData.get('var', 1)]
-      msrShocks, stateShocks, initialState = self._generateNoise(armaData, synthetic.shape[0])
-      # measurement shocks
-      import statsmodels.api
-      model = statsmodels.tsa.arima.model.ARIMA(synthetic[:,t], order=(P, d, Q), trend='c')
-      # produce sample
-      new = model.simulate(modelParams,
-                           synthetic.shape[0],
-                           measurement_shocks=msrShocks,
-                           state_shocks=stateShocks,
-                           initial_state=initialState)
+      msrShocks = np.array([noise[n][t][0].ravel() for n in range(numSamples)])
+      stateShocks = np.array([noise[n][t][1].ravel() for n in range(numSamples)])
+      # as in statsmodels, the initial state is the first column of the sampled initial states
+      initialStates = np.array([noise[n][t][2][:, 0] for n in range(numSamples)])
+      if armaData['lags'][1] == 0:
+        new = self._simulate(armaData, msrShocks, stateShocks, initialStates)
+      else:
+        # the state space of the integrated models also holds the differencing, left to statsmodels
+        new = np.array([self._simulateIntegrated(armaData, size, *noise[n][t]) for n in range(numSamples)])
       if settings.get('gaussianize', True):
         # back-transform through CDF
         new = mathUtils.degaussianize(new, params[target]['cdf'])
-      synthetic[:, t] = new
+      synthetic[:, :, t] = new
     return synthetic
 
+  def _simulate(self, armaData, msrShocks, stateShocks, initialStates):
+    """
+      Simulates the (non-integrated) ARMA state space model (as in statsmodels, Harvey representation)
+        y_t = c + x_t[0] + e_t
+        x_{t+1} = T x_t + R w_t
+      for several samples at once. The state recursion is the ARMA difference equation, run
+      as a linear filter over the state shocks, with the initial state as filter conditions.
+      @ In, armaData, dict, trained ARMA parameters (const, ar, ma)
+      @ In, msrShocks, np.array, measurement shocks (e) shaped [samples, time]
+      @ In, stateShocks, np.array, state shocks (w) shaped [samples, time]
+      @ In, initialStates, np.array, initial states (x_0) shaped [samples, states]
+      @ Out, signal, np.array, simulated signals shaped [samples, time]
+    """
+    ar = np.asarray(armaData['ar'], dtype=float)
+    ma = np.asarray(armaData['ma'], dtype=float)
+    order = max(len(ar), len(ma))
+    numSamples, size = stateShocks.shape
+    signal = np.empty((numSamples, size))
+    signal[:, 0] = initialStates[:, 0]
+    if size > 1:
+      if order == 0:
+        signal[:, 1:] = stateShocks[:, :-1]
+      else:
+        # filter conditions equivalent to x_0: zi_k = ar_{k+1} x_0[0] + x_0[k+1]
+        arPadded = np.r_[ar, np.zeros(order - len(ar))]
+        states = np.zeros((numSamples, order + 1))
+        states[:, :min(initialStates.shape[1], order + 1)] = initialStates[:, :order + 1]
+        zi = arPadded[np.newaxis, :] * initialStates[:, :1] + states[:, 1:]
+        signal[:, 1:], _ = sp.signal.lfilter(np.r_[1., ma], np.r_[1., -ar], stateShocks[:, :-1], axis=-1, zi=zi)
+    return armaData.get('const', 0) + signal + msrShocks
+
+  def _simulateIntegrated(self, armaData, size, msrShocks, stateShocks, initialState):
+    """
+      Simulates an integrated (d > 0) ARIMA model through statsmodels
+      @ In, armaData, dict, trained ARMA parameters
+      @ In, size, int, length of time-like variable
+      @ In, msrShocks, np.array, measurement shocks
+      @ In, stateShocks, np.array, state shocks
+      @ In, initialState, np.array, initial random state
+      @ Out, signal, np.array, simulated signal
+    """
+    import statsmodels.api
+    P, d, Q = armaData['lags']
+    modelParams = np.r_[armaData.get('const', 0), armaData['ar'], armaData['ma'], armaData.get('var', 1)]
+    model = statsmodels.tsa.arima.model.ARIMA(np.zeros(size), order=(P, d, Q), trend='c')
+    return model.simulate(modelParams,
+                          size,
+                          measurement_shocks=msrShocks,
+                          state_shocks=stateShocks,
+                          initial_state=initialState)
+
   def writeXML(self, writeTo, params):
     """
       Allows the engine to put whatever it wants into an XML to print to file.
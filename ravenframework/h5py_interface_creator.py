@@ -18,6 +18,8 @@ Created on Mar 25, 2013
 """
 from datetime import datetime
 import os
+import atexit
+import weakref
 import pickle as pk
 import string
 import difflib
@@ -283,6 +285,15 @@ class hdf5Database(InputDataUser, MessageUser):
     self.__updateFileLevelInfoDatasets()
     self.h5FileW.flush()
 
+  def addGroups(self, rlzs):
+    """
+      Function to add many groups into the database
+      @ In, rlzs, list(dict), the realizations with the data and metadata to add
+      @ Out, None
+    """
+    for rlz in rlzs:
+      self.addGroup(rlz)
+
   def addGroupInit(self, groupName, attributes=None):
     """
       Function to add an empty group to the database
@@ -502,6 +513,14 @@ class hdf5Database(InputDataUser, MessageUser):
 
     return workingList
 
+  def retrieveRealizations(self, names):
+    """
+      Function to retrieve many realizations at once
+      @ In, names, list(str), the realization (group) names
+      @ Out, allData, list(dict), the realizations, in the same order as names
+    """
+    return [self._getRealizationByName(name, {'reconstruct': False})[0] for name in names]
+
   def __getListOfParentGroups(self, grp, backGroups = None):
     """
       Method to get the list of groups from the deepest to the root, given a certain group
@@ -631,3 +650,731 @@ class hdf5Database(InputDataUser, MessageUser):
       parentGroupName = '/'
 
     return parentGroupName
+
+#
+#  ***********************************
+#  *  HDF5 COLUMNAR DATABASE CLASS   *
+#  ***********************************
+#
+
+# the columnar database version should be modified
+# everytime a new modification of its internal
+# structure is performed
+_hdf5ColumnarDatabaseVersion = "c1.0"
+
+# columnar databases with realizations not written to file yet
+_pendingDatabases = weakref.WeakSet()
+
+@atexit.register
+def _writeAllPending():
+  """
+    Writes the pending realizations of all the columnar databases at exit
+    (registered after h5py is imported, so it runs before h5py closes the files)
+    @ In, None
+    @ Out, None
+  """
+  for database in list(_pendingDatabases):
+    if database.fileOpen:
+      database.writePending()
+
+def _appendToDataset(dataset, values, start):
+  """
+    Writes values into a resizable dataset starting at a given position,
+    growing the dataset geometrically if needed
+    @ In, dataset, h5py.Dataset, resizable 1D dataset
+    @ In, values, np.ndarray, values to write
+    @ In, start, int, position of the first value (number of valid entries in the dataset)
+    @ Out, end, int, number of valid entries in the dataset after the write
+  """
+  end = start + len(values)
+  if end > dataset.shape[0]:
+    dataset.resize((max(end, 2*dataset.shape[0]),))
+  if len(values):
+    dataset[start:end] = values
+  return end
+
+class _Column:
+  """
+    Handle of a variable stored in an hdf5ColumnarDatabase, caching its datasets and
+    attributes (the h5py lookups are expensive compared to the appending of a realization)
+    and the position of the values of each group in the flat array of values, so that the
+    values of a few groups can be read without reading the whole column.
+  """
+  def __init__(self, group, nRows):
+    """
+      Constructor
+      @ In, group, h5py.Group, the group hosting the variable datasets
+      @ In, nRows, int, number of groups (rows) already stored in the file
+      @ Out, None
+    """
+    self.group = group
+    self.scalar = bool(group.attrs["scalar"])
+    self.size = int(group.attrs["size"])
+    self.values = group["values"]
+    self.lengths = group["lengths"]
+    self.nRows = 0
+    self._lengths = np.zeros(0, dtype=np.int64) # number of values of each row (-1 if not in the row)
+    self._starts = np.zeros(0, dtype=np.int64)  # position of the first value of each row
+    if nRows:
+      self.__index(self.lengths[:nRows].astype(np.int64), 0)
+
+  def __index(self, lengths, firstValue):
+    """
+      Indexes the values of new rows (appended after the ones already indexed)
+      @ In, lengths, np.ndarray(int), the number of values in each new row (-1 if not in the row)
+      @ In, firstValue, int, position of the first value of the new rows
+      @ Out, None
+    """
+    end = self.nRows + len(lengths)
+    if end > len(self._lengths):
+      capacity = max(end, 2*len(self._lengths))
+      self._lengths = np.resize(self._lengths, capacity)
+      self._starts = np.resize(self._starts, capacity)
+    counts = np.maximum(lengths, 0)
+    self._lengths[self.nRows:end] = lengths
+    self._starts[self.nRows:end] = firstValue + np.cumsum(counts) - counts
+    self.nRows = end
+
+  def locate(self, rows):
+    """
+      Locates the values of some rows in the flat array of values
+      @ In, rows, np.ndarray(int), the rows
+      @ Out, lengths, np.ndarray(int), the number of values of each row (-1 if not in the row)
+      @ Out, starts, np.ndarray(int), the position of the first value of each row
+    """
+    return self._lengths[rows], self._starts[rows]
+
+  def read(self, starts, lengths):
+    """
+      Reads the values of some rows, reading from file the span of the values if the rows are
+      close to each other or the values of each row otherwise (not to decompress the whole column)
+      @ In, starts, np.ndarray(int), the position of the first value of each row
+      @ In, lengths, np.ndarray(int), the number of values of each row (all non negative)
+      @ Out, localStarts, np.ndarray(int), the position of the first value of each row in values
+      @ Out, values, np.ndarray, the values read
+    """
+    if not len(starts):
+      return starts, self.values[0:0]
+    first = int(starts.min())
+    last = int((starts + lengths).max())
+    # each value read separately costs (at least) the decompression of a chunk
+    if len(starts) * self.values.chunks[0] >= last - first:
+      return starts - first, self.values[first:last]
+    values = np.concatenate([self.values[start:start + length] for start, length in zip(starts, lengths)])
+    return np.cumsum(lengths) - lengths, values
+
+  def append(self, values, lengths, start):
+    """
+      Appends the values taken by the variable in new groups
+      @ In, values, np.ndarray, the flat array of the new values
+      @ In, lengths, np.ndarray, the number of values in each new group (-1 if not in the group)
+      @ In, start, int, row of the first new group
+      @ Out, None
+    """
+    firstValue = self.size
+    if len(values):
+      self.size = _appendToDataset(self.values, values, self.size)
+      self.group.attrs["size"] = self.size
+    _appendToDataset(self.lengths, lengths, start)
+    self.__index(np.asarray(lengths, dtype=np.int64), firstValue)
+
+class _LazyColumn:
+  """
+    Array-like, picklable reader of the values of a variable stored in an hdf5ColumnarDatabase,
+    backing the dask arrays of the lazily loaded data (the file is opened, read only, on first
+    access in each process)
+  """
+  def __init__(self, path, column):
+    """
+      Constructor
+      @ In, path, str, the database file (full path)
+      @ In, column, _Column, the variable to read
+      @ Out, None
+    """
+    self.path = path
+    self.name = column.values.name
+    self.shape = (column.size,)
+    self.ndim = 1
+    self.dtype = column.values.dtype
+    self.chunks = column.values.chunks
+    self._file = None
+    self._dataset = None
+
+  def __getstate__(self):
+    """
+      Get the state (for pickling), without the file handle
+      @ In, None
+      @ Out, state, dict, the namespace state
+    """
+    state = self.__dict__.copy()
+    state['_file'] = None
+    state['_dataset'] = None
+    return state
+
+  def __getitem__(self, key):
+    """
+      Reads values from file
+      @ In, key, slice or tuple, the values to read
+      @ Out, values, np.ndarray, the values
+    """
+    if self._dataset is None:
+      self._file = h5.File(self.path, 'r')
+      self._dataset = self._file[self.name]
+    return self._dataset[key]
+
+  def close(self):
+    """
+      Closes the file handle (reopened if values are read again)
+      @ In, None
+      @ Out, None
+    """
+    if self._file is not None:
+      self._file.close()
+    self._file = None
+    self._dataset = None
+
+class hdf5ColumnarDatabase(InputDataUser, MessageUser):
+  """
+    class to create a h5py (hdf5) database storing each variable in a single resizable, chunked
+    and compressed dataset ("columnar" layout), instead of creating a group per realization.
+    The file contains:
+      * "groups", the tables describing the realizations (the "groups" of the hdf5Database):
+          "names" (group names), "parents" (row of the parent group, -1 for the file root, giving
+          the hierarchy of the DET branches) and "ends" (false for the root groups created by addGroupInit);
+      * "columns", one sub-group per variable with the flat array of its values ("values") and
+        the number of values taken in each realization ("lengths", -1 if not in the realization).
+        Numeric variables are stored as floats, any other type is pickled and stored as bytes.
+    The realizations are written to file in blocks of "chunkSize" realizations (and whenever
+    the database is read or closed), instead of one at a time.
+  """
+  # number of entries in each chunk of the datasets
+  chunkSize = 1024
+
+  def __init__(self, name, databaseDir, filename, exist, variables=None, compression='gzip'):
+    """
+      Constructor
+      @ In, name, string, name of this database
+      @ In, databaseDir, string, database directory (full path)
+      @ In, filename, string, the database filename
+      @ In, exist, bool, does it exist?
+      @ In, variables, list, the user wants to store just some specific variables (default =None => all variables are stored)
+      @ In, compression, str, optional, compression filter of the datasets ("gzip", "lzf" or None)
+      @ Out, None
+    """
+    super().__init__()
+    self.name = name       # database name (i.e. arbitrary name) found in the xml input
+    self.variables = variables
+    self.type = None       # Database type -> "inferred" by the first group is added (MC or DET)
+    self.printTag = 'DATABASE HDF5' # specialize printTag
+    self.fileExist = exist # does it exist?
+    self.onDiskFile = filename # .H5 file name (to be created or read) on disk
+    self.databaseDir =  databaseDir # Database directory
+    self.filenameAndPath = os.path.join(self.databaseDir, self.onDiskFile)
+    self.compression = compression
+    self.fileOpen = False
+    self.firstRootGroup = False # true if the root group is present (or added), false otherwise
+    self.parentRow = -1         # row of the group the root level realizations are added to (-1 => file root)
+    self.names = []             # group names, one per row
+    self.parents = []           # row of the parent group, one per row
+    self.ends = []              # true if the group is a realization, false if created by addGroupInit, one per row
+    self.rows = {}              # {group name: row}
+    self.columns = {}           # {variable name: _Column}
+    self.groupTables = {}       # {table name: h5py.Dataset}, the datasets describing the groups
+    self.pending = []           # realizations added to the group tables but not written to file yet
+    self._lazyColumns = []      # readers backing the lazily loaded data (see retrieveLazyDataset)
+    if self.fileExist:
+      if not os.path.exists(self.filenameAndPath):
+        self.raiseAnError(IOError, 'database file has not been found, searched Path is: ' + self.filenameAndPath )
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath, 'r+')
+      version = self.h5FileW.attrs.get("version", "None")
+      if version != _hdf5ColumnarDatabaseVersion:
+        self.raiseAnError(IOError, 'HDF5 RAVEN columnar version (read mode) is not supported. ' +
+                          f'Current version is "{_hdf5ColumnarDatabaseVersion}". ' +
+                          f'Version in HDF5 is "{version}".')
+      self.__createObjFromFile()
+      self.firstRootGroup = True
+    else:
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath, 'w')
+      self.__createFileLevelInfoDatasets()
+
+  def __len__(self):
+    """
+      Overload len method
+      @ In, None
+      @ Out, __len__, length (number of groups, file root included, as in hdf5Database)
+    """
+    return len(self.names) + 1
+
+  def __createDataset(self, parent, name, dtype):
+    """
+      Creates an empty, resizable, chunked (and compressed) 1D dataset
+      @ In, parent, h5py.Group, the group hosting the dataset
+      @ In, name, str, the dataset name
+      @ In, dtype, np.dtype, the dataset type
+      @ Out, dataset, h5py.Dataset, the new dataset
+    """
+    return parent.create_dataset(name, shape=(0,), maxshape=(None,), dtype=dtype, chunks=(self.chunkSize,),
+                                 compression=self.compression, shuffle=self.compression is not None)
+
+  def __createFileLevelInfoDatasets(self):
+    """
+      Method to create the datasets describing the groups and the file level info
+      @ In, None
+      @ Out, None
+    """
+    self.h5FileW.attrs["version"] = _hdf5ColumnarDatabaseVersion
+    self.h5FileW.attrs["layout"] = "columnar"
+    self.h5FileW.attrs["nGroups"] = 0
+    groups = self.h5FileW.create_group("groups")
+    self.groupTables["names"] = self.__createDataset(groups, "names", h5.string_dtype())
+    self.groupTables["parents"] = self.__createDataset(groups, "parents", np.int64)
+    self.groupTables["ends"] = self.__createDataset(groups, "ends", bool)
+    self.h5FileW.create_group("columns")
+    self.h5FileW.create_group("rootGroups")
+
+  def __createObjFromFile(self):
+    """
+      Function to load the group tables and the columns from a database that already exists
+      @ In, None
+      @ Out, None
+    """
+    if not self.fileOpen:
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath,'a')
+    if "groups" not in self.h5FileW:
+      # the database is empty. An error must be raised
+      self.raiseAnError(IOError, 'The database '+str(self.name) + ' is empty but "readMode" is "read"!')
+    nGroups = self.h5FileW.attrs["nGroups"]
+    groups = self.h5FileW["groups"]
+    self.names = [utils.toString(name) for name in groups["names"][:nGroups]]
+    self.parents = groups["parents"][:nGroups].tolist()
+    self.ends = groups["ends"][:nGroups].tolist()
+    self.rows = dict((name, row) for row, name in enumerate(self.names))
+    self.groupTables = dict(groups.items())
+    self.columns = dict((column.attrs["name"], _Column(column, nGroups)) for column in self.h5FileW["columns"].values())
+    self.raiseAMessage('TOTAL NUMBER OF GROUPS = ' + str(len(self)))
+
+  def addExpectedMeta(self, keys, params={}):
+    """
+      Store expected metadata
+      @ In, keys, set(), the metadata list
+      @ In, params, dict, optional, {key:[indexes]}, keys of the dictionary are the variable names,
+        values of the dictionary are lists of the corresponding indexes/coordinates of given variable
+      @ Out, None
+    """
+    self.h5FileW.attrs['expectedMetadata'] = _dumps(list(keys))
+
+  def provideExpectedMetaKeys(self):
+    """
+      Provides the registered list of metadata keys for this entity.
+      @ In, None
+      @ Out, meta, tuple, (set(str),dict), expected keys (empty if none) and dictionary of expected keys corresponding to their indexes
+        i.e. {keys, [indexes]}
+    """
+    meta = set()
+    gotMeta = self.h5FileW.attrs.get('expectedMetadata',None)
+    if gotMeta is not None:
+      meta = set(_loads(gotMeta))
+    return meta, {}
+
+  def addGroup(self, rlz):
+    """
+      Function to add a group (realization) into the database
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    self.addGroups([rlz])
+
+  def addGroups(self, rlzs):
+    """
+      Function to add many groups (realizations) into the database at once
+      @ In, rlzs, list(dict), the realizations with the data and metadata to add
+      @ Out, None
+    """
+    if not self.fileOpen:
+      self.__createObjFromFile()
+    for rlz in rlzs:
+      parentID  = rlz.get("RAVEN_parentID", [None])[0]
+      prefix    = rlz.get("prefix")
+      groupName = str(prefix if mathUtils.isSingleValued(prefix) else prefix[0])
+      if parentID and self.firstRootGroup and parentID != "None":
+        # Add sub group in the Hierarchical structure
+        parent = self.__findParent(parentID)
+        if groupName in self.rows:
+          groupName = groupName + "_" + groupName
+        self.raiseAMessage('Adding group named "' + groupName + '" in Database "'+ self.name +'"')
+      else:
+        # root level (parallel structure or root of the hierarchical one)
+        parent = self.parentRow
+        while groupName in self.rows:
+          groupName = groupName + "_" + groupName
+        self.firstRootGroup = True
+        self.type = 'DET' if parentID else 'MC'
+      # as in hdf5Database, all the realizations are listed as ending groups (DET branches included)
+      self.__appendRow(groupName, parent, True)
+    self.pending.extend(rlzs)
+    _pendingDatabases.add(self)
+    if len(self.pending) >= self.chunkSize:
+      self.writePending()
+
+  def writePending(self):
+    """
+      Writes the pending realizations to file
+      @ In, None
+      @ Out, None
+    """
+    if not self.pending:
+      return
+    start = len(self.names) - len(self.pending)
+    self.__addColumnsData(self.pending, start)
+    self.__updateFileLevelInfoDatasets(start)
+    self.pending = []
+    self.h5FileW.flush()
+
+  def addGroupInit(self, groupName, attributes=None):
+    """
+      Function to add an empty group to the database
+      This function is generally used when the user provides a rootname in the input.
+      It uses the groupName + it appends the date and time.
+      @ In, groupName, string, group name
+      @ In, attributes, dict, optional, dictionary of attributes that must be added as metadata (None by default)
+      @ Out, None
+    """
+    if not self.fileOpen:
+      self.__createObjFromFile()
+    self.writePending()
+    attribs = {} if attributes is None else attributes
+    groupNameInit = groupName+"_"+datetime.now().strftime("%m-%d-%Y-%H-%S")
+    if groupNameInit in self.rows:
+      asciiAlphabet = list(string.ascii_uppercase)
+      counter = 0
+      while groupNameInit + "_" + asciiAlphabet[counter % len(asciiAlphabet)]*(1 + counter // len(asciiAlphabet)) in self.rows:
+        counter += 1
+      groupNameInit += "_" + asciiAlphabet[counter % len(asciiAlphabet)]*(1 + counter // len(asciiAlphabet))
+    start = len(self.names)
+    self.parentRow = start
+    self.__appendRow(groupNameInit, -1, False)
+    # the root groups take no values
+    for column in self.columns.values():
+      column.append([], np.full(1, -1, dtype=np.int64), start)
+    self.h5FileW["rootGroups"].create_group(groupNameInit).attrs.update(attribs)
+    self.__updateFileLevelInfoDatasets(start)
+    self.h5FileW.flush()
+
+  def __appendRow(self, name, parent, end):
+    """
+      Appends a group to the in-memory group tables
+      @ In, name, str, the group name
+      @ In, parent, int, row of the parent group (-1 for the file root)
+      @ In, end, bool, is it an ending group (a realization)?
+      @ Out, None
+    """
+    self.rows[name] = len(self.names)
+    self.names.append(name)
+    self.parents.append(parent)
+    self.ends.append(end)
+
+  def __findParent(self, parentName):
+    """
+      Finds the row of the parent group of a sub group
+      @ In, parentName, str, the parent ID
+      @ Out, parent, int, row of the parent group (-1 for the file root)
+    """
+    if parentName == '/':
+      return -1
+    parent = self.rows.get(parentName.strip())
+    if parent is None:
+      # try to guess the parentID from the group names
+      closestGroup = difflib.get_close_matches(parentName, self.names, n=1, cutoff=0.01)
+      if len(closestGroup) == 0:
+        errorString = ' NOT FOUND parent group named "' + str(parentName)
+        errorString+= '\n All group names are:\n -'+'\n -'.join(self.names)
+        self.raiseAnError(ValueError,errorString)
+      parent = self.rows[closestGroup[0]]
+    return parent
+
+  def __updateFileLevelInfoDatasets(self, start):
+    """
+      Method to write the groups added after a given row into the group tables of the file
+      @ In, start, int, first row to write
+      @ Out, None
+    """
+    groups = self.groupTables
+    _appendToDataset(groups["names"], np.array(self.names[start:], dtype=object), start)
+    _appendToDataset(groups["parents"], np.array(self.parents[start:], dtype=np.int64), start)
+    _appendToDataset(groups["ends"], np.array(self.ends[start:], dtype=bool), start)
+    self.h5FileW.attrs["nGroups"] = len(self.names)
+
+  def __addColumnsData(self, rlzs, start):
+    """
+      Appends the values of the realizations to the columns
+      @ In, rlzs, list(dict), the realizations, stored in the rows following "start"
+      @ In, start, int, row of the first realization
+      @ Out, None
+    """
+    nRows = len(rlzs)
+    collected = {} # {var: (isScalar, [values], lengths)}
+    for r, rlz in enumerate(rlzs):
+      if self.variables is not None and not set(self.variables).issubset(rlz.keys()):
+        self.raiseAnError(IOError, "Not all the requested variables have been passed in the realization. Missing are: "+
+                          ",".join(list(set(self.variables).symmetric_difference(set(rlz.keys())))))
+      for key, value in rlz.items():
+        if _checkTypeHDF5(value, False):
+          if self.variables is not None and key not in self.variables:
+            continue
+          value = np.atleast_1d(value).astype(float)
+          if value.ndim > 1:
+            self.raiseAnError(TypeError, f'The columnar layout can only store scalars and 1D arrays. Received "{key}" with shape {value.shape}!')
+          isScalar = True
+        elif _checkTypeHDF5(value, True):
+          value = np.frombuffer(pk.dumps(value), dtype=np.uint8)
+          isScalar = False
+        else:
+          continue
+        if key not in collected:
+          collected[key] = (isScalar, [], np.full(nRows, -1, dtype=np.int64))
+        elif collected[key][0] != isScalar:
+          self.raiseAnError(TypeError, f'Variable "{key}" can not be both numeric and non-numeric in database "{self.name}"!')
+        collected[key][1].append(value)
+        collected[key][2][r] = len(value)
+    for key in set(self.columns) | set(collected):
+      column = self.columns.get(key)
+      isScalar, values, lengths = collected.get(key, (None, [], np.full(nRows, -1, dtype=np.int64)))
+      if column is None:
+        group = self.h5FileW["columns"].create_group(str(len(self.columns)))
+        group.attrs["name"] = key
+        group.attrs["scalar"] = isScalar
+        group.attrs["size"] = 0
+        self.__createDataset(group, "values", float if isScalar else np.uint8)
+        self.__createDataset(group, "lengths", np.int64)
+        column = _Column(group, 0)
+        # the previous groups do not have this variable
+        column.append([], np.full(start, -1, dtype=np.int64), 0)
+        self.columns[key] = column
+      elif isScalar is not None and isScalar != column.scalar:
+        self.raiseAnError(TypeError, f'Variable "{key}" can not be both numeric and non-numeric in database "{self.name}"!')
+      column.append(np.concatenate(values) if len(values) else values, lengths, start)
+
+  def retrieveAllHistoryNames(self,rootName=None):
+    """
+      Function to create a list of all the HistorySet names present in an existing database
+      @ In,  rootName, string, optional, It's the root name, if present, only the history names that have this root are going to be returned
+      @ Out, workingList, list, List of the HistorySet names
+    """
+    if not self.fileOpen:
+      self.__createObjFromFile()
+    if not rootName:
+      workingList = [name for name, end in zip(self.names, self.ends) if end]
+    else:
+      rname = utils.toString(rootName)
+      workingList = [name for name, end in zip(self.names, self.ends) if end and name.endswith(rname)]
+
+    return workingList
+
+  def retrieveRealizations(self, names):
+    """
+      Function to retrieve many realizations at once, reading each column only once
+      @ In, names, list(str), the realization (group) names
+      @ Out, allData, list(dict), the realizations, in the same order as names
+    """
+    if not self.fileOpen:
+      self.__createObjFromFile()
+    self.writePending()
+    missing = [name for name in names if name not in self.rows]
+    if missing:
+      self.raiseAnError(IOError,'Group named ' + missing[0] + ' not found in database "'+self.name+'"!')
+    rows = np.asarray([self.rows[name] for name in names], dtype=np.int64)
+    allData = [{} for _ in names]
+    for key, column in self.columns.items():
+      lengths, starts = column.locate(rows)
+      present = np.flatnonzero(lengths >= 0)
+      if len(present) == 0:
+        continue
+      lengths = lengths[present]
+      # only the values of the requested groups are read
+      starts, values = column.read(starts[present], lengths)
+      if not column.scalar:
+        for p, s, length in zip(present, starts, lengths):
+          allData[p][key] = pk.loads(values[s:s + length].tobytes())
+      elif (lengths == 1).all():
+        # scalar values, gather them all at once
+        for p, value in zip(present, values[starts].reshape(-1, 1)):
+          allData[p][key] = value
+      else:
+        for p, s, length in zip(present, starts, lengths):
+          allData[p][key] = values[s:s + length]
+
+    return allData
+
+  def retrieveLazyDataset(self, names, dims, sampleTag):
+    """
+      Function to build an xarray Dataset of the realizations, in which the numeric variables are
+      dask arrays read from file only when used. Non-numeric variables (e.g. the prefix) are loaded.
+      @ In, names, list(str), the realization (group) names, in the order of the Dataset samples
+      @ In, dims, dict, {var: [index names]}, the variables to retrieve and their indexes
+        ([] for scalars, [pivot] for histories)
+      @ In, sampleTag, str, the name of the sample dimension
+      @ Out, dataset, xr.Dataset or None, the lazy dataset, None if the data can not be represented
+        with the requested structure (e.g. missing variables, histories not aligned on their pivot)
+    """
+    import dask.array as da
+    import xarray as xr
+    if not self.fileOpen:
+      self.__createObjFromFile()
+    self.writePending()
+    rows = np.asarray([self.rows[name] for name in names], dtype=np.int64)
+    nSamples = len(rows)
+    dataVars = {}
+    coords = {sampleTag: np.arange(nSamples)}
+    indexes = set(index for varDims in dims.values() for index in varDims)
+    for var, varDims in dims.items():
+      if var in indexes:
+        # read as coordinate of the variables depending on it
+        continue
+      column = self.columns.get(var)
+      if column is None or len(varDims) > 1:
+        return None
+      lengths, starts = column.locate(rows)
+      if not column.scalar:
+        if varDims or (lengths <= 0).any():
+          return None
+        localStarts, values = column.read(starts, lengths)
+        objects = [np.atleast_1d(pk.loads(values[s:s + length].tobytes())) for s, length in zip(localStarts, lengths)]
+        if any(obj.size != 1 for obj in objects):
+          return None
+        dataVars[var] = ((sampleTag,), np.array([obj[0] for obj in objects]))
+        continue
+      reader = _LazyColumn(self.filenameAndPath, column)
+      self._lazyColumns.append(reader)
+      values = da.from_array(reader, chunks='auto')
+      if not varDims:
+        if (lengths != 1).any():
+          return None
+        dataVars[var] = ((sampleTag,), values[starts])
+        continue
+      # histories: need the same length and the same pivot values in all the realizations,
+      # stored one after the other in the file
+      pivot = varDims[0]
+      length = lengths[0] if nSamples else 0
+      order = np.argsort(rows)
+      if length < 1 or (lengths != length).any() or (nSamples > 1 and (np.diff(starts[order]) != length).any()):
+        return None
+      if pivot not in coords:
+        pivotValues = self.__alignedValues(pivot, rows, length)
+        if pivotValues is None:
+          return None
+        coords[pivot] = pivotValues
+      elif len(coords[pivot]) != length:
+        return None
+      first = starts[order[0]] if nSamples else 0
+      block = values[first:first + nSamples*length].reshape(nSamples, length)
+      # back from the file order to the requested one
+      rank = np.empty(nSamples, dtype=np.int64)
+      rank[order] = np.arange(nSamples)
+      dataVars[var] = ((sampleTag, pivot), block[rank])
+
+    return xr.Dataset(dataVars, coords=coords)
+
+  def __alignedValues(self, var, rows, length):
+    """
+      Reads the values of a variable if they are the same in all the given realizations
+      (read block by block, not to load the whole variable in memory)
+      @ In, var, str, the variable (e.g. a pivot parameter)
+      @ In, rows, np.ndarray(int), the realizations
+      @ In, length, int, the expected number of values of the variable in each realization
+      @ Out, values, np.ndarray or None, the values (None if not the same in all the realizations)
+    """
+    column = self.columns.get(var)
+    if column is None or not column.scalar:
+      return None
+    lengths, starts = column.locate(rows)
+    starts = np.sort(starts)
+    # only values stored one realization after the other are supported
+    if (lengths != length).any() or (np.diff(starts) != length).any():
+      return None
+    reference = column.values[starts[0]:starts[0] + length]
+    blockRows = max(1, (self.chunkSize * 64) // length)
+    for first in range(0, len(starts), blockRows):
+      nRows = min(blockRows, len(starts) - first)
+      values = column.values[starts[first]:starts[first] + nRows*length].reshape(nRows, length)
+      if not (values == reference).all():
+        return None
+    return reference
+
+  def _getRealizationByName(self, name, options=None):
+    """
+      Function to retrieve the history whose end group name is "name"
+      @ In, name, string, realization name => It must correspond to a group name (string)
+      @ In, options, dict, dictionary of options (now, just "recunstruct" flag)
+      @ Out, (newData,attrs), tuple, tuple where position 0 = dict containing the realization, 1 = dictionary of some attributes
+    """
+    if options is None:
+      options = {}
+    reconstruct = options.get("reconstruct", True)
+    newData = self.retrieveRealizations([name])[0]
+    attrs = {'nVars':len(newData.keys()),'varKeys':newData.keys()}
+    if reconstruct:
+      # prepend the data of the parent groups (the root groups get skipped)
+      parent = self.parents[self.rows[name]]
+      while parent >= 0 and self.ends[parent]:
+        data = self.retrieveRealizations([self.names[parent]])[0]
+        if len(data.keys()) != len(newData.keys()):
+          self.raiseAnError(IOError,'Group named "' + self.names[parent] + '" has an inconsistent number of variables in database "'+self.name+'"!')
+        newData = {key : np.concatenate((data[key],newData[key])) for key in newData.keys()}
+        parent = self.parents[parent]
+
+    return(newData,attrs)
+
+  def closeDatabaseW(self):
+    """
+      Function to close the database
+      @ In,  None
+      @ Out, None
+    """
+    if self.fileOpen:
+      self.writePending()
+    self.closeLazyColumns()
+    self.h5FileW.close()
+    self.fileOpen = False
+    return
+
+  def closeLazyColumns(self):
+    """
+      Closes the read only handles of the lazily loaded data (see retrieveLazyDataset)
+      @ In, None
+      @ Out, None
+    """
+    for reader in self._lazyColumns:
+      reader.close()
+    self._lazyColumns = []
+
+  def openDatabaseW(self,filename,mode='w'):
+    """
+      Function to open the database
+      @ In, filename, string, name of the file (string)
+      @ In, mode, string, open mode (default "w=write")
+      @ Out, fh5, hdf5 object, instance of hdf5
+    """
+    fh5 = h5.File(filename,mode)
+    self.fileOpen = True
+    return fh5
+
+def createDatabase(name, databaseDir, filename, exist, variables=None, layout='group', compression=None):
+  """
+    Creates the database object handling the HDF5 file, according to its layout.
+    The layout of an existing file is read from the file itself.
+    @ In, name, string, name of this database
+    @ In, databaseDir, string, database directory (full path)
+    @ In, filename, string, the database filename
+    @ In, exist, bool, does it exist?
+    @ In, variables, list, optional, the specific variables to store (None => all variables are stored)
+    @ In, layout, str, optional, layout of a new file, "group" (a group per realization) or "columnar" (a dataset per variable)
+    @ In, compression, str, optional, compression filter of the columnar datasets ("gzip", "lzf" or None)
+    @ Out, database, hdf5Database or hdf5ColumnarDatabase, the database object
+  """
+  path = os.path.join(databaseDir, filename)
+  if exist and os.path.exists(path):
+    with h5.File(path, 'r') as h5File:
+      layout = utils.toString(h5File.attrs.get("layout", "group"))
+  if layout == 'columnar':
+    return hdf5ColumnarDatabase(name, databaseDir, filename, exist, variables, compression)
+  return hdf5Database(name, databaseDir, filename, exist, variables)
@@ -21,6 +21,7 @@ from __future__ import division, print_function, absolute_import
 #----- end python 2 - 3 compatibility
 #External Modules------------------------------------------------------------------------------------
 import sys
+import copy
 import threading
 from numpy import ndarray
 import numpy as np
@@ -384,3 +385,336 @@ class cNDarray(object):
     assert(abs(index) < self.width)
     self.values = np.delete(self.values,index,axis=1)
     self.width -= 1
+
+#
+#
+#
+#
+class cColumnarArray(object):
+  """
+    Columnar caching of realizations (rows) composed by several entities (columns).
+    Each column is stored in its own growable np.ndarray, whose type is inferred by the first value received:
+      - float, int or bool scalars are stored in typed 1-D buffers;
+      - numeric np.ndarray entries sharing the same shape and type (e.g. histories on an aligned index)
+        are stored in a single (# samples, *shape) block;
+      - anything else (strings, ragged histories, None, etc.) is stored in an object 1-D buffer.
+    When a value not fitting the storage of a column is received, the column is converted to object storage.
+    The typed columns can be obtained (see getColumn) as views, without copying, for building the final data structures.
+  """
+  # storage type for the scalar columns, by kind of the first value
+  _storageTypes = {'b': bool, 'i': np.int64, 'f': np.float64, 'O': object}
+  # kinds of values that can be stored in a column, by kind of the column
+  _accepted = {'b': 'b', 'i': 'iu', 'f': 'fiu'}
+
+  ### CONSTRUCTOR ###
+  def __init__(self, width=0, length=100):
+    """
+      Constructor.
+      @ In, width, int, optional, number of entities (columns) to allocate
+      @ In, length, int, optional, initial capacity (number of samples) to allocate
+      @ Out, None
+    """
+    self.size     = 0                  # number of rows (samples) with actual data (not including empty cached)
+    self.width    = width              # number of entities aka columns
+    self.capacity = max(length, 1)     # cached size of the columns
+    self._columns = [None] * width     # np.ndarray for each column, None until the first value is received
+
+  ### PROPERTIES ###
+  @property
+  def shape(self):
+    """
+      Shape property, as used in np.ndarray structures.
+      @ In, None
+      @ Out, (int,int), the (#rows, #columns) of useful data in this cached array
+    """
+    return (self.size, self.width)
+
+  ### BUILTINS ###
+  def __array__(self, dtype=None):
+    """
+      so that numpy's array() returns values
+      @ In, dtype, np.type, optional, the requested type of the array
+      @ Out, __array__, numpy.ndarray, the requested array
+    """
+    data = self.getData()
+    return data if dtype is None else data.astype(dtype)
+
+  def __getitem__(self, val):
+    """
+      Get item method. Supported requests are:
+        - [r], the realization (row) r as 1-D object array
+        - [r, c], the entry of column c for the realization r
+        - [r, (c1, c2, ...)], the entries of columns c1, c2, ... for the realization r as 1-D object array
+        - [rows, c], the entries of column c for the realizations in slice "rows" (see getColumn)
+        - [rows], the realizations in slice "rows" as 2-D object array
+      @ In, val, int or slice or tuple, the requested entries
+      @ Out, __getitem__, object, the entry or entries
+    """
+    if isinstance(val, tuple):
+      row, col = val
+      if isinstance(col, (tuple, list)):
+        entries = np.empty(len(col), dtype=object)
+        for c, column in enumerate(col):
+          entries[c] = self[row, column]
+        return entries
+      column = self.getColumn(col)
+      if isinstance(row, slice) and column.ndim > 1:
+        # one entry per realization, so return the blocks as array of arrays
+        return self._toObjects(column[row])
+      return column[row]
+    if isinstance(val, slice):
+      return self.getData()[val]
+    return self.getRow(val)
+
+  def __setitem__(self, val, value):
+    """
+      Set item method, only for single entries as [r, c]
+      @ In, val, tuple, (row, column) indices of the entry
+      @ In, value, object, new value for the entry
+      @ Out, None
+    """
+    row, col = val
+    if row < 0:
+      row += self.size
+    if not 0 <= row < self.size:
+      raise IndexError('Row {} out of range for cColumnarArray with {} rows!'.format(val[0], self.size))
+    self._setValue(col, row, value)
+
+  def __iter__(self):
+    """
+      Overload of iterator
+      @ In, None
+      @ Out, __iter__, iterator, iterator over the rows
+    """
+    return (self.getRow(r) for r in range(self.size))
+
+  def __len__(self):
+    """
+      Return size, which is the number of samples, independent of entities, containing useful data.
+      Does not include cached entries that have not yet been filled.
+      @ In, None
+      @ Out, __len__, integer, size
+    """
+    return self.size
+
+  def __repr__(self):
+    """
+      overload of __repr__ function
+      @ In, None
+      @ Out, __repr__, string, the representation string
+    """
+    return repr(self.getData())
+
+  ### UTILITY FUNCTIONS ###
+  def append(self, entry):
+    """
+      Appends one realization (row).
+      @ In, entry, list or np.ndarray, one value for each entity (column)
+      @ Out, None
+    """
+    if len(entry) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} entries, but got {}!'.format(self.width, len(entry)))
+    self._reserve(self.size + 1)
+    for c, value in enumerate(entry):
+      self._setValue(c, self.size, value)
+    self.size += 1
+
+  def extend(self, columns):
+    """
+      Appends many realizations (rows) at once, provided by column.
+      @ In, columns, list(np.ndarray), one array for each entity (column); the first dimension of each
+        array is the number of new realizations (the same for all the columns)
+      @ Out, None
+    """
+    if len(columns) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} columns, but got {}!'.format(self.width, len(columns)))
+    if not self.width:
+      return
+    new = len(columns[0])
+    if any(len(values) != new for values in columns):
+      raise IOError('Tried to add new data to cColumnarArray.  All the columns must have the same number of entries!')
+    if not new:
+      return
+    self._reserve(self.size + new)
+    for c, values in enumerate(columns):
+      values = np.asarray(values)
+      column = self._columns[c]
+      if column is None:
+        column = self._newColumn(values[0] if values.ndim > 1 else values.item(0))
+        self._columns[c] = column
+      if column.ndim > 1:
+        fits = values.dtype == column.dtype and values.shape[1:] == column.shape[1:]
+      else:
+        fits = column.dtype == object or (values.ndim == 1 and values.dtype.kind in self._accepted[column.dtype.kind])
+      if not fits:
+        column = self._toObjectColumn(c)
+      if column.dtype == object:
+        for r, value in enumerate(values):
+          column[self.size + r] = self._copy(value)
+      else:
+        column[self.size:self.size + new] = values
+    self.size += new
+
+  def addEntity(self, vals, firstEver=False):
+    """
+      Adds a column to the dataset.
+      @ In, vals, list, as list(#,#,#) where # is either single-valued or numpy array
+      @ In, firstEver, bool, optional, unused (for compatibility with cNDarray)
+      @ Out, None
+    """
+    self._columns.append(None)
+    self.width += 1
+    for r, value in enumerate(vals[:self.size]):
+      self._setValue(self.width - 1, r, value)
+
+  def getColumn(self, index):
+    """
+      Returns the data of one column, as a view (not a copy) of the underlying storage.
+      @ In, index, int, index of the column
+      @ Out, getColumn, np.ndarray, typed 1-D array for scalar columns, (# samples, *shape) array for
+        block columns, 1-D object array otherwise
+    """
+    column = self._columns[index]
+    if column is None:
+      return np.empty(0, dtype=object)
+    return column[:self.size]
+
+  def getData(self):
+    """
+      Returns the data as object matrix (copy).
+      @ In, None
+      @ Out, getData, np.ndarray, 2-D object array with shape (# samples, # entities)
+    """
+    data = np.empty((self.size, self.width), dtype=object)
+    for c in range(self.width):
+      data[:, c] = self[:, c]
+    return data
+
+  def getRow(self, index):
+    """
+      Returns one realization (row).
+      @ In, index, int, index of the row (negative values count from the end)
+      @ Out, row, np.ndarray, 1-D object array with the entry of each column
+    """
+    if index < 0:
+      index += self.size
+    if not 0 <= index < self.size:
+      raise IndexError('Row {} out of range for cColumnarArray with {} rows!'.format(index, self.size))
+    row = np.empty(self.width, dtype=object)
+    for c, column in enumerate(self._columns):
+      row[c] = column[index]
+    return row
+
+  def removeEntity(self, index):
+    """
+      Removes a column from this dataset
+      @ In, index, int, index of entry to remove
+      @ Out, None
+    """
+    assert(abs(index) < self.width)
+    self._columns.pop(index)
+    self.width -= 1
+
+  @staticmethod
+  def _kindOf(value):
+    """
+      Classifies a single value, using the numpy "kind" codes
+      @ In, value, object, the value
+      @ Out, kind, str, 'b' for booleans, 'i' for integers, 'f' for floats, 'O' otherwise
+    """
+    if isinstance(value, (bool, np.bool_)):
+      return 'b'
+    if isinstance(value, (int, np.integer)):
+      return 'i'
+    if isinstance(value, (float, np.floating)):
+      return 'f'
+    return 'O'
+
+  def _copy(self, value):
+    """
+      Protects the stored data against changes of the provided values.
+      @ In, value, object, the value to store
+      @ Out, value, object, the value or a copy of it
+    """
+    if isinstance(value, np.ndarray):
+      return value.copy()
+    if isinstance(value, (str, bytes, int, float, complex, np.generic)) or value is None:
+      return value
+    return copy.deepcopy(value)
+
+  def _newColumn(self, value):
+    """
+      Creates the storage of a column, based on the type of its first value
+      @ In, value, object, first value received for the column
+      @ Out, column, np.ndarray, storage for the column
+    """
+    if isinstance(value, np.ndarray) and value.ndim > 0 and value.dtype.kind in 'biuf':
+      return np.empty((self.capacity,) + value.shape, dtype=value.dtype)
+    return np.empty(self.capacity, dtype=self._storageTypes[self._kindOf(value)])
+
+  def _reserve(self, size):
+    """
+      Makes sure the storage can hold "size" rows, growing the capacity if needed.
+      @ In, size, int, number of needed rows
+      @ Out, None
+    """
+    if size <= self.capacity:
+      return
+    # double the available space, which keeps the unused space of the views of the columns limited
+    capacity = max(size, self.capacity * 2)
+    for c, column in enumerate(self._columns):
+      if column is not None:
+        new = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+        new[:self.size] = column[:self.size]
+        self._columns[c] = new
+    self.capacity = capacity
+
+  def _setValue(self, index, row, value):
+    """
+      Sets an entry of a column, changing the storage of the column if needed
+      @ In, index, int, index of the column
+      @ In, row, int, index of the row
+      @ In, value, object, the value
+      @ Out, None
+    """
+    column = self._columns[index]
+    if column is None:
+      column = self._newColumn(value)
+      self._columns[index] = column
+    if column.ndim > 1:
+      fits = isinstance(value, np.ndarray) and value.dtype == column.dtype and value.shape == column.shape[1:]
+    else:
+      fits = column.dtype == object or self._kindOf(value) in self._accepted[column.dtype.kind]
+    if not fits:
+      column = self._toObjectColumn(index)
+    if column.dtype == object:
+      column[row] = self._copy(value)
+    else:
+      column[row] = value
+
+  def _toObjectColumn(self, index):
+    """
+      Converts the storage of a column to object storage
+      @ In, index, int, index of the column
+      @ Out, column, np.ndarray, the new object storage
+    """
+    column = self._columns[index]
+    new = np.empty(self.capacity, dtype=object)
+    new[:self.size] = self._toObjects(column[:self.size])
+    self._columns[index] = new
+    return new
+
+  @staticmethod
+  def _toObjects(values):
+    """
+      Converts values to a 1-D object array with one entry for each entry of the first dimension
+      @ In, values, np.ndarray, the values
+      @ Out, objects, np.ndarray, 1-D object array
+    """
+    objects = np.empty(len(values), dtype=object)
+    if values.ndim > 1:
+      for r, value in enumerate(values):
+        objects[r] = value
+    else:
+      objects[:] = values
+    return objects
@@ -55,18 +55,24 @@ class BoxMullerGenerator:
       @ In, engine, instance, optional, random number generator
       @ Out, values, np.ndarray, random value
     """
-    values = np.zeros(size)
     with self.__queueLock:
-      queueLength = len(self.queue[engine])
-      if queueLength < size:
-        #calculate new values
-        # We want to add only as many new values as we need to the queue, but Box Muller does them in pairs.
-        # Asking for ceil((size - len(queue)) / 2) evaluations of Box Muller will give us enough values to
-        # satisfy the request.
-        genSize = np.ceil((size - queueLength) / 2).astype(int)
-        # Using extendleft instead of extend so that the values are added behind the existing values in the deque.
-        self.queue[engine].extendleft(self.createSamples(size=genSize, engine=engine))
-    values = np.array([self.queue[engine].pop() for _ in range(size)])
+      queue = self.queue[engine]
+      queueLength = len(queue)
+      if queueLength >= size:
+        return np.array([queue.pop() for _ in range(size)], dtype=float)
+      # the values already in the queue come first
+      values = np.empty(size)
+      values[:queueLength] = [queue.pop() for _ in range(queueLength)]
+      #calculate new values
+      # We want to add only as many new values as we need, but Box Muller does them in pairs.
+      # Asking for ceil((size - len(queue)) / 2) evaluations of Box Muller will give us enough values to
+      # satisfy the request.
+      genSize = np.ceil((size - queueLength) / 2).astype(int)
+      newValues = np.asarray(self.createSamples(size=genSize, engine=engine))
+      needed = size - queueLength
+      values[queueLength:] = newValues[:needed]
+      # the values left over are kept for the next request (extendleft, so that they are popped in order)
+      queue.extendleft(newValues[needed:])
     return values
 
   def createSamples(self, size, engine=None):
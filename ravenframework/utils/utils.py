@@ -46,9 +46,9 @@ class Object(object):
 try:
   import enum
   #Enum of the parallel libraries we support
-  #Note that shared is use no parallel lib, and distributed is choose one
-  # and use it.
-  ParallelLibEnum = enum.Enum('ParallelLibEnum', ['dask','ray','shared','distributed'])
+  #Note that shared is use no parallel lib, distributed is choose one
+  # and use it, and processpool is a local pool of worker processes.
+  ParallelLibEnum = enum.Enum('ParallelLibEnum', ['dask','ray','shared','distributed','processpool'])
 except ImportError:
   ParallelLibEnum = "ParallelLibEnum is not available without enum"
 
@@ -0,0 +1,142 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Incremental index of the values taken by a scalar variable over a sequence of realizations,
+  used to find the realizations whose value lies within a tolerance window without scanning
+  all of them. The index only narrows the search: it returns candidate realizations, a superset
+  of the actual matches, that the caller verifies with its own matching rule.
+
+  Created on Oct 18, 2026
+"""
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from . import mathUtils
+#Internal Modules End--------------------------------------------------------------------------------
+
+class ValueIndex(object):
+  """
+    Index of the values of a scalar variable, appended realization by realization.
+    Numeric values are kept in a few sorted runs (binary search of the tolerance window in each
+    run), with the most recent ones held in a small unsorted buffer. A full buffer becomes a new
+    run, and runs are merged as in a log-structured merge tree: each run is at least twice as long
+    as the following one, so there are O(log n) runs and each value is merged O(log n) times.
+    Non-numeric values are hashed.
+  """
+  # number of values buffered before being sorted into a run
+  bufferSize = 1024
+
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self.size = 0                                  # number of realizations indexed
+    self._runs = []                                # sorted runs of finite numeric values, as (values, realizations), longest first
+    self._bufferValues = np.zeros(self.bufferSize, dtype=float)  # finite numeric values not sorted yet
+    self._bufferRows = np.zeros(self.bufferSize, dtype=np.int64) # realizations corresponding to _bufferValues
+    self._buffered = 0                             # number of entries used in the buffer
+    self._nonFinite = []                           # realizations with NaN or infinite values
+    self._hashed = {}                              # non-numeric values as {value:[realizations]}
+
+  def extend(self, values):
+    """
+      Appends the values of the next realizations
+      @ In, values, np.ndarray, values of the realizations following the ones already indexed
+      @ Out, None
+    """
+    values = np.asarray(values)
+    rows = np.arange(self.size, self.size + len(values), dtype=np.int64)
+    self.size += len(values)
+    if values.dtype.kind in 'biuf':
+      self._addNumeric(values.astype(float), rows)
+      return
+    # mixed or non-numeric values, one at a time
+    numeric = np.fromiter((mathUtils.isAFloatOrInt(val) or mathUtils.isABoolean(val) for val in values), dtype=bool, count=len(values))
+    if numeric.any():
+      self._addNumeric(values[numeric].astype(float), rows[numeric])
+    for val, row in zip(values[~numeric], rows[~numeric]):
+      self._hashed.setdefault(val, []).append(row)
+
+  def findNumeric(self, value, halfWidth):
+    """
+      Finds the candidate realizations matching a numeric value
+      @ In, value, float, finite value to look for
+      @ In, halfWidth, float, half width of the window around value holding all the possible matches
+      @ Out, candidates, np.ndarray, sorted indices of the realizations that might match
+    """
+    low, high = value - halfWidth, value + halfWidth
+    found = []
+    for runValues, runRows in self._runs:
+      start = np.searchsorted(runValues, low, side='left')
+      end = np.searchsorted(runValues, high, side='right')
+      found.append(runRows[start:end])
+    buffered = self._bufferValues[:self._buffered]
+    found.append(self._bufferRows[:self._buffered][(buffered >= low) & (buffered <= high)])
+    # non-finite values are left to the matching rule of the caller
+    found.append(np.asarray(self._nonFinite, dtype=np.int64))
+    candidates = np.concatenate(found)
+    candidates.sort()
+    return candidates
+
+  def findExact(self, value):
+    """
+      Finds the candidate realizations matching a non-numeric value
+      @ In, value, object, hashable value to look for
+      @ Out, candidates, np.ndarray, sorted indices of the realizations that might match
+    """
+    return np.asarray(self._hashed.get(value, []), dtype=np.int64)
+
+  def _addNumeric(self, values, rows):
+    """
+      Adds numeric values to the index
+      @ In, values, np.ndarray(float), values to add
+      @ In, rows, np.ndarray(int), realizations corresponding to values
+      @ Out, None
+    """
+    finite = np.isfinite(values)
+    if not finite.all():
+      self._nonFinite.extend(rows[~finite].tolist())
+      values, rows = values[finite], rows[finite]
+    if self._buffered + len(values) > self.bufferSize:
+      # buffer and new values become a new sorted run
+      values = np.concatenate((self._bufferValues[:self._buffered], values))
+      rows = np.concatenate((self._bufferRows[:self._buffered], rows))
+      self._buffered = 0
+      self._addRun(values, rows)
+    else:
+      self._bufferValues[self._buffered:self._buffered + len(values)] = values
+      self._bufferRows[self._buffered:self._buffered + len(values)] = rows
+      self._buffered += len(values)
+
+  def _addRun(self, values, rows):
+    """
+      Sorts values into a new run, merging it with the shortest runs until each run is at least
+      twice as long as the following one
+      @ In, values, np.ndarray(float), finite values of the new run
+      @ In, rows, np.ndarray(int), realizations corresponding to values
+      @ Out, None
+    """
+    order = np.argsort(values, kind='stable')
+    values, rows = values[order], rows[order]
+    while self._runs and len(self._runs[-1][0]) < 2 * len(values):
+      runValues, runRows = self._runs.pop()
+      # linear merge of the two sorted runs; equal values stay in realization order
+      positions = np.searchsorted(runValues, values, side='right')
+      values = np.insert(runValues, positions, values)
+      rows = np.insert(runRows, positions, rows)
+    self._runs.append((values, rows))
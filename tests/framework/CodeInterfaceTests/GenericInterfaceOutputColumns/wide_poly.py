@@ -0,0 +1,49 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+def readValues(filename):
+  """
+    Reads the "name = value" entries of a file.
+    @ In, filename, str, the file to read
+    @ Out, values, dict, {name:value}
+  """
+  values = {}
+  with open(filename, 'r') as inFile:
+    for line in inFile:
+      if '=' in line and not line.startswith('#'):
+        name, value = line.split('=')
+        values[name.strip()] = float(value)
+  return values
+
+def run(inp, out):
+  """
+    Running interface for RAVEN.
+    Writes a wide output file, of which only a few columns are loaded.
+    @ In, inp, str, filename of the perturbed input
+    @ In, out, str, output file base name
+    @ Out, None
+  """
+  sampled = readValues(inp)
+  x, y = sampled['x'], sampled['y']
+  extra = ['c{}'.format(c) for c in range(500)]
+  with open(out + '.csv', 'w') as outFile:
+    outFile.write(','.join(['x', 'y', 'poly', 'prod'] + extra) + '\n')
+    for t in range(3):
+      values = [x, y, t * (x + y), t * x * y] + [c * t for c in range(len(extra))]
+      outFile.write(','.join(str(v) for v in values) + '\n')
+
+if __name__ == '__main__':
+  import sys
+  args = sys.argv
+  run(args[args.index('-i') + 1], args[args.index('-o') + 1])
@@ -0,0 +1,2 @@
+# read-only data shared by all the runs
+scale = 2.0
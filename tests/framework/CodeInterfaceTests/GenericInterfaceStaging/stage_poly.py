@@ -0,0 +1,50 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+def readValues(filename):
+  """
+    Reads the "name = value" entries of a file.
+    @ In, filename, str, the file to read
+    @ Out, values, dict, {name:value}
+  """
+  values = {}
+  with open(filename, 'r') as inFile:
+    for line in inFile:
+      if '=' in line and not line.startswith('#'):
+        name, value = line.split('=')
+        values[name.strip()] = float(value)
+  return values
+
+def run(inp, out):
+  """
+    Running interface for RAVEN.
+    The original input files are in the parent directory (the step directory).
+    @ In, inp, str, filename of the perturbed input
+    @ In, out, str, output file base name
+    @ Out, None
+  """
+  sampled = readValues(inp)
+  mesh = readValues('mesh.e')
+  # the read-only mesh is the original file, the perturbed input is a copy
+  meshLinked = int(os.path.samefile('mesh.e', os.path.join(os.pardir, 'mesh.e')))
+  inputCopied = int(not os.path.samefile(inp, os.path.join(os.pardir, inp)))
+  with open(out + '.csv', 'w') as outFile:
+    outFile.write('x,y,poly,meshLinked,inputCopied\n')
+    outFile.write(f"{sampled['x']},{sampled['y']},{mesh['scale'] * (sampled['x'] + sampled['y'])},{meshLinked},{inputCopied}\n")
+
+if __name__ == '__main__':
+  import sys
+  args = sys.argv
+  run(args[args.index('-i') + 1], args[args.index('-o') + 1])
@@ -0,0 +1,28 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import numpy
+
+def run(self, Input):
+  number_of_steps = 2
+  self.time = numpy.zeros(number_of_steps)
+  #Get inputs
+  x = Input["x"]
+  self.out1 = numpy.zeros(number_of_steps)
+  self.out2 = numpy.zeros(number_of_steps)
+  for i in range(len(self.time)):
+    self.time[i] = float(i)
+    #calculate outputs
+    self.out1[i] = x
+    self.out2[i] = self.time[i]
@@ -352,6 +352,61 @@ idx,rlz = data.realization(matchDict={'b':0.0})
 checkSame('HistorySet find bogus match index',idx,3)
 checkNone('HistorySet find bogus match',rlz)
 
+######################################
+#            BULK ADDITION           #
+######################################
+# list of realizations, stored at once
+bulk = DataObjects.HistorySet()
+bulk.messageHandler = mh
+bulk._readMoreXML(xml)
+bulk.addExpectedMeta(['prefix'])
+bulk.addRealizations([dict(rlz0),dict(rlz1),dict(rlz2)])
+checkSame('HistorySet addRealizations list size',len(bulk),3)
+checkRlz('HistorySet addRealizations list idx 0',bulk.realization(index=0),rlz0,skip=['Timelike', '_indexMap'])
+checkRlz('HistorySet addRealizations list idx 2',bulk.realization(index=2),rlz2,skip=['Timelike', '_indexMap'])
+# same result as adding them one at a time
+for var in ['a','b','x','y']:
+  checkArray('HistorySet addRealizations same as loop "{}"'.format(var),bulk.asDataset()[var].values.flatten(),data.asDataset()[var].values.flatten(),float)
+# dictionary of stacked values, stored at once
+bulk.addRealizations({'a':np.array([31.0,41.0]),
+                      'b':np.array([32.0,42.0]),
+                      'x':np.array([[34.0,34.1,34.2],[44.0,44.1,44.2]]),
+                      'y':np.array([[35.0,35.1,35.2],[45.0,45.1,45.2]]),
+                      'prefix':np.array(['fourth','fifth']),
+                      'Timelike':np.array([[33.1e-6,33.2e-6,33.3e-6],[43.1e-6,43.2e-6,43.3e-6]])})
+checkSame('HistorySet addRealizations dict size',len(bulk),5)
+rlz4 = {'a':41.0, 'b':42.0, 'x':[44.0,44.1,44.2], 'y':[45.0,45.1,45.2], 'prefix':'fifth', 'Timelike':[43.1e-6,43.2e-6,43.3e-6]}
+formatRealization(rlz4)
+checkRlz('HistorySet addRealizations dict idx 4',bulk.realization(index=4),rlz4,skip=['Timelike', '_indexMap'])
+# histories of different lengths are still accepted
+rlz5 = {'a':51.0, 'b':52.0, 'x':[54.0,54.1], 'y':[55.0,55.1], 'prefix':'sixth', 'Timelike':[53.1e-6,53.2e-6]}
+formatRealization(rlz5)
+bulk.addRealizations([dict(rlz5)])
+checkSame('HistorySet addRealizations ragged size',len(bulk),6)
+checkRlz('HistorySet addRealizations ragged idx 5',bulk.realization(index=5),rlz5,skip=['Timelike', '_indexMap'])
+# the batch format is checked as for single realizations
+rlzFormat = dict(rlz0)
+rlzFormat['b'] = list(rlzFormat['b'])
+checkFails('HistorySet addRealizations err format','Realization was not formatted correctly for \"HistorySet\"! See warnings above.',bulk.addRealizations,args=[[rlzFormat,dict(rlz1)]])
+checkSame('HistorySet addRealizations err format size',len(bulk),6)
+# stored values do not share memory with the batch
+alias = DataObjects.HistorySet()
+alias.messageHandler = mh
+alias._readMoreXML(xml)
+alias.addExpectedMeta(['prefix'])
+batch = {'a':np.array([31.0,41.0]),
+         'b':np.array([32.0,42.0]),
+         'x':np.array([[34.0,34.1,34.2],[44.0,44.1,44.2]]),
+         'y':np.array([[35.0,35.1,35.2],[45.0,45.1,45.2]]),
+         'prefix':np.array(['fourth','fifth']),
+         'Timelike':np.array([[33.1e-6,33.2e-6,33.3e-6],[33.1e-6,33.2e-6,33.3e-6]])}
+alias.addRealizations(batch)
+for values in batch.values():
+  values[...] = values[::-1] if values.dtype.kind == 'U' else 0
+checkArray('HistorySet addRealizations batch copied "Timelike"',alias.realization(index=0)['Timelike'],[33.1e-6,33.2e-6,33.3e-6],float)
+checkArray('HistorySet addRealizations batch copied "x"',alias.realization(index=1)['x'],[44.0,44.1,44.2],float)
+checkSame('HistorySet addRealizations batch copied "prefix"',alias.realization(index=0)['prefix'],'fourth')
+
 ######################################
 #        COLLAPSING DATA SET         #
 ######################################
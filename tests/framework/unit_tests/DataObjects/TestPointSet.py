@@ -359,6 +359,46 @@ m, match = data2.realization(matchDict={'a': 11.0}, noMatchDict={'prefix': 'four
 checkSame('PointSet append 1 avoid prefix fourth index', m, 1)
 checkRlz('PointSet append 1 avoid prefix fourth', match, rlz1)
 
+######################################
+#            BULK ADDITION           #
+######################################
+# list of realizations, stored at once
+bulk = DataObjects.PointSet()
+bulk.messageHandler = mh
+bulk._readMoreXML(xml)
+bulk.addExpectedMeta(['prefix'])
+bulk.addRealizations([rlz0,rlz1,rlz2])
+checkSame('PointSet addRealizations list size',len(bulk),3)
+checkRlz('PointSet addRealizations list idx 0',bulk.realization(index=0),rlz0)
+checkRlz('PointSet addRealizations list idx 2',bulk.realization(index=2),rlz2)
+# dictionary of stacked values, stored at once
+bulk.addRealizations({'a':np.array([31.0,41.0]),
+                      'b':np.array([32.0,42.0]),
+                      'x':np.array([34.0,44.0]),
+                      'z':np.array([36.0,46.0]),
+                      'prefix':np.array(['fourth','fifth'])})
+checkSame('PointSet addRealizations dict size',len(bulk),5)
+rlz4 = {'a':41.0,'b':42.0,'x':44.0,'z':46.0,'prefix':'fifth'}
+formatRealization(rlz4)
+checkRlz('PointSet addRealizations dict idx 4',bulk.realization(index=4),rlz4)
+# same result as adding them one at a time
+loop = DataObjects.PointSet()
+loop.messageHandler = mh
+loop._readMoreXML(xml)
+loop.addExpectedMeta(['prefix'])
+for rlz in [rlz0,rlz1,rlz2]:
+  loop.addRealization(rlz)
+bulk = DataObjects.PointSet()
+bulk.messageHandler = mh
+bulk._readMoreXML(xml)
+bulk.addExpectedMeta(['prefix'])
+bulk.addRealizations([rlz0,rlz1,rlz2])
+for var in ['a','b','x','z','prefix']:
+  checkArray('PointSet addRealizations same as loop "{}"'.format(var),bulk.asDataset()[var].values,loop.asDataset()[var].values,float if var != 'prefix' else str)
+# missing data is still caught
+checkFails('PointSet addRealizations err','Provided realization does not have all requisite values for object \"PointSet\": \"z\"',
+           bulk.addRealizations,args=[[{'a':np.atleast_1d(1.0),'b':np.atleast_1d(2.0),'x':np.atleast_1d(3.0),'prefix':np.atleast_1d('bad')}]])
+
 ######################################
 #        COLLAPSING DATA SET         #
 ######################################
@@ -608,7 +648,6 @@ data.setSelectiveOutput('operator','mean')
 data.addRealization(rlz0)
 checkRlz('PointSet selective default',data.realization(index=3),{'a':0.5,'x':1.34})
 
-
 # TODO more exhaustive tests are needed, but this is sufficient for initial work.
 
 print(results)
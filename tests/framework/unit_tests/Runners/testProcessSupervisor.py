@@ -0,0 +1,104 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the ProcessSupervisor of the Runners
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os,sys
+import time
+import threading
+
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+sys.path.append(ravenDir)
+from ravenframework.Runners import ProcessSupervisor
+
+results = {"pass":0,"fail":0}
+
+def checkAnswer(comment, value, expected):
+  """
+    This method compares two values
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to check
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results['pass'] += 1
+  else:
+    print('checking answer', comment, value, '!=', expected)
+    results['fail'] += 1
+
+ended = {}
+allEnded = threading.Event()
+def collect(supervised):
+  """
+    Callback storing the return codes of the ended processes
+    @ In, supervised, SupervisedProcess, the ended process
+    @ Out, None
+  """
+  ended[supervised.process.pid] = supervised.returnCode
+  if len(ended) == expectedEnded:
+    allEnded.set()
+
+supervisor = ProcessSupervisor()
+python = sys.executable
+
+# many short processes in flight at once, with their exit codes
+expectedEnded = 50
+launched = [supervisor.launch([python, '-c', 'import sys; sys.exit({})'.format(i % 3)], collect) for i in range(expectedEnded)]
+checkAnswer('all ended', allEnded.wait(60), True)
+checkAnswer('exit codes', [ended.get(p.process.pid) for p in launched], [i % 3 for i in range(expectedEnded)])
+checkAnswer('none active', supervisor.numActive(), 0)
+
+# wall time exceeded
+ended.clear()
+allEnded.clear()
+expectedEnded = 2
+start = time.time()
+slow = supervisor.launch([python, '-c', 'import time; time.sleep(60)'], collect, timeout=0.5)
+quick = supervisor.launch([python, '-c', 'pass'], collect, timeout=30)
+checkAnswer('timeout ended', allEnded.wait(30), True)
+checkAnswer('timeout killed early', time.time() - start < 20, True)
+checkAnswer('timeout flag', (slow.timedOut, quick.timedOut), (True, False))
+checkAnswer('timeout return codes', (slow.returnCode, quick.returnCode), (-1, 0))
+
+# killed on request
+ended.clear()
+allEnded.clear()
+expectedEnded = 1
+killed = supervisor.launch([python, '-c', 'import time; time.sleep(60)'], collect)
+supervisor.kill(killed)
+checkAnswer('kill ended', allEnded.wait(30), True)
+checkAnswer('kill return code', killed.returnCode is not None and killed.returnCode != 0, True)
+
+# processes still running are killed at shutdown
+running = supervisor.launch([python, '-c', 'import time; time.sleep(60)'], lambda supervised: None)
+supervisor.shutdown()
+checkAnswer('shutdown killed', running.process.wait(30) is not None, True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.processSupervisor</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>Runners.ProcessSupervisor</classesTested>
+    <description>
+       This test performs Unit Tests for the ProcessSupervisor, which waits for all the external
+       code processes from a single thread and enforces their wall time.
+    </description>
+  </TestInfo>
+"""
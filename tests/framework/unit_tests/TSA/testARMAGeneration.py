@@ -0,0 +1,214 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the generation of synthetic histories by the TSA.ARMA class.
+  It can not be considered part of the active code but of the regression test system
+"""
+import os
+import sys
+import numpy as np
+
+# add RAVEN to path
+ravenDir =  os.path.abspath(os.path.join(*([os.path.dirname(__file__)] + [os.pardir]*4)))
+frameworkDir = os.path.join(ravenDir, 'framework')
+if ravenDir not in sys.path:
+  sys.path.append(ravenDir)
+
+from ravenframework.utils import xmlUtils, randomUtils
+
+from ravenframework.TSA import ARMA
+
+print('Modules undergoing testing:')
+print(ARMA)
+print('')
+
+results = {"pass":0, "fail":0}
+
+def updateRes(comment, dtype, res, value, expected, printComment=True):
+  """
+    Updates results dictionary
+    @ In, comment, string, a comment printed out if it fails
+    @ In, dtype, type, the type of the value
+    @ In, res, bool, the result of the check
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, printComment, bool, optional, if False then don't print comment
+  """
+  if res:
+    results['pass'] += 1
+  else:
+    results['fail'] += 1
+    if printComment:
+      print(f'checking {str(dtype)} {comment} | {value} != {expected}')
+
+def checkFloat(comment, value, expected, tol=1e-10, update=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  if np.isnan(value) and np.isnan(expected):
+    res = True
+  elif np.isnan(value) or np.isnan(expected):
+    res = False
+  else:
+    res = abs(value - expected) <= tol
+
+  if update:
+    updateRes(comment, float, res, value, expected)
+
+  return res
+
+def checkSame(comment, value, expected, update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    updateRes(comment, type(value), res, value, expected)
+  return res
+
+def checkArray(comment, first, second, dtype, tol=1e-10, update=True):
+  """
+    This method is aimed to compare two arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = True
+
+  if first.shape != second.shape:
+    res = False
+    print(f'checking answer {comment} | array shapes do not match: {first.shape} {second.shape}')
+    return res
+
+  for indices, _ in np.ndenumerate(first):
+    if dtype == float:
+      pres = checkFloat('', first[indices], second[indices], tol, update=False)
+    elif dtype == str:
+      pres = checkSame('', first[indices], second[indices], update=False)
+    else:
+      pres = False
+
+    if not pres:
+      print(f'checking array {comment} | entry "{indices}" does not match: {first[indices]} != {second[indices]}')
+      res = False
+
+  if update:
+    updateRes(comment, dtype, res, first, second, printComment=False)
+
+  return res
+
+
+######################################
+#            CONSTRUCTION            #
+######################################
+def createARMA(targets, P, Q, gaussianize):
+  """
+    Creates a TSA.ARMA instance
+    @ In, targets, list(str), names of targets
+    @ In, P, list(int), signal lags per target
+    @ In, Q, list(int), noise lags per target
+    @ In, gaussianize, bool, whether to gaussianize the signals
+    @ Out, arma, ARMA, ARMA instance
+    @ Out, settings, dict, settings for the ARMA
+  """
+  arma = ARMA()
+  attribs = {'target': ','.join(targets), 'seed': '42', 'gaussianize': str(gaussianize)}
+  xml = xmlUtils.newNode(arma.name, attrib=attribs)
+  xml.append(xmlUtils.newNode('P', text=','.join(str(p) for p in P)))
+  xml.append(xmlUtils.newNode('Q', text=','.join(str(q) for q in Q)))
+  inputSpec = arma.getInputSpecification()()
+  inputSpec.parseNode(xml)
+  settings = arma.handleInput(inputSpec)
+  settings = arma.setDefaults(settings)
+  return arma, settings
+
+def createSignals(pivot):
+  """
+    Creates ARMA-like signals for two targets
+    @ In, pivot, np.array, time-like values
+    @ Out, signals, np.array, signals shaped [time, targets]
+  """
+  rng = np.random.default_rng(42)
+  noise = rng.normal(size=(len(pivot), 2))
+  signals = np.zeros((len(pivot), 2))
+  for t in range(2, len(pivot)):
+    signals[t, 0] = 0.4 * signals[t-1, 0] + 0.2 * signals[t-2, 0] + noise[t, 0] + 0.3 * noise[t-1, 0]
+    signals[t, 1] = 1.0 - 0.3 * signals[t-1, 1] + noise[t, 1] + 0.2 * noise[t-1, 1]
+  return signals
+
+###################
+#      Tests      #
+###################
+import statsmodels.api
+
+targets = ['A', 'B']
+pivot = np.arange(500, dtype=float)
+signals = createSignals(pivot)
+
+for gaussianize in [False, True]:
+  # NOTE the lags and length are such that each history takes an even number of normal samples,
+  #   so that no value is left in the queue of the Box-Muller generator between the histories
+  arma, settings = createARMA(targets, [2, 1], [1, 1], gaussianize)
+  params = arma.fit(signals.copy(), pivot, targets, settings)
+
+  # the simulation matches the state space simulation of statsmodels for the same noise
+  for target in targets:
+    armaData = params[target]['arma']
+    randomUtils.randomSeed(42)
+    msrShocks, stateShocks, initialState = arma._generateNoise(armaData, len(pivot))
+    model = statsmodels.tsa.arima.model.ARIMA(np.zeros(len(pivot)), order=armaData['lags'], trend='c')
+    modelParams = np.r_[armaData['const'], armaData['ar'], armaData['ma'], armaData['var']]
+    expected = model.simulate(modelParams, len(pivot), measurement_shocks=msrShocks,
+                              state_shocks=stateShocks, initial_state=initialState)
+    simulated = arma._simulate(armaData, msrShocks, stateShocks, initialState[:, 0][np.newaxis, :])[0]
+    checkArray(f'simulation vs statsmodels, target {target}, gaussianize {gaussianize}', simulated, expected, float, tol=1e-8)
+
+  # several histories at once are the same as the ones generated one at a time
+  randomUtils.randomSeed(42)
+  many = arma.generateMany(params, pivot, settings, 3)
+  checkSame(f'generateMany shape, gaussianize {gaussianize}', many.shape, (3, len(pivot), len(targets)))
+  randomUtils.randomSeed(42)
+  for n in range(3):
+    single = arma.generate(params, pivot, settings)
+    checkArray(f'generateMany sample {n}, gaussianize {gaussianize}', many[n], single, float)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_tests.TSA.ARMAGeneration</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>TSA.ARMA</classesTested>
+    <description>
+       This test is a Unit Test for the generation of synthetic histories by the ARMA TimeSeriesAnalyzer,
+       checking the simulation against statsmodels and the generation of several histories at once.
+    </description>
+  </TestInfo>
+"""
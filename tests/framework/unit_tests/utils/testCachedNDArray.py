@@ -22,6 +22,7 @@ import warnings
 warnings.simplefilter('default',DeprecationWarning)
 
 import os,sys
+import xml.etree.ElementTree as ET
 import numpy as np
 
 # numpy with version 1.14.0 and upper will change the floating point type and print
@@ -32,6 +33,8 @@ if int(np.__version__.split('.')[1]) > 13:
 ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
 sys.path.append(ravenDir)
 from ravenframework.utils import cached_ndarray
+from ravenframework import MessageHandler
+from ravenframework import DataObjects
 print (cached_ndarray)
 
 
@@ -105,6 +108,87 @@ else:
   print('checking string representation does not match:\n'+msg,'\n!=\n'+right)
   results['fail']+=1
 
+#
+# columnar collector
+#
+def checkTrue(comment, value):
+  """
+    This method checks a boolean condition
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the condition
+    @ Out, None
+  """
+  if value:
+    results['pass'] += 1
+  else:
+    print('checking condition failed:', comment)
+    results['fail'] += 1
+
+# columns: float scalar, int scalar, string, history
+colArray = cached_ndarray.cColumnarArray(width=4, length=2)
+history = np.array([1.0, 2.0, 3.0])
+for i in range(5):
+  colArray.append([0.5 * i, i, 'rlz{}'.format(i), history * i])
+checkAnswer('columnar length', len(colArray), 5)
+checkAnswer('columnar width', colArray.width, 4)
+checkTrue('columnar capacity grown', colArray.capacity >= 5)
+checkTrue('columnar float column typed', colArray.getColumn(0).dtype == np.float64)
+checkTrue('columnar int column typed', colArray.getColumn(1).dtype == np.int64)
+checkTrue('columnar string column object', colArray.getColumn(2).dtype == object)
+checkTrue('columnar history block', colArray.getColumn(3).shape == (5, 3))
+checkAnswer('columnar entry', colArray[3, 0], 1.5)
+checkAnswer('columnar history entry', colArray[2, 3][1], 4.0)
+checkTrue('columnar string entry', colArray[-1, 2] == 'rlz4')
+row = colArray[1]
+checkTrue('columnar row', row[0] == 0.5 and row[1] == 1 and row[2] == 'rlz1' and np.allclose(row[3], history))
+# stored values are protected against changes of the appended ones
+history[0] = 100.0
+checkAnswer('columnar copy on append', colArray[1, 3][0], 1.0)
+# histories of different lengths switch the storage to object
+colArray.append([9.0, 9, 'rlz5', np.array([1.0])])
+checkTrue('columnar ragged history object', colArray.getColumn(3).dtype == object)
+checkAnswer('columnar ragged history old entry', colArray[4, 3][2], 12.0)
+checkAnswer('columnar ragged history new entry', len(colArray[5, 3]), 1)
+# non-integer in integer column
+colArray[0, 1] = 'zero'
+checkTrue('columnar mixed column object', colArray.getColumn(1).dtype == object)
+checkTrue('columnar mixed column entry', colArray[0, 1] == 'zero' and colArray[2, 1] == 2)
+# entities
+colArray.addEntity([True] * len(colArray))
+checkTrue('columnar add entity', colArray.width == 5 and colArray.getColumn(4).dtype == bool)
+colArray.removeEntity(2)
+checkTrue('columnar remove entity', colArray.width == 4 and colArray[3, 2][1] == 6.0)
+checkTrue('columnar data', colArray.getData().shape == (6, 4))
+# bulk append by column
+colArray.extend([np.array([10.0, 11.0]), np.array([10, 11]), np.array([np.zeros(2), np.ones(3)], dtype=object), np.array([False, True])])
+checkAnswer('columnar extend length', len(colArray), 8)
+checkAnswer('columnar extend entry', colArray[7, 0], 11.0)
+checkTrue('columnar extend float column typed', colArray.getColumn(0).dtype == np.float64)
+checkAnswer('columnar extend object entry', len(colArray[7, 2]), 3)
+blockArray = cached_ndarray.cColumnarArray(width=1)
+blockArray.extend([np.arange(6.0).reshape(3, 2)])
+checkTrue('columnar extend block', blockArray.getColumn(0).shape == (3, 2) and blockArray[2, 0][1] == 5.0)
+
+# the data objects wrap the typed columns of the collector without copying them
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+xml = ET.Element('PointSet', {'name':'columns'})
+ET.SubElement(xml, 'Input').text = 'a,label'
+ET.SubElement(xml, 'Output').text = 'x'
+data = DataObjects.PointSet()
+data.messageHandler = mh
+data._readMoreXML(xml)
+for i in range(4):
+  data.addRealization({'a':np.array([0.5 * i]), 'label':np.array(['rlz{}'.format(i)]), 'x':np.array([2.0 * i])})
+columns = dict((var, data._collector.getColumn(v)) for v, var in enumerate(data._orderedVars))
+checkTrue('columnar data object float column typed', columns['x'].dtype == np.float64)
+checkTrue('columnar data object string column object', columns['label'].dtype == object)
+dataset = data._convertToXrDataset()
+checkTrue('columnar data object typed column not copied', np.shares_memory(dataset['x'].values, columns['x']))
+checkTrue('columnar data object input column not copied', np.shares_memory(dataset['a'].values, columns['a']))
+checkTrue('columnar data object object column copied', not np.shares_memory(dataset['label'].values, columns['label']))
+checkTrue('columnar data object values', list(dataset['label'].values) == ['rlz0', 'rlz1', 'rlz2', 'rlz3'] and dataset['x'].values[3] == 6.0)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -121,6 +205,7 @@ sys.exit(results["fail"])
     <revisions>
       <revision author="talbpaul" date="2016-11-08">Relocated utils tests</revision>
       <revision author="alfoa" date="2017-01-21">Adding this test description.</revision>
+      <revision author="agent" date="2026-10-18">Added tests of the columnar collector cColumnarArray.</revision>
     </revisions>
   </TestInfo>
 """
@@ -0,0 +1,93 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the valueIndex module
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os,sys
+import numpy as np
+
+ravenDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir))
+sys.path.append(ravenDir)
+from ravenframework.utils import valueIndex
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment, value, expected):
+  """
+    This method compares two integer arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the array to check
+    @ In, expected, list, the expected entries
+    @ Out, None
+  """
+  if list(value) == list(expected):
+    results['pass'] += 1
+  else:
+    print('checking array', comment, list(value), '!=', list(expected))
+    results['fail'] += 1
+
+# numeric values, in several chunks
+index = valueIndex.ValueIndex()
+index.extend(np.array([0.5, 1.0, 1.5, 1.0]))
+index.extend(np.array([2, 1]))
+checkArray('size', [index.size], [6])
+checkArray('exact numeric', index.findNumeric(1.0, 0.0), [1, 3, 5])
+checkArray('window numeric', index.findNumeric(1.2, 0.31), [1, 2, 3, 5])
+checkArray('no numeric', index.findNumeric(10.0, 1.0), [])
+
+# non-finite values are always candidates
+index.extend(np.array([np.nan, np.inf]))
+checkArray('non-finite numeric', index.findNumeric(10.0, 1.0), [6, 7])
+
+# mixed numeric and non-numeric values
+index.extend(np.array(['a', 3.0, 'b', 'a'], dtype=object))
+checkArray('exact string', index.findExact('a'), [8, 11])
+checkArray('missing string', index.findExact('c'), [])
+checkArray('numeric among strings', index.findNumeric(3.0, 0.0), [6, 7, 9])
+
+# values merged into the sorted storage
+index = valueIndex.ValueIndex()
+values = np.random.RandomState(42).randint(0, 100, size=3*valueIndex.ValueIndex.bufferSize + 7).astype(float)
+for start in range(0, len(values), 100):
+  index.extend(values[start:start+100])
+for find in [0.0, 42.0, 99.0]:
+  checkArray('merged {}'.format(find), index.findNumeric(find, 0.1), np.where(values == find)[0])
+checkArray('merged window', index.findNumeric(50.0, 2.0), np.where(abs(values - 50.0) <= 2.0)[0])
+
+# sorted runs, each at least twice as long as the following one
+index = valueIndex.ValueIndex()
+values = np.random.RandomState(7).rand(40*valueIndex.ValueIndex.bufferSize)
+for start in range(0, len(values), 10):
+  index.extend(values[start:start+10])
+lengths = [len(runValues) for runValues, _ in index._runs]
+checkArray('runs halve', [all(lengths[r] >= 2 * lengths[r+1] for r in range(len(lengths) - 1))], [True])
+checkArray('runs sorted', [all((np.diff(runValues) >= 0).all() for runValues, _ in index._runs)], [True])
+checkArray('runs window', index.findNumeric(0.5, 0.001), np.where(abs(values - 0.5) <= 0.001)[0])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.valueIndex</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>utils.valueIndex</classesTested>
+    <description>
+       This test performs Unit Tests for the valueIndex module, used by the DataObjects to find
+       realizations by value.
+    </description>
+  </TestInfo>
+"""